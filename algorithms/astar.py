@@ -0,0 +1,219 @@
+"""
+A* Shortest Path Search
+Dijkstra guided by a heuristic lower bound on the remaining distance, so
+point-to-point queries settle only vertices that lie toward the target.
+Time Complexity: O((V + E) log V) worst case, far less with a good heuristic
+Space Complexity: O(V)
+"""
+
+import heapq
+import math
+
+from dijkstra import dijkstra_search
+from graph_csr import CSRGraph, transpose
+
+def astar(graph, start, end, heuristic):
+    """
+    Finds shortest path and distance from start to end with A*.
+    The heuristic must be consistent (h(u) <= weight(u, v) + h(v) and
+    h(end) == 0) for the result to be a shortest path.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        start: Starting vertex
+        end: Ending vertex
+        heuristic: Function mapping a vertex to a lower bound on its
+            distance to end
+    
+    Returns:
+        Tuple of (shortest_distance, path), with (infinity, None) if end
+        is unreachable
+    """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        source, target = graph.vertex_id(start), graph.vertex_id(end)
+        edges = graph.weighted_edges
+        estimate = lambda vertex: heuristic(labels[vertex])
+    else:
+        labels = None
+        source, target = start, end
+        edges = lambda vertex: graph.get(vertex, [])
+        estimate = heuristic
+    
+    distances = {source: 0}
+    previous = {source: None}
+    closed = set()
+    
+    # Priority queue: (distance so far + estimate, vertex)
+    pq = [(estimate(source), source)]
+    
+    while pq:
+        _, current_vertex = heapq.heappop(pq)
+        
+        if current_vertex in closed:
+            continue
+        if current_vertex == target:
+            break
+        
+        closed.add(current_vertex)
+        current_distance = distances[current_vertex]
+        
+        for neighbor, weight in edges(current_vertex):
+            distance = current_distance + weight
+            
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                heapq.heappush(pq, (distance + estimate(neighbor), neighbor))
+    
+    if target not in distances:
+        return float('infinity'), None
+    
+    path = []
+    vertex = target
+    while vertex is not None:
+        path.append(vertex if labels is None else labels[vertex])
+        vertex = previous[vertex]
+    path.reverse()
+    
+    return distances[target], path
+
+
+def euclidean_heuristic(coordinates, end, scale=1):
+    """
+    Builds a straight-line distance heuristic for geometric graphs.
+    Admissible when every edge weight is at least scale times the
+    Euclidean length of the edge.
+    
+    Args:
+        coordinates: Dictionary mapping each vertex to a point tuple
+        end: Target vertex
+        scale: Minimum weight per unit of Euclidean length
+    
+    Returns:
+        Function mapping a vertex to its estimated distance to end
+    """
+    goal = coordinates[end]
+    return lambda vertex: scale * math.dist(coordinates[vertex], goal)
+
+
+def farthest_landmarks(graph, count, start, reverse_graph=None):
+    """
+    Picks landmarks spread across the graph by farthest-point selection.
+    Each new landmark is the reachable vertex farthest from all landmarks
+    chosen so far.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        count: Number of landmarks to pick
+        start: Vertex used to seed the selection
+        reverse_graph: Graph with every edge reversed; built from graph
+            when not given
+    
+    Returns:
+        List of landmark vertices
+    """
+    if reverse_graph is None:
+        reverse_graph = transpose(graph, weighted=True)
+    landmarks = []
+    seeds = [start]
+    
+    while len(landmarks) < count:
+        distances, _ = dijkstra_search(graph, seeds)
+        backward, _ = dijkstra_search(reverse_graph, seeds)
+        for vertex, distance in backward.items():
+            distances[vertex] = min(distance, distances.get(vertex, distance))
+        
+        candidates = [v for v in distances if v not in landmarks]
+        if not candidates:
+            break
+        
+        farthest = max(candidates, key=distances.get)
+        landmarks.append(farthest)
+        seeds = landmarks
+    
+    return landmarks
+
+
+def build_landmarks(graph, landmarks, reverse_graph=None):
+    """
+    Precomputes landmark distance tables for ALT heuristics.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        landmarks: List of landmark vertices
+        reverse_graph: Graph with every edge reversed, whose searches give
+            the distances to each landmark; built from graph when not given
+    
+    Returns:
+        List of (from_landmark, to_landmark) distance dictionaries, one
+        pair per landmark
+    """
+    if reverse_graph is None:
+        reverse_graph = transpose(graph, weighted=True)
+    
+    tables = []
+    for landmark in landmarks:
+        from_landmark, _ = dijkstra_search(graph, [landmark])
+        to_landmark, _ = dijkstra_search(reverse_graph, [landmark])
+        tables.append((from_landmark, to_landmark))
+    
+    return tables
+
+
+def landmark_heuristic(tables, end):
+    """
+    Builds an ALT (A*, landmarks, triangle inequality) heuristic.
+    For each landmark L: d(v, end) >= d(L, end) - d(L, v) and
+    d(v, end) >= d(v, L) - d(end, L); the largest bound is used.
+    
+    Args:
+        tables: Output of build_landmarks
+        end: Target vertex
+    
+    Returns:
+        Function mapping a vertex to its estimated distance to end
+    """
+    bounds = [
+        (from_landmark, to_landmark, from_landmark.get(end), to_landmark.get(end))
+        for from_landmark, to_landmark in tables
+    ]
+    
+    def heuristic(vertex):
+        best = 0
+        for from_landmark, to_landmark, landmark_to_end, end_to_landmark in bounds:
+            if landmark_to_end is not None and vertex in from_landmark:
+                best = max(best, landmark_to_end - from_landmark[vertex])
+            if end_to_landmark is not None and vertex in to_landmark:
+                best = max(best, to_landmark[vertex] - end_to_landmark)
+        return best
+    
+    return heuristic
+
+
+if __name__ == "__main__":
+    # Test A* on a small road map with coordinates
+    coordinates = {
+        'A': (0, 0), 'B': (2, 1), 'C': (1, 3),
+        'D': (4, 2), 'E': (5, 4), 'F': (3, 5)
+    }
+    graph = {
+        'A': [('B', 3), ('C', 4)],
+        'B': [('A', 3), ('D', 3)],
+        'C': [('A', 4), ('F', 3)],
+        'D': [('B', 3), ('E', 3)],
+        'E': [('D', 3), ('F', 3)],
+        'F': [('C', 3), ('E', 3)]
+    }
+    
+    print("Graph (weighted):")
+    for vertex, edges in graph.items():
+        print(f"  {vertex}: {edges}")
+    
+    distance, path = astar(graph, 'A', 'E', euclidean_heuristic(coordinates, 'E'))
+    print(f"\nA* (Euclidean) from 'A' to 'E': {distance}, {' -> '.join(path)}")
+    
+    landmarks = farthest_landmarks(graph, 2, 'A')
+    tables = build_landmarks(graph, landmarks)
+    distance, path = astar(graph, 'A', 'E', landmark_heuristic(tables, 'E'))
+    print(f"A* (landmarks {landmarks}) from 'A' to 'E': {distance}, {' -> '.join(path)}")
@@ -4,19 +4,39 @@ Time Complexity: O(V + E) where V is vertices and E is edges
 Space Complexity: O(V)
 """
 
+from array import array
 from collections import deque
 
+from graph_csr import CSRGraph, transpose
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; level-synchronous BFS falls back to Python
+    np = None
+
+# Direction-optimizing switch thresholds (Beamer et al.): go bottom-up when
+# frontier edges exceed unvisited edges / ALPHA, back when the frontier
+# shrinks below V / BETA
+BFS_ALPHA = 14
+BFS_BETA = 24
+
+# Sources per multi-source BFS batch, one bit each in a 64-bit mask
+MS_BFS_WIDTH = 64
+
 def bfs(graph, start):
     """
     Performs breadth-first search on a graph.
     
     Args:
-        graph: Dictionary representing adjacency list
+        graph: Dictionary representing adjacency list, or a CSRGraph
         start: Starting vertex
     
     Returns:
         List of vertices in BFS traversal order
     """
+    if isinstance(graph, CSRGraph):
+        return _bfs_csr(graph, start)
+    
     visited = set()
     queue = deque([start])
     visited.add(start)
@@ -35,9 +55,246 @@ def bfs(graph, start):
     return result
 
 
+def _bfs_csr(graph, start):
+    """BFS over a CSRGraph using a visited bytearray indexed by vertex id."""
+    offsets, targets = graph.offsets, graph.targets
+    source = graph.vertex_id(start)
+    visited = bytearray(graph.num_vertices)
+    visited[source] = 1
+    queue = deque([source])
+    order = []
+    
+    while queue:
+        vertex = queue.popleft()
+        order.append(vertex)
+        
+        for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+    
+    labels = graph.labels
+    return [labels[vertex] for vertex in order]
+
+
+def bfs_level_synchronous(graph, start, direction_optimizing=True, reverse_graph=None):
+    """
+    Breadth-first search that expands a whole frontier per step.
+    With NumPy, each level is a vectorized gather over the CSR edge arrays.
+    When direction_optimizing is set, large frontiers switch to bottom-up
+    expansion, where unvisited vertices look for a parent in the frontier.
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    
+    Args:
+        graph: CSRGraph
+        start: Starting vertex label
+        direction_optimizing: Whether to allow bottom-up levels
+        reverse_graph: In-edge CSRGraph for bottom-up levels; built with
+            graph.reverse() when needed if not given
+    
+    Returns:
+        Tuple of (distances, parents) indexed by vertex id, with -1 for
+        unreached vertices and for the parent of start
+    """
+    source = graph.vertex_id(start)
+    
+    if np is None:
+        return _bfs_levels_python(graph, source)
+    
+    n = graph.num_vertices
+    offsets, targets, _ = graph.as_numpy()
+    out_degree = np.diff(offsets)
+    distances = np.full(n, -1, dtype=np.int64)
+    parents = np.full(n, -1, dtype=np.int64)
+    distances[source] = 0
+    
+    frontier = np.array([source], dtype=np.int64)
+    unvisited_edges = int(out_degree.sum()) - int(out_degree[source])
+    bottom_up = False
+    level = 0
+    
+    while frontier.size:
+        if direction_optimizing:
+            frontier_edges = int(out_degree[frontier].sum())
+            if not bottom_up and frontier_edges > unvisited_edges / BFS_ALPHA:
+                bottom_up = True
+            elif bottom_up and frontier.size < n / BFS_BETA:
+                bottom_up = False
+        
+        if bottom_up:
+            if reverse_graph is None:
+                reverse_graph = graph.reverse()
+            rev_offsets, rev_targets, _ = reverse_graph.as_numpy()
+            
+            # Every unvisited vertex checks its in-edges for a frontier parent
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            children, edges = _gather_edges(rev_offsets, np.flatnonzero(distances == -1))
+            sources = rev_targets[edges]
+            hit = in_frontier[sources]
+            children, sources = children[hit], sources[hit]
+        else:
+            sources, edges = _gather_edges(offsets, frontier)
+            children = targets[edges]
+            new = distances[children] == -1
+            children, sources = children[new], sources[new]
+        
+        # Keep one parent per newly discovered vertex
+        children, first = np.unique(children, return_index=True)
+        level += 1
+        distances[children] = level
+        parents[children] = sources[first]
+        unvisited_edges -= int(out_degree[children].sum())
+        frontier = children
+    
+    return distances, parents
+
+
+def _gather_edges(offsets, vertices):
+    """
+    Lists the edge positions of many vertices at once.
+    
+    Returns:
+        Tuple of (owners, edges) where edges[i] is an edge position of
+        vertex owners[i]
+    """
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    total = int(counts.sum())
+    
+    # Positions are arange(total) shifted per vertex to start at its offset
+    shift = starts - (np.cumsum(counts) - counts)
+    edges = np.arange(total, dtype=np.int64) + np.repeat(shift, counts)
+    return np.repeat(vertices, counts), edges
+
+
+def _bfs_levels_python(graph, source):
+    """Level-synchronous BFS without NumPy, returning (distances, parents) arrays."""
+    offsets, targets = graph.offsets, graph.targets
+    distances = array('q', [-1]) * graph.num_vertices
+    parents = array('q', [-1]) * graph.num_vertices
+    distances[source] = 0
+    frontier = [source]
+    level = 0
+    
+    while frontier:
+        level += 1
+        next_frontier = []
+        for vertex in frontier:
+            for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                if distances[neighbor] == -1:
+                    distances[neighbor] = level
+                    parents[neighbor] = vertex
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    
+    return distances, parents
+
+
+def multi_source_bfs(graph, sources, max_depth=None):
+    """
+    Computes hop distances from many sources in shared traversals (MS-BFS).
+    Sources are processed in batches of MS_BFS_WIDTH. Every vertex carries a
+    bitmask of the searches in the batch that have reached it, so a single
+    scan of its edges advances all of those searches at once.
+    Time Complexity: O((V + E) * S / 64) mask operations
+    Space Complexity: O(S * V) for the result
+    
+    Args:
+        graph: CSRGraph
+        sources: List of source vertex labels
+        max_depth: Optional hop limit; vertices farther away count as unreached
+    
+    Returns:
+        Distance rows aligned with sources and indexed by vertex id, with -1
+        for unreached vertices: a (len(sources), V) int64 NumPy array if
+        NumPy is installed, otherwise a list of array('q')
+    """
+    source_ids = [graph.vertex_id(source) for source in sources]
+    search = _ms_bfs_batch if np is not None else _ms_bfs_batch_python
+    batches = [
+        search(graph, source_ids[i:i + MS_BFS_WIDTH], max_depth)
+        for i in range(0, len(source_ids), MS_BFS_WIDTH)
+    ]
+    
+    if np is not None:
+        return np.concatenate(batches) if batches else np.zeros((0, graph.num_vertices), dtype=np.int64)
+    return [row for batch in batches for row in batch]
+
+
+def _ms_bfs_batch(graph, source_ids, max_depth):
+    """One MS-BFS batch of up to 64 sources with uint64 masks and vectorized levels."""
+    n = graph.num_vertices
+    offsets, targets, _ = graph.as_numpy()
+    distances = np.full((len(source_ids), n), -1, dtype=np.int64)
+    seen = np.zeros(n, dtype=np.uint64)
+    for bit, source in enumerate(source_ids):
+        seen[source] |= np.uint64(1 << bit)
+        distances[bit, source] = 0
+    
+    frontier = seen.copy()
+    active = np.flatnonzero(frontier)
+    level = 0
+    
+    while active.size and (max_depth is None or level < max_depth):
+        # OR each frontier mask into its out-neighbors, then drop searches that were already there
+        owners, edges = _gather_edges(offsets, active)
+        next_frontier = np.zeros(n, dtype=np.uint64)
+        np.bitwise_or.at(next_frontier, targets[edges], frontier[owners])
+        next_frontier &= ~seen
+        seen |= next_frontier
+        active = np.flatnonzero(next_frontier)
+        level += 1
+        
+        # Unpack the new bits into (vertex, search) pairs
+        masks = next_frontier[active].astype('<u8').view(np.uint8).reshape(-1, 8)
+        rows, bits = np.nonzero(np.unpackbits(masks, axis=1, bitorder='little'))
+        distances[bits, active[rows]] = level
+        frontier = next_frontier
+    
+    return distances
+
+
+def _ms_bfs_batch_python(graph, source_ids, max_depth):
+    """One MS-BFS batch without NumPy, using Python ints as masks."""
+    offsets, targets = graph.offsets, graph.targets
+    n = graph.num_vertices
+    distances = [array('q', [-1]) * n for _ in source_ids]
+    seen = [0] * n
+    frontier = {}
+    for bit, source in enumerate(source_ids):
+        seen[source] |= 1 << bit
+        frontier[source] = seen[source]
+        distances[bit][source] = 0
+    level = 0
+    
+    while frontier and (max_depth is None or level < max_depth):
+        level += 1
+        next_frontier = {}
+        for vertex, mask in frontier.items():
+            for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                new = mask & ~seen[neighbor]
+                if new:
+                    seen[neighbor] |= new
+                    next_frontier[neighbor] = next_frontier.get(neighbor, 0) | new
+        
+        # Record the level for each search bit that reached a vertex
+        for vertex, mask in next_frontier.items():
+            while mask:
+                low = mask & -mask
+                distances[low.bit_length() - 1][vertex] = level
+                mask ^= low
+        frontier = next_frontier
+    
+    return distances
+
+
 def bfs_shortest_path(graph, start, end):
     """
     Finds shortest path between two vertices using BFS.
+    Records one predecessor per discovered vertex and rebuilds the path
+    once at the end, instead of copying a path for every queued vertex.
     
     Args:
         graph: Dictionary representing adjacency list
@@ -50,25 +307,141 @@ def bfs_shortest_path(graph, start, end):
     if start == end:
         return [start]
     
-    visited = {start}
-    queue = deque([(start, [start])])
+    parents = {start: None}
+    queue = deque([start])
     
     while queue:
-        vertex, path = queue.popleft()
+        vertex = queue.popleft()
         
         for neighbor in graph.get(vertex, []):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
+            if neighbor not in parents:
+                parents[neighbor] = vertex
                 
                 if neighbor == end:
-                    return new_path
+                    return _reconstruct_path(parents, end)
                 
-                queue.append((neighbor, new_path))
+                queue.append(neighbor)
     
     return None
 
 
+def bfs_shortest_paths(graph, start, targets):
+    """
+    Finds shortest paths from start to many targets in a single traversal.
+    Stops as soon as every reachable target has been discovered.
+    
+    Args:
+        graph: Dictionary representing adjacency list
+        start: Starting vertex
+        targets: Iterable of destination vertices
+    
+    Returns:
+        Dictionary mapping each target to its shortest path, or None if
+        the target is unreachable
+    """
+    targets = list(targets)
+    remaining = set(targets)
+    parents = {start: None}
+    remaining.discard(start)
+    queue = deque([start])
+    
+    while queue and remaining:
+        vertex = queue.popleft()
+        
+        for neighbor in graph.get(vertex, []):
+            if neighbor not in parents:
+                parents[neighbor] = vertex
+                remaining.discard(neighbor)
+                queue.append(neighbor)
+    
+    return {
+        target: _reconstruct_path(parents, target) if target in parents else None
+        for target in targets
+    }
+
+
+def bidirectional_bfs_path(graph, start, end, reverse_graph=None):
+    """
+    Finds shortest path by searching from both endpoints until they meet.
+    Each step expands one full level of whichever frontier is smaller, so
+    roughly 2 * b^(d/2) vertices are visited instead of b^d.
+    
+    Args:
+        graph: Dictionary representing adjacency list
+        start: Starting vertex
+        end: Ending vertex
+        reverse_graph: Adjacency list with every edge reversed, used for the
+            search from end; built from graph when not given, so pass it
+            when running many queries on one graph
+    
+    Returns:
+        Shortest path as list of vertices, or None if no path exists
+    """
+    if start == end:
+        return [start]
+    if reverse_graph is None:
+        reverse_graph = transpose(graph, weighted=False)
+    
+    parents_fwd, depth_fwd = {start: None}, {start: 0}
+    parents_bwd, depth_bwd = {end: None}, {end: 0}
+    frontier_fwd, frontier_bwd = [start], [end]
+    
+    while frontier_fwd and frontier_bwd:
+        if len(frontier_fwd) <= len(frontier_bwd):
+            frontier_fwd, meet = _expand_level(graph, frontier_fwd, parents_fwd, depth_fwd, depth_bwd)
+        else:
+            frontier_bwd, meet = _expand_level(reverse_graph, frontier_bwd, parents_bwd, depth_bwd, depth_fwd)
+        
+        if meet is not None:
+            # Join start -> meet with meet -> end
+            path = _reconstruct_path(parents_fwd, meet)
+            vertex = parents_bwd[meet]
+            while vertex is not None:
+                path.append(vertex)
+                vertex = parents_bwd[vertex]
+            return path
+    
+    return None
+
+
+def _expand_level(graph, frontier, parents, depth, other_depth):
+    """
+    Expands one BFS level and reports the best vertex shared with the other search.
+    
+    Returns:
+        Tuple of (next_frontier, meeting_vertex or None)
+    """
+    next_frontier = []
+    meet = None
+    best = float('infinity')
+    
+    for vertex in frontier:
+        next_depth = depth[vertex] + 1
+        for neighbor in graph.get(vertex, []):
+            if neighbor not in parents:
+                parents[neighbor] = vertex
+                depth[neighbor] = next_depth
+                next_frontier.append(neighbor)
+                
+                # Keep the shortest join seen in this level
+                if neighbor in other_depth and next_depth + other_depth[neighbor] < best:
+                    best = next_depth + other_depth[neighbor]
+                    meet = neighbor
+    
+    return next_frontier, meet
+
+
+def _reconstruct_path(parents, end):
+    """Walks predecessor links back from end and returns the path from the root."""
+    path = []
+    vertex = end
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parents[vertex]
+    path.reverse()
+    return path
+
+
 if __name__ == "__main__":
     # Test BFS algorithm
     graph = {
@@ -86,3 +459,24 @@ if __name__ == "__main__":
     
     print("\nShortest path from 'A' to 'F':")
     print(bfs_shortest_path(graph, 'A', 'F'))
+    
+    print("\nBidirectional shortest path from 'D' to 'F':")
+    print(bidirectional_bfs_path(graph, 'D', 'F'))
+    
+    print("\nShortest paths from 'A' to 'D', 'E' and 'F' in one traversal:")
+    print(bfs_shortest_paths(graph, 'A', ['D', 'E', 'F']))
+    
+    csr = CSRGraph.from_dict(graph)
+    print("\nBFS traversal on the CSR form starting from 'A':")
+    print(bfs(csr, 'A'))
+    
+    distances, parents = bfs_level_synchronous(csr, 'A')
+    print("\nLevel-synchronous BFS distances and parents from 'A':")
+    for vertex_id, label in enumerate(csr.labels):
+        parent = csr.labels[parents[vertex_id]] if parents[vertex_id] != -1 else None
+        print(f"  {label}: distance={distances[vertex_id]}, parent={parent}")
+    
+    rows = multi_source_bfs(csr, ['A', 'D', 'F'], max_depth=2)
+    print("\nMulti-source BFS hop distances (max depth 2, -1 = beyond):")
+    for source, row in zip(['A', 'D', 'F'], rows):
+        print(f"  from {source}: {dict(zip(csr.labels, (int(d) for d in row)))}")
@@ -4,18 +4,105 @@ Time Complexity: O(log n)
 Space Complexity: O(1) for iterative, O(log n) for recursive
 """
 
-def binary_search(arr, target):
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch results fall back to array('q')
+    np = None
+
+from numpy_backend import search_sorted, search_sorted_many
+
+class RecordView:
+    """
+    Read-only sequence over fixed-size binary records in a buffer, such as
+    a memory-mapped file of sorted structs. Records are decoded one at a
+    time when indexed, so searching the view reads only the probed
+    records. Keys of a single native type are better viewed with
+    memoryview(buffer).cast(typecode), which NumPy can search directly.
+    
+    Attributes:
+        buffer: Object supporting the buffer protocol (bytes, mmap, ...)
+        struct: struct.Struct for one record
+    """
+    
+    def __init__(self, buffer, fmt):
+        """
+        Args:
+            buffer: Buffer holding whole records back to back
+            fmt: struct format of one record; a single-field format
+                decodes records to that value instead of a 1-tuple
+        
+        Raises:
+            ValueError: If the buffer ends with a partial record
+        """
+        self.buffer = buffer
+        self.struct = struct.Struct(fmt)
+        if len(buffer) % self.struct.size:
+            raise ValueError(f"Truncated record: {len(buffer)} bytes is not a multiple of {self.struct.size}")
+        self._single = len(self.struct.unpack(bytes(self.struct.size))) == 1
+    
+    def __len__(self):
+        return len(self.buffer) // self.struct.size
+    
+    def __getitem__(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("Record index out of range")
+        record = self.struct.unpack_from(self.buffer, i * self.struct.size)
+        return record[0] if self._single else record
+
+
+def binary_search(arr, target, lo=0, hi=None, key=None, mode='any'):
     """
     Searches for a target value in a sorted array using binary search.
+    Large numeric arrays (NumPy, array.array or memoryview) are searched
+    with NumPy's searchsorted.
     
     Args:
-        arr: Sorted list of comparable elements
-        target: Element to search for
+        arr: Sorted sequence of comparable elements, e.g. a list, an
+            array, a memoryview or a RecordView of a memory-mapped file
+        target: Element to search for, or the key to search for if key
+            is given
+        lo: First index of the range to search
+        hi: End of the range to search (defaults to len(arr))
+        key: Optional function of one element giving the value arr is
+            sorted by; it is called only on the elements probed
+        mode: 'any' for whichever equal element the search meets first,
+            'first' for the leftmost match or 'last' for the rightmost
     
     Returns:
         Index of target if found, -1 otherwise
+    
+    Raises:
+        ValueError: If mode is unknown
     """
-    left, right = 0, len(arr) - 1
+    if mode not in ('any', 'first', 'last'):
+        raise ValueError(f"Unknown mode: {mode!r}")
+    if hi is None:
+        hi = len(arr)
+    if key is None:
+        result = search_sorted(arr, target, lo, hi, last=mode == 'last')
+        if result is not None:
+            return result
+    
+    if key is not None or mode != 'any':
+        if mode == 'last':
+            i = bisect_right(arr, target, lo, hi, key=key) - 1
+            found = i >= lo
+        else:
+            i = bisect_left(arr, target, lo, hi, key=key)
+            found = i < hi
+        if not found:
+            return -1
+        value = arr[i] if key is None else key(arr[i])
+        return i if value == target else -1
+    
+    left, right = lo, hi - 1
     
     while left <= right:
         mid = left + (right - left) // 2
@@ -38,7 +125,9 @@ def binary_search(arr, target):
 
 def binary_search_recursive(arr, target, left, right):
     """
-    Recursive implementation of binary search.
+    Recursive implementation of binary search. binary_search(arr, target,
+    left, right + 1) searches the same range without recursion and also
+    takes key and mode.
     
     Args:
         arr: Sorted list of comparable elements
@@ -62,6 +151,61 @@ def binary_search_recursive(arr, target, left, right):
         return binary_search_recursive(arr, target, left, mid - 1)
 
 
+def binary_search_many(arr, targets, mode='find', key=None):
+    """
+    Searches a sorted array for many targets in one pass. The targets are
+    visited in sorted order, so each search starts where the previous one
+    ended; numeric data goes to NumPy's searchsorted instead.
+    
+    Args:
+        arr: Sorted list of comparable elements
+        targets: Iterable of elements (or keys, if key is given) to
+            search for
+        mode: 'find' for the index of each target (its first occurrence)
+            or -1, 'left' or 'right' for the insertion points given by
+            bisect_left or bisect_right, or 'range' for both, bounding
+            the run of elements equal to each target
+        key: Optional function of one element giving the value arr is
+            sorted by, called only on the elements probed
+    
+    Returns:
+        Positions aligned with targets, as a NumPy int64 array when NumPy
+        is installed and an array('q') otherwise; for 'range', a tuple
+        (starts, ends) of two such arrays
+    
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in ('find', 'left', 'right', 'range'):
+        raise ValueError(f"Unknown mode: {mode!r}")
+    if not isinstance(targets, (list, tuple)) and not (np is not None and isinstance(targets, np.ndarray)):
+        targets = list(targets)
+    
+    if key is None:
+        result = search_sorted_many(arr, targets, mode)
+        if result is not None:
+            return result
+    
+    n, m = len(arr), len(targets)
+    positions = array('q', bytes(8 * m))
+    ends = array('q', bytes(8 * m)) if mode == 'range' else None
+    bisect = bisect_right if mode == 'right' else bisect_left
+    check = mode == 'find'
+    lo = 0
+    for i in sorted(range(m), key=targets.__getitem__):
+        target = targets[i]
+        lo = positions[i] = bisect(arr, target, lo, key=key)
+        if ends is not None:
+            ends[i] = bisect_right(arr, target, lo, key=key)
+        elif check and (lo == n or (arr[lo] if key is None else key(arr[lo])) != target):
+            positions[i] = -1
+    
+    if np is not None:
+        positions = np.frombuffer(positions, dtype=np.int64)
+        ends = None if ends is None else np.frombuffer(ends, dtype=np.int64)
+    return (positions, ends) if mode == 'range' else positions
+
+
 if __name__ == "__main__":
     # Test the binary search algorithm
     test_array = [11, 12, 22, 25, 34, 64, 90]
@@ -79,3 +223,28 @@ if __name__ == "__main__":
     # Test recursive version
     index_recursive = binary_search_recursive(test_array, target, 0, len(test_array) - 1)
     print(f"Recursive search result: {index_recursive}")
+    
+    # Search for many targets at once
+    with_duplicates = [1, 3, 3, 3, 5, 8, 8, 13]
+    targets = [8, 3, 4, 13, 0]
+    print(f"\nSorted array: {with_duplicates}, targets: {targets}")
+    print(f"Indices: {binary_search_many(with_duplicates, targets).tolist()}")
+    starts, ends = binary_search_many(with_duplicates, targets, mode='range')
+    print(f"Equal ranges: {list(zip(starts.tolist(), ends.tolist()))}")
+    print(f"First and last 3: {binary_search(with_duplicates, 3, mode='first')}, "
+          f"{binary_search(with_duplicates, 3, mode='last')}")
+    
+    # Search a memory-mapped file of (id, score) records sorted by score
+    import mmap
+    import tempfile
+    from operator import itemgetter
+    
+    records = sorted(((i, (i * 37) % 11 / 2) for i in range(20)), key=itemgetter(1))
+    with tempfile.TemporaryFile() as f:
+        f.write(b''.join(struct.pack('=qd', *record) for record in records))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = RecordView(mapped, '=qd')
+            first = binary_search(view, 2.5, key=itemgetter(1), mode='first')
+            last = binary_search(view, 2.5, key=itemgetter(1), mode='last')
+            print(f"\nRecords with score 2.5: {[view[i] for i in range(first, last + 1)]}")
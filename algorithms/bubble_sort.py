@@ -4,16 +4,34 @@ Time Complexity: O(n^2) in worst case, O(n) in best case
 Space Complexity: O(1)
 """
 
-def bubble_sort(arr):
+from introsort import introsort
+from numpy_backend import sort_in_place
+
+def bubble_sort(arr, engine='auto'):
     """
     Sorts an array using bubble sort algorithm.
     
     Args:
         arr: List of comparable elements
+        engine: 'auto' (a vectorized NumPy sort for numeric data when
+            NumPy is installed, otherwise 'bubble'), 'bubble', or
+            'introsort' to sort with the O(n log n) hybrid engine instead
     
     Returns:
         Sorted list in ascending order
+    
+    Raises:
+        ValueError: If engine is unknown
     """
+    if engine == 'auto':
+        if sort_in_place(arr):
+            return arr
+        engine = 'bubble'
+    if engine == 'introsort':
+        return introsort(arr)
+    if engine != 'bubble':
+        raise ValueError(f"Unknown engine: {engine!r}")
+    
     n = len(arr)
     
     # Traverse through all array elements
@@ -41,3 +59,4 @@ if __name__ == "__main__":
     print(f"Original array: {test_array}")
     sorted_array = bubble_sort(test_array.copy())
     print(f"Sorted array: {sorted_array}")
+    print(f"Sorted array (introsort engine): {bubble_sort(test_array.copy(), engine='introsort')}")
@@ -4,14 +4,21 @@ Time Complexity: O(V + E) where V is vertices and E is edges
 Space Complexity: O(V)
 """
 
+from graph_csr import CSRGraph
+
+# Vertex colours: unvisited, on the current DFS path, finished
+WHITE, GRAY, BLACK = 0, 1, 2
+
 def dfs(graph, start, visited=None):
     """
-    Performs depth-first search on a graph (recursive).
+    Performs depth-first search on a graph in recursive (preorder) order.
+    Uses an explicit stack of neighbor iterators rather than recursion, so
+    deep graphs do not hit Python's recursion limit.
     
     Args:
         graph: Dictionary representing adjacency list
         start: Starting vertex
-        visited: Set of visited vertices (used in recursion)
+        visited: Set of already visited vertices, updated in place
     
     Returns:
         List of vertices in DFS traversal order
@@ -21,11 +28,18 @@ def dfs(graph, start, visited=None):
     
     visited.add(start)
     result = [start]
+    stack = [iter(graph.get(start, []))]
     
-    # Visit all neighbors
-    for neighbor in graph.get(start, []):
-        if neighbor not in visited:
-            result.extend(dfs(graph, neighbor, visited))
+    while stack:
+        # Descend into the first unvisited neighbor, or backtrack
+        for neighbor in stack[-1]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                result.append(neighbor)
+                stack.append(iter(graph.get(neighbor, [])))
+                break
+        else:
+            stack.pop()
     
     return result
 
@@ -35,12 +49,15 @@ def dfs_iterative(graph, start):
     Performs depth-first search on a graph (iterative).
     
     Args:
-        graph: Dictionary representing adjacency list
+        graph: Dictionary representing adjacency list, or a CSRGraph
         start: Starting vertex
     
     Returns:
         List of vertices in DFS traversal order
     """
+    if isinstance(graph, CSRGraph):
+        return _dfs_iterative_csr(graph, start)
+    
     visited = set()
     stack = [start]
     result = []
@@ -61,41 +78,229 @@ def dfs_iterative(graph, start):
     return result
 
 
+def _dfs_iterative_csr(graph, start):
+    """Iterative DFS over a CSRGraph using a visited bytearray indexed by vertex id."""
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_vertices)
+    stack = [graph.vertex_id(start)]
+    order = []
+    
+    while stack:
+        vertex = stack.pop()
+        
+        if not visited[vertex]:
+            visited[vertex] = 1
+            order.append(vertex)
+            
+            # Push in reverse to maintain left-to-right traversal
+            for neighbor in reversed(targets[offsets[vertex]:offsets[vertex + 1]]):
+                if not visited[neighbor]:
+                    stack.append(neighbor)
+    
+    labels = graph.labels
+    return [labels[vertex] for vertex in order]
+
+
 def has_cycle(graph):
     """
     Detects if a directed graph has a cycle using DFS.
+    Iterative three-colour marking: reaching a vertex that is still on the
+    current path (GRAY) means a back edge, i.e. a cycle.
     
     Args:
-        graph: Dictionary representing adjacency list
+        graph: Dictionary representing adjacency list, or a CSRGraph
     
     Returns:
         True if cycle exists, False otherwise
     """
-    visited = set()
-    rec_stack = set()
+    if isinstance(graph, CSRGraph):
+        return _has_cycle_csr(graph)
     
-    def dfs_cycle(vertex):
-        visited.add(vertex)
-        rec_stack.add(vertex)
+    color = {}
+    
+    for root in graph:
+        if root in color:
+            continue
         
-        for neighbor in graph.get(vertex, []):
-            if neighbor not in visited:
-                if dfs_cycle(neighbor):
-                    return True
-            elif neighbor in rec_stack:
-                return True
+        color[root] = GRAY
+        stack = [(root, iter(graph.get(root, [])))]
         
-        rec_stack.remove(vertex)
-        return False
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                state = color.get(neighbor, WHITE)
+                if state == GRAY:
+                    return True
+                if state == WHITE:
+                    color[neighbor] = GRAY
+                    stack.append((neighbor, iter(graph.get(neighbor, []))))
+                    break
+            else:
+                color[vertex] = BLACK
+                stack.pop()
     
-    for vertex in graph:
-        if vertex not in visited:
-            if dfs_cycle(vertex):
+    return False
+
+
+def _has_cycle_csr(graph):
+    """Cycle detection over a CSRGraph with an explicit stack and a colour bytearray."""
+    offsets, targets = graph.offsets, graph.targets
+    color = bytearray(graph.num_vertices)
+    
+    for root in range(graph.num_vertices):
+        if color[root] != WHITE:
+            continue
+        
+        # Each frame is a vertex and the position of its next edge
+        color[root] = GRAY
+        stack = [root]
+        edge_pos = [offsets[root]]
+        
+        while stack:
+            vertex = stack[-1]
+            pos = edge_pos[-1]
+            
+            if pos == offsets[vertex + 1]:
+                color[vertex] = BLACK
+                stack.pop()
+                edge_pos.pop()
+                continue
+            
+            edge_pos[-1] = pos + 1
+            neighbor = targets[pos]
+            if color[neighbor] == GRAY:
                 return True
+            if color[neighbor] == WHITE:
+                color[neighbor] = GRAY
+                stack.append(neighbor)
+                edge_pos.append(offsets[neighbor])
     
     return False
 
 
+def topological_sort(graph):
+    """
+    Orders the vertices of a directed acyclic graph so every edge points forward.
+    Iterative DFS that records vertices as they finish, then reverses.
+    Time Complexity: O(V + E)
+    
+    Args:
+        graph: Dictionary representing adjacency list, or a CSRGraph
+    
+    Returns:
+        List of vertices in topological order
+    
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    vertices, successors, labels = _adjacency(graph)
+    color = {}
+    finished = []
+    
+    for root in vertices:
+        if root in color:
+            continue
+        
+        color[root] = GRAY
+        stack = [(root, iter(successors(root)))]
+        
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                state = color.get(neighbor, WHITE)
+                if state == GRAY:
+                    raise ValueError("Graph contains a cycle")
+                if state == WHITE:
+                    color[neighbor] = GRAY
+                    stack.append((neighbor, iter(successors(neighbor))))
+                    break
+            else:
+                color[vertex] = BLACK
+                finished.append(vertex)
+                stack.pop()
+    
+    finished.reverse()
+    return finished if labels is None else [labels[v] for v in finished]
+
+
+def strongly_connected_components(graph):
+    """
+    Finds strongly connected components with an iterative Tarjan's algorithm.
+    Time Complexity: O(V + E)
+    
+    Args:
+        graph: Dictionary representing adjacency list, or a CSRGraph
+    
+    Returns:
+        List of components (each a list of vertices), in reverse
+        topological order of the condensed graph
+    """
+    vertices, successors, labels = _adjacency(graph)
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    component_stack = []
+    components = []
+    counter = 0
+    
+    for root in vertices:
+        if root in index:
+            continue
+        
+        index[root] = lowlink[root] = counter
+        counter += 1
+        component_stack.append(root)
+        on_stack.add(root)
+        stack = [(root, iter(successors(root)))]
+        
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    component_stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    stack.append((neighbor, iter(successors(neighbor))))
+                    break
+                if neighbor in on_stack and index[neighbor] < lowlink[vertex]:
+                    lowlink[vertex] = index[neighbor]
+            else:
+                stack.pop()
+                
+                # Propagate lowlink to the parent, as the recursive return would
+                if stack:
+                    parent = stack[-1][0]
+                    if lowlink[vertex] < lowlink[parent]:
+                        lowlink[parent] = lowlink[vertex]
+                
+                # vertex is the root of a component: pop it off
+                if lowlink[vertex] == index[vertex]:
+                    component = []
+                    while True:
+                        member = component_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member if labels is None else labels[member])
+                        if member == vertex:
+                            break
+                    components.append(component)
+    
+    return components
+
+
+def _adjacency(graph):
+    """
+    Normalises a graph into (vertices, successors, labels) for generic traversals.
+    Dictionary graphs are walked by label (labels is None); CSR graphs by
+    vertex id, with labels mapping ids back.
+    """
+    if isinstance(graph, CSRGraph):
+        offsets, targets = graph.offsets, graph.targets
+        return range(graph.num_vertices), lambda v: targets[offsets[v]:offsets[v + 1]], graph.labels
+    
+    return graph, lambda v: graph.get(v, []), None
+
+
 if __name__ == "__main__":
     # Test DFS algorithm
     graph = {
@@ -122,3 +327,30 @@ if __name__ == "__main__":
     }
     print("\nCyclic graph:", cyclic_graph)
     print("Has cycle:", has_cycle(cyclic_graph))
+    print("Has cycle (CSR):", has_cycle(CSRGraph.from_dict(cyclic_graph)))
+    
+    # Test topological sort and strongly connected components
+    dag = {
+        'shirt': ['tie', 'belt'],
+        'tie': ['jacket'],
+        'pants': ['shoes', 'belt'],
+        'belt': ['jacket'],
+        'socks': ['shoes']
+    }
+    print("\nDAG:", dag)
+    print("Topological order:", topological_sort(dag))
+    
+    scc_graph = {
+        'A': ['B'],
+        'B': ['C', 'D'],
+        'C': ['A'],
+        'D': ['E'],
+        'E': ['D']
+    }
+    print("\nGraph:", scc_graph)
+    print("Strongly connected components:", strongly_connected_components(scc_graph))
+    
+    # A chain far deeper than the default recursion limit
+    chain = {i: [i + 1] for i in range(100000)}
+    print("\n100000-deep chain DFS visits:", len(dfs(chain, 0)))
+    print("100000-deep chain has cycle:", has_cycle(chain))
@@ -5,94 +5,410 @@ Space Complexity: O(V)
 """
 
 import heapq
+from array import array
+
+from graph_csr import CSRGraph, transpose
 
 def dijkstra(graph, start):
     """
     Finds shortest paths from start vertex to all other vertices.
     
     Args:
-        graph: Dictionary where graph[u] = [(v, weight), ...]
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
         start: Starting vertex
     
     Returns:
         Dictionary of shortest distances from start to each vertex
     """
-    # Initialize distances with infinity
+    if isinstance(graph, CSRGraph):
+        distances, _ = _dijkstra_csr(graph, graph.vertex_id(start))
+        return dict(zip(graph.labels, distances))
+    
+    # Unreached vertices keep infinity; the search itself only touches reached ones
     distances = {vertex: float('infinity') for vertex in graph}
-    distances[start] = 0
+    settled, _ = dijkstra_search(graph, [start])
+    distances.update(settled)
+    
+    return distances
+
+
+def dijkstra_with_path(graph, start, end):
+    """
+    Finds shortest path and distance from start to end vertex.
+    Stops as soon as end is settled.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        start: Starting vertex
+        end: Ending vertex
+    
+    Returns:
+        Tuple of (shortest_distance, path), with (infinity, None) if end
+        is unreachable
+    """
+    distances, previous = dijkstra_search(graph, [start], targets=[end])
+    if end not in distances:
+        return float('infinity'), None
+    
+    return distances[end], _reconstruct_path(previous, end)
+
+
+def bidirectional_dijkstra(graph, start, end, reverse_graph=None):
+    """
+    Finds shortest path and distance by growing Dijkstra searches from both ends.
+    The side with the smaller queue head is advanced, and the search stops
+    once the two heads together can no longer beat the best meeting found.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        start: Starting vertex
+        end: Ending vertex
+        reverse_graph: Graph with every edge reversed, used for the search
+            from end; built from graph when not given, so pass it when
+            running many queries on one graph
+    
+    Returns:
+        Tuple of (shortest_distance, path), with (infinity, None) if end
+        is unreachable
+    """
+    if reverse_graph is None:
+        reverse_graph = transpose(graph, weighted=True)
+    
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        source, target = graph.vertex_id(start), graph.vertex_id(end)
+        forward, backward = graph.weighted_edges, reverse_graph.weighted_edges
+    else:
+        labels = None
+        source, target = start, end
+        forward = lambda vertex: graph.get(vertex, [])
+        backward = lambda vertex: reverse_graph.get(vertex, [])
+    
+    if source == target:
+        return 0, [start]
+    
+    dist_fwd, prev_fwd, settled_fwd, pq_fwd = {source: 0}, {source: None}, set(), [(0, source)]
+    dist_bwd, prev_bwd, settled_bwd, pq_bwd = {target: 0}, {target: None}, set(), [(0, target)]
+    best = float('infinity')
+    meet = None
+    
+    while pq_fwd and pq_bwd:
+        # No path through unsettled vertices can beat best any more
+        if pq_fwd[0][0] + pq_bwd[0][0] >= best:
+            break
+        
+        if pq_fwd[0][0] <= pq_bwd[0][0]:
+            best, meet = _bidirectional_step(forward, pq_fwd, dist_fwd, prev_fwd, settled_fwd, dist_bwd, best, meet)
+        else:
+            best, meet = _bidirectional_step(backward, pq_bwd, dist_bwd, prev_bwd, settled_bwd, dist_fwd, best, meet)
+    
+    if meet is None:
+        return float('infinity'), None
+    
+    # start -> meet from the forward tree, then meet -> end from the backward tree
+    path = _reconstruct_path(prev_fwd, meet)
+    vertex = prev_bwd[meet]
+    while vertex is not None:
+        path.append(vertex)
+        vertex = prev_bwd[vertex]
+    
+    if labels is not None:
+        path = [labels[v] for v in path]
+    return best, path
+
+
+def _bidirectional_step(edges, pq, distances, previous, settled, other_distances, best, meet):
+    """
+    Settles one vertex on one side of a bidirectional search.
+    
+    Returns:
+        Updated (best, meet) pair for the shortest join seen so far
+    """
+    current_distance, current_vertex = heapq.heappop(pq)
+    if current_vertex in settled:
+        return best, meet
+    settled.add(current_vertex)
+    
+    for neighbor, weight in edges(current_vertex):
+        distance = current_distance + weight
+        
+        if distance < distances.get(neighbor, float('infinity')):
+            distances[neighbor] = distance
+            previous[neighbor] = current_vertex
+            heapq.heappush(pq, (distance, neighbor))
+        
+        # Any vertex reached from both sides is a candidate meeting point
+        if neighbor in other_distances and distances[neighbor] + other_distances[neighbor] < best:
+            best = distances[neighbor] + other_distances[neighbor]
+            meet = neighbor
+    
+    return best, meet
+
+
+def dijkstra_search(graph, sources, targets=None, radius=None, heap='lazy'):
+    """
+    General Dijkstra engine behind dijkstra and dijkstra_with_path.
+    State is kept only for vertices the search touches, so early exits and
+    bounded queries cost time and memory proportional to the explored ball.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        sources: Iterable of source vertices, or a dictionary mapping each
+            source to its initial distance
+        targets: Optional iterable of vertices; the search stops once all
+            of them are settled
+        radius: Optional maximum distance; farther vertices are not settled
+        heap: 'lazy' for heapq with duplicate entries skipped on pop, or
+            'indexed' for a decrease-key heap holding one entry per vertex
+    
+    Returns:
+        Tuple of (distances, previous) dictionaries over settled vertices,
+        where previous maps each vertex to its predecessor (None for sources)
+    """
+    if heap not in ('lazy', 'indexed'):
+        raise ValueError(f"Unknown heap: {heap!r}")
+    
+    if isinstance(graph, CSRGraph):
+        edges, to_id, labels = graph.weighted_edges, graph.vertex_id, graph.labels
+    else:
+        edges, to_id, labels = (lambda vertex: graph.get(vertex, [])), None, None
+    
+    seeds = sources.items() if isinstance(sources, dict) else ((s, 0) for s in sources)
+    if to_id is not None:
+        seeds = [(to_id(s), d) for s, d in seeds]
+        if targets is not None:
+            targets = [to_id(t) for t in targets]
+    
+    search = _search_indexed if heap == 'indexed' else _search_lazy
+    distances, previous = search(edges, seeds, None if targets is None else set(targets), radius)
     
-    # Priority queue: (distance, vertex)
-    pq = [(0, start)]
-    visited = set()
+    if labels is None:
+        return distances, previous
+    return (
+        {labels[v]: d for v, d in distances.items()},
+        {labels[v]: None if u is None else labels[u] for v, u in previous.items()},
+    )
+
+
+def _search_lazy(edges, seeds, targets, radius):
+    """Dijkstra with heapq; stale entries are skipped when popped."""
+    tentative = {}
+    previous = {}
+    for source, distance in seeds:
+        if distance < tentative.get(source, float('infinity')):
+            tentative[source] = distance
+            previous[source] = None
+    
+    pq = [(distance, vertex) for vertex, distance in tentative.items()]
+    heapq.heapify(pq)
+    settled = {}
     
     while pq:
         current_distance, current_vertex = heapq.heappop(pq)
         
-        # Skip if already visited
-        if current_vertex in visited:
+        if current_vertex in settled:
             continue
+        if radius is not None and current_distance > radius:
+            break
         
-        visited.add(current_vertex)
+        settled[current_vertex] = current_distance
+        if targets is not None:
+            targets.discard(current_vertex)
+            if not targets:
+                break
         
-        # Check all neighbors
-        for neighbor, weight in graph.get(current_vertex, []):
+        for neighbor, weight in edges(current_vertex):
             distance = current_distance + weight
             
-            # Update distance if shorter path found
-            if distance < distances[neighbor]:
-                distances[neighbor] = distance
+            if neighbor not in settled and distance < tentative.get(neighbor, float('infinity')):
+                tentative[neighbor] = distance
+                previous[neighbor] = current_vertex
                 heapq.heappush(pq, (distance, neighbor))
     
-    return distances
+    return settled, {vertex: previous[vertex] for vertex in settled}
 
 
-def dijkstra_with_path(graph, start, end):
+def _search_indexed(edges, seeds, targets, radius):
+    """Dijkstra with an IndexedMinHeap; each vertex has at most one heap entry."""
+    pq = IndexedMinHeap()
+    previous = {}
+    for source, distance in seeds:
+        if pq.push_or_decrease(source, distance):
+            previous[source] = None
+    
+    settled = {}
+    
+    while pq:
+        current_distance, current_vertex = pq.pop()
+        
+        if radius is not None and current_distance > radius:
+            break
+        
+        settled[current_vertex] = current_distance
+        if targets is not None:
+            targets.discard(current_vertex)
+            if not targets:
+                break
+        
+        for neighbor, weight in edges(current_vertex):
+            if neighbor not in settled and pq.push_or_decrease(neighbor, current_distance + weight):
+                previous[neighbor] = current_vertex
+    
+    return settled, {vertex: previous[vertex] for vertex in settled}
+
+
+class IndexedMinHeap:
     """
-    Finds shortest path and distance from start to end vertex.
+    Binary min-heap of (priority, item) pairs with decrease-key.
+    A position map lets an item's priority be lowered in place, so the heap
+    never holds more than one entry per item.
+    """
+    
+    def __init__(self):
+        self._heap = []
+        self._position = {}
+    
+    def __len__(self):
+        return len(self._heap)
+    
+    def __contains__(self, item):
+        return item in self._position
+    
+    def push_or_decrease(self, item, priority):
+        """
+        Inserts item, or lowers its priority if it is already queued.
+        Time Complexity: O(log n)
+        
+        Args:
+            item: Hashable item
+            priority: New priority
+        
+        Returns:
+            True if the item was inserted or its priority lowered
+        """
+        index = self._position.get(item)
+        if index is None:
+            index = len(self._heap)
+            self._heap.append([priority, item])
+            self._position[item] = index
+        elif priority < self._heap[index][0]:
+            self._heap[index][0] = priority
+        else:
+            return False
+        
+        self._sift_up(index)
+        return True
+    
+    def pop(self):
+        """
+        Removes and returns the entry with the smallest priority.
+        Time Complexity: O(log n)
+        
+        Returns:
+            Tuple of (priority, item)
+        """
+        heap = self._heap
+        priority, item = heap[0]
+        del self._position[item]
+        
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._position[last[1]] = 0
+            self._sift_down(0)
+        
+        return priority, item
+    
+    def _sift_up(self, index):
+        heap, position = self._heap, self._position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if heap[parent][0] <= entry[0]:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[1]] = index
+    
+    def _sift_down(self, index):
+        heap, position = self._heap, self._position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if entry[0] <= heap[child][0]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = entry
+        position[entry[1]] = index
+
+
+def _csr_weights(graph):
+    """Returns a CSRGraph's edge weights, treating an unweighted graph as unit-weight."""
+    if graph.weights is None:
+        return array('q', [1]) * graph.num_edges
+    return graph.weights
+
+
+def _reconstruct_path(previous, end):
+    """Walks predecessor links back from end and returns the path from its source."""
+    path = []
+    vertex = end
+    while vertex is not None:
+        path.append(vertex)
+        vertex = previous[vertex]
+    path.reverse()
+    return path
+
+
+def _dijkstra_csr(graph, source):
+    """
+    Full single-source Dijkstra over a CSRGraph with distance, predecessor
+    and settled state held in lists/bytearrays indexed by vertex id.
     
     Args:
-        graph: Dictionary where graph[u] = [(v, weight), ...]
-        start: Starting vertex
-        end: Ending vertex
+        graph: CSRGraph
+        source: Source vertex id
     
     Returns:
-        Tuple of (shortest_distance, path)
+        Tuple of (distances, previous) indexed by vertex id, where
+        previous[v] is -1 for the source and unreached vertices
     """
-    distances = {vertex: float('infinity') for vertex in graph}
-    distances[start] = 0
-    previous = {vertex: None for vertex in graph}
+    offsets, targets, weights = graph.offsets, graph.targets, _csr_weights(graph)
+    n = graph.num_vertices
+    distances = [float('infinity')] * n
+    previous = [-1] * n
+    settled = bytearray(n)
+    distances[source] = 0
     
-    pq = [(0, start)]
-    visited = set()
+    pq = [(0, source)]
     
     while pq:
         current_distance, current_vertex = heapq.heappop(pq)
         
-        if current_vertex == end:
-            break
-        
-        if current_vertex in visited:
+        if settled[current_vertex]:
             continue
         
-        visited.add(current_vertex)
+        settled[current_vertex] = 1
         
-        for neighbor, weight in graph.get(current_vertex, []):
-            distance = current_distance + weight
+        for edge in range(offsets[current_vertex], offsets[current_vertex + 1]):
+            neighbor = targets[edge]
+            distance = current_distance + weights[edge]
             
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
                 previous[neighbor] = current_vertex
                 heapq.heappush(pq, (distance, neighbor))
     
-    # Reconstruct path
-    path = []
-    current = end
-    while current is not None:
-        path.append(current)
-        current = previous[current]
-    path.reverse()
-    
-    return distances[end], path if path and path[0] == start else None
+    return distances, previous
 
 
 if __name__ == "__main__":
@@ -120,3 +436,15 @@ if __name__ == "__main__":
     print(f"\nShortest path from '{start_vertex}' to '{end_vertex}':")
     print(f"  Distance: {distance}")
     print(f"  Path: {' -> '.join(path)}")
+    
+    csr_distance, csr_path = dijkstra_with_path(CSRGraph.from_dict(graph), start_vertex, end_vertex)
+    print(f"\nSame query on the CSR form: {csr_distance}, {' -> '.join(csr_path)}")
+    
+    distances, _ = dijkstra_search(graph, {'A': 0, 'E': 0}, heap='indexed')
+    print(f"\nDistance to the nearer of 'A' and 'E': {dict(sorted(distances.items()))}")
+    
+    distances, _ = dijkstra_search(graph, ['A'], radius=3)
+    print(f"Vertices within distance 3 of 'A': {dict(sorted(distances.items()))}")
+    
+    distance, path = bidirectional_dijkstra(graph, start_vertex, end_vertex)
+    print(f"\nBidirectional search from '{start_vertex}' to '{end_vertex}': {distance}, {' -> '.join(path)}")
@@ -0,0 +1,223 @@
+"""
+Many-to-Many Distance Matrix
+Shortest path distances between every source and every target. Sources are
+sharded across a process pool whose workers share one read-only CSR copy of
+the graph through shared memory and write their rows straight into a shared
+result matrix. Small dense graphs use vectorized Floyd-Warshall instead.
+Time Complexity: O(S (V + E) log V) with Dijkstra, O(V^3) with Floyd-Warshall
+Space Complexity: O(S * T) for the result, plus O(V + E) shared by all workers
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; results fall back to lists of rows
+    np = None
+
+from dijkstra import dijkstra, dijkstra_search
+from graph_csr import CSRGraph
+
+# Floyd-Warshall is chosen automatically only for graphs at most this large...
+FLOYD_WARSHALL_MAX_VERTICES = 512
+# ...and with at least this fraction of all possible edges
+FLOYD_WARSHALL_MIN_DENSITY = 0.05
+
+# Searches stop early once all targets are settled only for this many targets
+EARLY_EXIT_TARGETS = 8
+
+# Sources handed to each worker task
+SOURCES_PER_TASK = 16
+
+# Worker-side state set by _init_worker: (graph, target ids, matrix view, segments)
+_shared = None
+
+def distance_matrix(graph, sources=None, targets=None, workers=None, method='auto'):
+    """
+    Computes shortest path distances from each source to each target.
+    With few targets, each Dijkstra search stops once all are settled.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], or a CSRGraph
+        sources: List of source vertices (None for all vertices)
+        targets: List of target vertices (None for all vertices)
+        workers: Number of worker processes (None or 1 runs in-process)
+        method: 'dijkstra', 'floyd_warshall', or 'auto' to use
+            Floyd-Warshall for small dense graphs when NumPy is installed
+    
+    Returns:
+        Float matrix with result[i][j] the distance from sources[i] to
+        targets[j] (infinity if unreachable), as a NumPy array if NumPy is
+        installed, otherwise as a list of lists
+    
+    Raises:
+        ValueError: If method is unknown
+        ImportError: If method is 'floyd_warshall' and NumPy is not installed
+    """
+    if method not in ('auto', 'dijkstra', 'floyd_warshall'):
+        raise ValueError(f"Unknown method: {method!r}")
+    
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+    n = csr.num_vertices
+    sources = csr.labels if sources is None else list(sources)
+    targets = csr.labels if targets is None else list(targets)
+    source_ids = [csr.vertex_id(s) for s in sources]
+    target_ids = [csr.vertex_id(t) for t in targets]
+    
+    if method == 'auto':
+        dense = csr.num_edges >= FLOYD_WARSHALL_MIN_DENSITY * n * n
+        method = 'floyd_warshall' if np is not None and n <= FLOYD_WARSHALL_MAX_VERTICES and dense else 'dijkstra'
+    
+    if method == 'floyd_warshall':
+        if np is None:
+            raise ImportError("Floyd-Warshall distance matrices require NumPy")
+        return _floyd_warshall(csr)[np.ix_(source_ids, target_ids)]
+    
+    if workers is None or workers <= 1 or len(sources) <= SOURCES_PER_TASK:
+        rows = [[float(d) for d in row] for row in _distance_rows(csr, sources, targets)]
+        if np is not None:
+            return np.array(rows, dtype=np.float64).reshape(len(sources), len(targets))
+        return rows
+    
+    return _parallel_matrix(csr, source_ids, target_ids, workers)
+
+
+def _distance_rows(graph, sources, targets):
+    """Yields one row of target distances per source, with infinity for unreachable targets."""
+    # Random targets are settled late, so early exit only pays off for a handful
+    early_exit = len(targets) <= EARLY_EXIT_TARGETS
+    for source in sources:
+        if early_exit:
+            distances, _ = dijkstra_search(graph, [source], targets=targets)
+        else:
+            distances = dijkstra(graph, source)
+        yield [distances.get(target, float('infinity')) for target in targets]
+
+
+def _floyd_warshall(graph):
+    """
+    All-pairs distances over a CSRGraph by Floyd-Warshall, relaxing
+    through one intermediate vertex per step with whole-matrix operations.
+    
+    Returns:
+        n x n float64 NumPy array indexed by vertex id
+    """
+    n = graph.num_vertices
+    offsets, targets, weights = graph.as_numpy()
+    edge_sources = np.repeat(np.arange(n), np.diff(offsets))
+    if weights is None:
+        weights = np.ones(len(targets))
+    
+    dist = np.full((n, n), np.inf)
+    np.minimum.at(dist, (edge_sources, targets), weights)
+    np.fill_diagonal(dist, 0)
+    
+    for k in range(n):
+        np.minimum(dist, dist[:, k, None] + dist[k], out=dist)
+    
+    return dist
+
+
+def _parallel_matrix(graph, source_ids, target_ids, workers):
+    """
+    Fills the distance matrix in a process pool.
+    The CSR buffers are copied once into a shared memory segment that every
+    worker maps read-only; rows are written into a second shared segment.
+    """
+    rows, cols = len(source_ids), len(target_ids)
+    weight_code = graph.weight_typecode
+    buffers = [graph.offsets, graph.targets] + ([] if graph.weights is None else [graph.weights])
+    
+    graph_segment = shared_memory.SharedMemory(create=True, size=max(1, sum(b.itemsize * len(b) for b in buffers)))
+    matrix_segment = shared_memory.SharedMemory(create=True, size=max(1, 8 * rows * cols))
+    try:
+        position = 0
+        for buffer in buffers:
+            data = buffer.tobytes()
+            graph_segment.buf[position:position + len(data)] = data
+            position += len(data)
+        
+        tasks = [
+            (start, source_ids[start:start + SOURCES_PER_TASK])
+            for start in range(0, rows, SOURCES_PER_TASK)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(graph_segment.name, graph.num_vertices, graph.num_edges, weight_code,
+                      matrix_segment.name, target_ids),
+        ) as executor:
+            for _ in executor.map(_fill_rows, tasks):
+                pass
+        
+        # Copy out before the segment goes away
+        if np is not None:
+            view = np.ndarray((rows, cols), dtype=np.float64, buffer=matrix_segment.buf)
+            result = view.copy()
+            del view
+            return result
+        
+        with matrix_segment.buf[:8 * rows * cols].cast('d') as view:
+            return [view[i * cols:(i + 1) * cols].tolist() for i in range(rows)]
+    finally:
+        graph_segment.close()
+        graph_segment.unlink()
+        matrix_segment.close()
+        matrix_segment.unlink()
+
+
+def _init_worker(graph_name, num_vertices, num_edges, weight_code, matrix_name, target_ids):
+    """Attaches a worker process to the shared graph and result segments."""
+    global _shared
+    graph_segment = shared_memory.SharedMemory(name=graph_name)
+    matrix_segment = shared_memory.SharedMemory(name=matrix_name)
+    
+    buf = graph_segment.buf
+    targets_start = 8 * (num_vertices + 1)
+    weights_start = targets_start + 8 * num_edges
+    offsets = buf[:targets_start].cast('q')
+    targets = buf[targets_start:weights_start].cast('q')
+    weights = None if weight_code is None else buf[weights_start:weights_start + 8 * num_edges].cast(weight_code)
+    
+    # Labels default to the vertex ids themselves
+    graph = CSRGraph(offsets, targets, weights)
+    matrix = matrix_segment.buf[:len(matrix_segment.buf) // 8 * 8].cast('d')
+    _shared = (graph, target_ids, matrix, (graph_segment, matrix_segment))
+
+
+def _fill_rows(task):
+    """Computes the rows for one shard of sources and writes them into the shared matrix."""
+    start, source_ids = task
+    graph, target_ids, matrix, _ = _shared
+    cols = len(target_ids)
+    
+    for offset, row in enumerate(_distance_rows(graph, source_ids, target_ids)):
+        base = (start + offset) * cols
+        matrix[base:base + cols] = memoryview(array('d', row))
+    
+    return len(source_ids)
+
+
+if __name__ == "__main__":
+    # Test the distance matrix
+    graph = {
+        'A': [('B', 4), ('C', 2)],
+        'B': [('A', 4), ('C', 1), ('D', 5)],
+        'C': [('A', 2), ('B', 1), ('D', 8), ('E', 10)],
+        'D': [('B', 5), ('C', 8), ('E', 2)],
+        'E': [('C', 10), ('D', 2)]
+    }
+    
+    sources, targets = ['A', 'B', 'E'], ['A', 'C', 'D', 'E']
+    print(f"Sources: {sources}, targets: {targets}")
+    for method in ('dijkstra', 'floyd_warshall'):
+        try:
+            matrix = distance_matrix(graph, sources, targets, method=method)
+        except ImportError as error:
+            print(f"\n{method}: skipped ({error})")
+            continue
+        print(f"\n{method}:")
+        for source, row in zip(sources, matrix):
+            print(f"  {source}: {[float(d) for d in row]}")
@@ -0,0 +1,176 @@
+"""
+Dynamic Single-Source Shortest Paths
+Repairs an existing Dijkstra result after a batch of edge insertions,
+removals or weight changes, in the style of Ramalingam and Reps: only
+vertices whose distance can change are revisited, instead of rerunning
+Dijkstra over the whole graph.
+Time Complexity: O(|delta| log |delta|) where delta is the set of affected
+vertices and their incident edges
+"""
+
+import heapq
+
+from dijkstra import dijkstra_search
+from graph_csr import transpose
+
+def repair_shortest_paths(graph, distances, previous, changed_edges, reverse_graph=None):
+    """
+    Updates a shortest-path tree in place after edges have changed.
+    graph must already reflect the changes. Weight increases and removals
+    are handled first: the subtree hanging off each worsened tree edge is
+    detached and re-attached by a Dijkstra pass restricted to it. Weight
+    decreases and insertions are then propagated outward from the improved
+    edges.
+    
+    Args:
+        graph: Dictionary where graph[u] = [(v, weight), ...], after the changes
+        distances: Dictionary of settled distances, as from dijkstra_search
+        previous: Dictionary of predecessors, as from dijkstra_search
+        changed_edges: Iterable of (u, v) pairs whose u -> v edges were
+            inserted, removed or reweighted
+        reverse_graph: Graph with every edge reversed (also after the
+            changes), used to find new parents; built from graph when a
+            tree edge worsened and it is not given, at O(V + E) cost, so
+            pass it (e.g. graph itself for undirected graphs) when repairs
+            are frequent
+    
+    Returns:
+        Set of vertices whose distance changed or became unreachable
+    """
+    changed_edges = list(changed_edges)
+    
+    # Phase 1: tree edges that got longer or disappeared
+    roots = [
+        v for u, v in changed_edges
+        if v in distances and previous.get(v) == u
+        and distances[u] + _edge_weight(graph, u, v) > distances[v]
+    ]
+    before = {}
+    if roots:
+        if reverse_graph is None:
+            reverse_graph = transpose(graph, weighted=True)
+        before = _repair_increases(graph, reverse_graph, distances, previous, roots)
+    
+    # Phase 2: edges that now offer a shorter route. Re-attached vertices
+    # are rescanned too, since an inserted edge may have pulled them closer
+    # than before and their unchanged out-edges can then improve others.
+    pq = [(distances[vertex], vertex) for vertex in before if vertex in distances]
+    heapq.heapify(pq)
+    for u, v in changed_edges:
+        if u in distances:
+            distance = distances[u] + _edge_weight(graph, u, v)
+            if distance < distances.get(v, float('infinity')):
+                before.setdefault(v, distances.get(v))
+                distances[v] = distance
+                previous[v] = u
+                heapq.heappush(pq, (distance, v))
+    
+    while pq:
+        current_distance, current_vertex = heapq.heappop(pq)
+        
+        # Skip entries superseded by a later improvement
+        if current_distance > distances[current_vertex]:
+            continue
+        
+        for neighbor, weight in graph.get(current_vertex, []):
+            distance = current_distance + weight
+            
+            if distance < distances.get(neighbor, float('infinity')):
+                before.setdefault(neighbor, distances.get(neighbor))
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                heapq.heappush(pq, (distance, neighbor))
+    
+    return {vertex for vertex, distance in before.items() if distances.get(vertex) != distance}
+
+
+def _repair_increases(graph, reverse_graph, distances, previous, roots):
+    """
+    Recomputes distances for the subtrees under roots after their tree edges worsened.
+    
+    Returns:
+        Dictionary mapping each detached vertex to its old distance
+    """
+    # Detach every vertex whose tree path runs through a worsened edge; a
+    # vertex's tree children are the out-neighbors whose predecessor it is
+    affected = set(roots)
+    stack = list(roots)
+    while stack:
+        vertex = stack.pop()
+        for child, _ in graph.get(vertex, []):
+            if child not in affected and previous.get(child) == vertex:
+                affected.add(child)
+                stack.append(child)
+    
+    old_distances = {vertex: distances.pop(vertex) for vertex in affected}
+    for vertex in affected:
+        del previous[vertex]
+    
+    # Seed each detached vertex from its best attached in-neighbor
+    tentative = {}
+    parent_of = {}
+    for vertex in affected:
+        for neighbor, weight in reverse_graph.get(vertex, []):
+            if neighbor in distances:
+                distance = distances[neighbor] + weight
+                if distance < tentative.get(vertex, float('infinity')):
+                    tentative[vertex] = distance
+                    parent_of[vertex] = neighbor
+    
+    pq = [(distance, vertex) for vertex, distance in tentative.items()]
+    heapq.heapify(pq)
+    
+    # Dijkstra restricted to the detached vertices
+    while pq:
+        current_distance, current_vertex = heapq.heappop(pq)
+        
+        if current_vertex in distances:
+            continue
+        
+        distances[current_vertex] = current_distance
+        previous[current_vertex] = parent_of[current_vertex]
+        
+        for neighbor, weight in graph.get(current_vertex, []):
+            if neighbor in affected and neighbor not in distances:
+                distance = current_distance + weight
+                if distance < tentative.get(neighbor, float('infinity')):
+                    tentative[neighbor] = distance
+                    parent_of[neighbor] = current_vertex
+                    heapq.heappush(pq, (distance, neighbor))
+    
+    return old_distances
+
+
+def _edge_weight(graph, u, v):
+    """Returns the lightest u -> v edge weight, or infinity if there is none."""
+    return min((weight for target, weight in graph.get(u, []) if target == v), default=float('infinity'))
+
+
+if __name__ == "__main__":
+    # Test incremental repair against a full recompute
+    graph = {
+        'A': [('B', 4), ('C', 2)],
+        'B': [('A', 4), ('C', 1), ('D', 5)],
+        'C': [('A', 2), ('B', 1), ('D', 8), ('E', 10)],
+        'D': [('B', 5), ('C', 8), ('E', 2)],
+        'E': [('C', 10), ('D', 2)]
+    }
+    
+    distances, previous = dijkstra_search(graph, ['A'])
+    print(f"Distances from 'A': {dict(sorted(distances.items()))}")
+    
+    # Make C -> B (and B -> C) expensive: B's subtree must be re-attached
+    graph['C'] = [(v, 9 if v == 'B' else w) for v, w in graph['C']]
+    graph['B'] = [(v, 9 if v == 'C' else w) for v, w in graph['B']]
+    changed = repair_shortest_paths(graph, distances, previous, [('C', 'B'), ('B', 'C')])
+    print(f"\nAfter raising B <-> C to 9, changed: {sorted(changed)}")
+    print(f"Repaired distances: {dict(sorted(distances.items()))}")
+    print("Matches full recompute:", distances == dijkstra_search(graph, ['A'])[0])
+    
+    # Add a shortcut A -> E (and E -> A)
+    graph['A'].append(('E', 3))
+    graph['E'].append(('A', 3))
+    changed = repair_shortest_paths(graph, distances, previous, [('A', 'E'), ('E', 'A')])
+    print(f"\nAfter adding A <-> E with weight 3, changed: {sorted(changed)}")
+    print(f"Repaired distances: {dict(sorted(distances.items()))}")
+    print("Matches full recompute:", distances == dijkstra_search(graph, ['A'])[0])
@@ -0,0 +1,247 @@
+"""
+External Merge Sort
+Sorts files of records too large to fit in memory. The input is read in
+chunks of whole records that worker processes decode, sort and spill to
+temporary run files; the runs are then merged with a k-way heap merge that
+streams records to the output. Records are read and written by a codec,
+so the same pipeline sorts text lines or fixed-size binary structs.
+Time Complexity: O(n log n), with O(n) I/O per merge pass
+Space Complexity: O(memory_limit) in memory, O(n) on disk for the runs
+"""
+
+import heapq
+import os
+import shutil
+import struct
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# Default bytes of encoded input held in memory at once
+DEFAULT_MEMORY_LIMIT = 1 << 28
+
+# Runs merged at once; more runs than this are merged over several passes
+MAX_FAN_IN = 64
+
+# Smallest read per run file during a merge
+MIN_READ_BYTES = 1 << 16
+
+# Records encoded per write while merging
+WRITE_BATCH = 1 << 14
+
+class LineCodec:
+    """
+    Newline-terminated text records, decoded to str without the newline.
+    The encoding must be ASCII-compatible so that b'\\n' ends every record.
+    """
+    
+    def __init__(self, encoding='utf-8'):
+        self.encoding = encoding
+    
+    def encode(self, records):
+        """Returns the bytes for a list of records."""
+        if not records:
+            return b''
+        return ('\n'.join(records) + '\n').encode(self.encoding)
+    
+    def decode(self, data):
+        """Returns the list of records in data, which holds whole records."""
+        lines = data.decode(self.encoding).split('\n')
+        if lines[-1] == '':
+            lines.pop()
+        return lines
+    
+    def complete(self, data):
+        """Returns the length of the longest prefix of data made of whole records."""
+        return data.rfind(b'\n') + 1
+
+
+class StructCodec:
+    """Fixed-size binary records, decoded to tuples by a struct format."""
+    
+    def __init__(self, fmt):
+        self.struct = struct.Struct(fmt)
+    
+    def __reduce__(self):
+        # Struct objects cannot be pickled, so workers rebuild the codec from its format
+        return StructCodec, (self.struct.format,)
+    
+    def encode(self, records):
+        """Returns the bytes for a list of records."""
+        pack = self.struct.pack
+        return b''.join(pack(*record) for record in records)
+    
+    def decode(self, data):
+        """
+        Returns the list of records in data.
+        
+        Raises:
+            ValueError: If data ends with a partial record
+        """
+        if len(data) % self.struct.size:
+            raise ValueError(f"Truncated record: {len(data)} bytes is not a multiple of {self.struct.size}")
+        return list(self.struct.iter_unpack(data))
+    
+    def complete(self, data):
+        """Returns the length of the longest prefix of data made of whole records."""
+        return len(data) - len(data) % self.struct.size
+
+
+def external_sort(input_path, output_path, key=None, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  workers=None, codec=None, tmp_dir=None):
+    """
+    Sorts the records of a file into another file. The sort is stable:
+    records with equal keys keep their input order, since each run is
+    sorted stably and ties between runs go to the earlier run, as in
+    merge_sort.merge.
+    
+    Args:
+        input_path: File to sort
+        output_path: File to write the sorted records to
+        key: Optional function of one record to sort by
+        memory_limit: Approximate bytes of encoded input held in memory at
+            once; decoded records take several times their encoded size
+        workers: Number of worker processes sorting runs (None or 1 sorts
+            in-process); key and codec must then be picklable
+        codec: Record format with encode, decode and complete methods
+            (defaults to LineCodec())
+        tmp_dir: Directory for the run files (defaults to the system one)
+    
+    Returns:
+        Number of records written
+    """
+    codec = LineCodec() if codec is None else codec
+    workers = 1 if workers is None else max(1, workers)
+    # One chunk per busy worker plus the one being read
+    chunk_bytes = max(memory_limit // (workers + 1), MIN_READ_BYTES)
+    
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        with open(input_path, 'rb') as f:
+            chunks = _read_blocks(f, codec, chunk_bytes)
+            if workers == 1:
+                runs = [_sort_run((data, codec, key, os.path.join(run_dir, f"run{i}")))
+                        for i, data in enumerate(chunks)]
+            else:
+                runs = _sort_runs_parallel(chunks, codec, key, run_dir, workers)
+        
+        count = sum(size for _, size in runs)
+        runs = [path for path, _ in runs]
+        
+        # Merge groups of runs in input order, which keeps ties stable
+        generation = 0
+        while len(runs) > MAX_FAN_IN:
+            merged = []
+            for start in range(0, len(runs), MAX_FAN_IN):
+                path = os.path.join(run_dir, f"merge{generation}_{start}")
+                _merge_runs(runs[start:start + MAX_FAN_IN], path, codec, key, memory_limit)
+                merged.append(path)
+            runs = merged
+            generation += 1
+        
+        if not runs:
+            open(output_path, 'wb').close()
+        elif len(runs) == 1:
+            shutil.move(runs[0], output_path)
+        else:
+            _merge_runs(runs, output_path, codec, key, memory_limit)
+    
+    return count
+
+
+def _read_blocks(f, codec, block_bytes):
+    """Yields blocks of about block_bytes from a binary file, each holding whole records."""
+    rest = b''
+    while True:
+        data = f.read(block_bytes)
+        if not data:
+            if rest:
+                yield rest
+            return
+        data = rest + data if rest else data
+        cut = codec.complete(data)
+        rest = data[cut:]
+        if cut:
+            yield data[:cut]
+
+
+def _sort_run(task):
+    """Decodes, sorts and writes one run. Returns (path, number of records)."""
+    data, codec, key, path = task
+    records = codec.decode(data)
+    records.sort(key=key)
+    with open(path, 'wb') as f:
+        f.write(codec.encode(records))
+    return path, len(records)
+
+
+def _sort_runs_parallel(chunks, codec, key, run_dir, workers):
+    """
+    Sorts runs in a process pool, submitting at most one chunk per worker
+    ahead so only that many chunks are in memory at once.
+    
+    Returns:
+        List of (path, number of records) in input order
+    """
+    runs = []
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, data in enumerate(chunks):
+            if len(pending) == workers:
+                runs.append(pending.popleft().result())
+            pending.append(executor.submit(_sort_run, (data, codec, key, os.path.join(run_dir, f"run{i}"))))
+        while pending:
+            runs.append(pending.popleft().result())
+    return runs
+
+
+def _read_records(path, codec, block_bytes):
+    """Yields the records of a run file, reading block_bytes at a time."""
+    with open(path, 'rb') as f:
+        for data in _read_blocks(f, codec, block_bytes):
+            yield from codec.decode(data)
+
+
+def _merge_runs(paths, output_path, codec, key, memory_limit):
+    """K-way merges sorted run files into output_path and removes them."""
+    # Half the budget buffers the inputs, the rest covers decoded records
+    block_bytes = max(memory_limit // (2 * len(paths)), MIN_READ_BYTES)
+    streams = [_read_records(path, codec, block_bytes) for path in paths]
+    
+    # heapq.merge breaks ties by stream order, so earlier runs win as in merge()
+    merged = heapq.merge(*streams, key=key)
+    with open(output_path, 'wb') as out:
+        while True:
+            batch = list(islice(merged, WRITE_BATCH))
+            if not batch:
+                break
+            out.write(codec.encode(batch))
+    
+    for path in paths:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    # Sort a file of words with a memory limit far below its size
+    import random
+    
+    words = [''.join(random.choices('abcdefgh', k=random.randint(1, 6))) for _ in range(100000)]
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'words.txt')
+        target = os.path.join(tmp, 'sorted.txt')
+        with open(source, 'w') as f:
+            f.write('\n'.join(words) + '\n')
+        
+        count = external_sort(source, target, key=len, memory_limit=1 << 16)
+        with open(target) as f:
+            result = f.read().split('\n')[:-1]
+        print(f"Sorted {count} words by length with a 64 KiB budget")
+        print(f"Matches sorted(key=len): {result == sorted(words, key=len)}")
+        print(f"Shortest: {result[:5]}, longest: {result[-3:]}")
+        
+        pairs = [(random.randint(0, 99), float(i)) for i in range(1000)]
+        with open(source, 'wb') as f:
+            f.write(StructCodec('=qd').encode(pairs))
+        external_sort(source, target, codec=StructCodec('=qd'), memory_limit=1 << 10)
+        with open(target, 'rb') as f:
+            print(f"Binary records match sorted(): {StructCodec('=qd').decode(f.read()) == sorted(pairs)}")
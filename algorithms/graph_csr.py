@@ -0,0 +1,385 @@
+"""
+Compressed Sparse Row (CSR) Graph Representation
+Stores adjacency as flat offset/target/weight buffers instead of a
+dictionary of lists, so traversals index integer arrays rather than
+hashing vertex labels on every edge.
+Space Complexity: O(V + E)
+"""
+
+from array import array
+from itertools import repeat
+from numbers import Real
+from operator import index as as_int
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; buffers are plain arrays either way
+    np = None
+
+
+class CSRGraph:
+    """
+    Directed graph in compressed sparse row form.
+    
+    Vertex labels are interned to ids 0..n-1. The outgoing edges of vertex
+    id u occupy positions offsets[u] to offsets[u + 1] - 1 of targets (and
+    of weights, for weighted graphs).
+    
+    Attributes:
+        offsets: array('q') of length n + 1 with edge start positions
+        targets: array('q') of length E with target vertex ids
+        weights: array of length E with edge weights, or None if unweighted
+            (buffers may also be memoryviews, e.g. over a mapped file)
+        labels: List mapping vertex id to original label, or range(n) when
+            every vertex is labelled by its own id
+        index: Dictionary mapping original label to vertex id, or None for
+            identity labels, which need no per-vertex objects
+    """
+    
+    def __init__(self, offsets, targets, weights=None, labels=None):
+        """
+        Wraps existing CSR buffers.
+        
+        Args:
+            offsets: Sequence of n + 1 edge start positions
+            targets: Sequence of E target vertex ids
+            weights: Sequence of E edge weights, or None if unweighted
+            labels: Vertex labels by id (defaults to the ids themselves)
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        n = len(offsets) - 1
+        if labels is None or isinstance(labels, range) and labels == range(n):
+            # Ids stand for themselves, so graphs too large for a label
+            # dictionary need no per-vertex objects at all
+            self.labels = range(n)
+            self.index = None
+        else:
+            self.labels = labels
+            self.index = {label: i for i, label in enumerate(labels)}
+    
+    @classmethod
+    def from_dict(cls, graph, weighted=None):
+        """
+        Builds a CSR graph from a dictionary adjacency list in one pass.
+        
+        Args:
+            graph: Dictionary where graph[u] = [v, ...] or [(v, weight), ...]
+            weighted: Whether edges are (v, weight) pairs; detected from the
+                first edge when None, which counts as a pair only if it is
+                not itself a vertex and its second item is a number (pass
+                it explicitly for tuple labels such as grid coordinates)
+        
+        Returns:
+            CSRGraph with the same vertices and edge order as graph
+        """
+        if weighted is None:
+            weighted = _detect_weighted(graph)
+        
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weight_list = []
+        
+        for edges in graph.values():
+            for edge in edges:
+                if weighted:
+                    neighbor, weight = edge
+                    weight_list.append(weight)
+                else:
+                    neighbor = edge
+                
+                # Intern vertices that only appear as edge targets
+                vertex_id = index.get(neighbor)
+                if vertex_id is None:
+                    vertex_id = index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                targets.append(vertex_id)
+            offsets.append(len(targets))
+        
+        # Target-only vertices have no outgoing edges
+        offsets.extend([len(targets)] * (len(labels) + 1 - len(offsets)))
+        
+        weights = None
+        if weighted:
+            # Keep integer weights integral so distances keep their type
+            typecode = 'q' if all(isinstance(w, int) for w in weight_list) else 'd'
+            weights = array(typecode, weight_list)
+        
+        return cls(offsets, targets, weights, labels)
+    
+    @property
+    def num_vertices(self):
+        """Number of vertices."""
+        return len(self.offsets) - 1
+    
+    @property
+    def num_edges(self):
+        """Number of directed edges."""
+        return len(self.targets)
+    
+    @property
+    def weight_typecode(self):
+        """Array typecode of the weights ('q' or 'd'), or None if unweighted."""
+        if self.weights is None:
+            return None
+        # Buffers may be arrays or memoryviews over a mapped file
+        return getattr(self.weights, 'typecode', None) or self.weights.format
+    
+    def reverse(self):
+        """
+        Builds the transposed graph, whose edges are this graph's in-edges.
+        Time Complexity: O(V + E)
+        
+        Returns:
+            CSRGraph with every edge reversed and the same vertex ids/labels
+        """
+        n = self.num_vertices
+        
+        if np is not None:
+            offsets, targets, weights = self.as_numpy()
+            sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+            order = np.argsort(targets, kind='stable')
+            rev_offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(targets, minlength=n), out=rev_offsets[1:])
+            rev_weights = None
+            if weights is not None:
+                rev_weights = array(self.weight_typecode, weights[order].tobytes())
+            return CSRGraph(
+                array('q', rev_offsets.tobytes()),
+                array('q', sources[order].tobytes()),
+                rev_weights,
+                self.labels,
+            )
+        
+        # Counting sort of edges by target
+        rev_offsets = array('q', [0]) * (n + 1)
+        for target in self.targets:
+            rev_offsets[target + 1] += 1
+        for v in range(n):
+            rev_offsets[v + 1] += rev_offsets[v]
+        
+        fill = rev_offsets[:-1]
+        rev_targets = array('q', [0]) * self.num_edges
+        rev_weights = None if self.weights is None else array(self.weight_typecode, self.weights)
+        for source in range(n):
+            for edge in range(self.offsets[source], self.offsets[source + 1]):
+                target = self.targets[edge]
+                position = fill[target]
+                fill[target] = position + 1
+                rev_targets[position] = source
+                if rev_weights is not None:
+                    rev_weights[position] = self.weights[edge]
+        
+        return CSRGraph(rev_offsets, rev_targets, rev_weights, self.labels)
+    
+    def permute(self, order):
+        """
+        Renumbers the vertices, e.g. into a locality-improving order.
+        Every vertex keeps its label and its out-edges in their original order.
+        Time Complexity: O(V + E)
+        
+        Args:
+            order: Sequence of every vertex id exactly once, where order[i]
+                becomes vertex id i
+        
+        Returns:
+            CSRGraph with the vertices renumbered
+        
+        Raises:
+            ValueError: If order is not a permutation of the vertex ids
+        """
+        n = self.num_vertices
+        if len(order) != n or len(set(order)) != n or (n and not 0 <= min(order) <= max(order) < n):
+            raise ValueError("order must list every vertex id exactly once")
+        labels = [self.labels[old] for old in order]
+        
+        if np is not None:
+            offsets, targets, weights = self.as_numpy()
+            old_ids = np.asarray(order, dtype=np.int64)
+            new_id = np.empty(n, dtype=np.int64)
+            new_id[old_ids] = np.arange(n)
+            degrees = np.diff(offsets)[old_ids]
+            new_offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(degrees, out=new_offsets[1:])
+            
+            # Old position of each new edge slot, copied vertex by vertex
+            shift = np.repeat(offsets[old_ids] - new_offsets[:-1], degrees)
+            positions = np.arange(self.num_edges, dtype=np.int64) + shift
+            new_weights = None
+            if weights is not None:
+                new_weights = array(self.weight_typecode, weights[positions].tobytes())
+            return CSRGraph(
+                array('q', new_offsets.tobytes()),
+                array('q', new_id[targets[positions]].tobytes()),
+                new_weights,
+                labels,
+            )
+        
+        new_id = array('q', [0]) * n
+        for i, old in enumerate(order):
+            new_id[old] = i
+        
+        new_offsets = array('q', [0])
+        new_targets = array('q')
+        new_weights = None if self.weights is None else array(self.weight_typecode)
+        for old in order:
+            begin, end = self.offsets[old], self.offsets[old + 1]
+            new_targets.extend([new_id[target] for target in self.targets[begin:end]])
+            if new_weights is not None:
+                new_weights.extend(self.weights[begin:end])
+            new_offsets.append(len(new_targets))
+        
+        return CSRGraph(new_offsets, new_targets, new_weights, labels)
+    
+    def as_numpy(self):
+        """
+        Returns zero-copy NumPy views of the CSR buffers.
+        
+        Returns:
+            Tuple of (offsets, targets, weights) NumPy arrays, with weights
+            None for unweighted graphs
+        
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("CSRGraph.as_numpy requires NumPy")
+        weights = None if self.weights is None else np.asarray(self.weights)
+        return np.asarray(self.offsets), np.asarray(self.targets), weights
+    
+    def vertex_id(self, label):
+        """
+        Looks up the interned id of a vertex label.
+        
+        Args:
+            label: Original vertex label
+        
+        Returns:
+            Integer vertex id
+        
+        Raises:
+            KeyError: If label is not a vertex of the graph
+        """
+        if self.index is not None:
+            return self.index[label]
+        try:
+            vertex_id = as_int(label)
+        except TypeError:
+            raise KeyError(label) from None
+        if not 0 <= vertex_id < self.num_vertices:
+            raise KeyError(label)
+        return vertex_id
+    
+    def label(self, vertex_id):
+        """
+        Returns the original label of a vertex id (the id itself for
+        identity-labelled graphs).
+        """
+        return self.labels[vertex_id]
+    
+    def neighbors(self, vertex_id):
+        """
+        Returns the target ids of a vertex's outgoing edges.
+        
+        Args:
+            vertex_id: Integer vertex id
+        
+        Returns:
+            Slice of targets for this vertex
+        """
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+    
+    def weighted_edges(self, vertex_id):
+        """
+        Returns a vertex's outgoing edges as (target id, weight) pairs.
+        Unweighted graphs report a weight of 1 for every edge.
+        
+        Args:
+            vertex_id: Integer vertex id
+        
+        Returns:
+            Iterable of (target id, weight) tuples
+        """
+        begin, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        if self.weights is None:
+            return zip(self.targets[begin:end], repeat(1))
+        return zip(self.targets[begin:end], self.weights[begin:end])
+    
+    def __len__(self):
+        return self.num_vertices
+    
+    def __contains__(self, label):
+        if self.index is not None:
+            return label in self.index
+        try:
+            self.vertex_id(label)
+        except KeyError:
+            return False
+        return True
+    
+    def __repr__(self):
+        return f"CSRGraph(vertices={self.num_vertices}, edges={self.num_edges}, weighted={self.weights is not None})"
+
+
+def transpose(graph, weighted=None):
+    """
+    Reverses every edge of a graph, giving the in-edges that backward
+    searches on directed graphs follow.
+    Time Complexity: O(V + E)
+    
+    Args:
+        graph: CSRGraph, or dictionary where graph[u] = [v, ...] or
+            [(v, weight), ...]
+        weighted: Whether dictionary edges are (v, weight) pairs; detected
+            as in CSRGraph.from_dict when None
+    
+    Returns:
+        graph.reverse() for a CSRGraph, otherwise a dictionary with an
+        entry for every vertex and edges in the same form as graph
+    """
+    if isinstance(graph, CSRGraph):
+        return graph.reverse()
+    if weighted is None:
+        weighted = _detect_weighted(graph)
+    
+    reverse = {vertex: [] for vertex in graph}
+    for vertex, edges in graph.items():
+        for edge in edges:
+            if weighted:
+                neighbor, weight = edge
+                reverse.setdefault(neighbor, []).append((vertex, weight))
+            else:
+                reverse.setdefault(edge, []).append(vertex)
+    return reverse
+
+
+def _detect_weighted(graph):
+    """
+    Guesses from the first edge whether a dictionary graph's edges are
+    (v, weight) pairs: a 2-tuple counts only if it is not itself a vertex
+    and its second item is a number.
+    """
+    first = next((edges[0] for edges in graph.values() if edges), None)
+    return (isinstance(first, tuple) and len(first) == 2
+            and first not in graph and isinstance(first[1], Real))
+
+
+if __name__ == "__main__":
+    # Test CSR conversion
+    graph = {
+        'A': [('B', 4), ('C', 2)],
+        'B': [('C', 1), ('D', 5)],
+        'C': [('D', 8), ('E', 10)],
+        'D': [('E', 2)]
+    }
+    
+    csr = CSRGraph.from_dict(graph)
+    print(csr)
+    print(f"Labels: {csr.labels}")
+    print(f"Offsets: {list(csr.offsets)}")
+    print(f"Targets: {list(csr.targets)}")
+    print(f"Weights: {list(csr.weights)}")
+    print(f"Neighbors of 'A': {[csr.labels[v] for v in csr.neighbors(csr.vertex_id('A'))]}")
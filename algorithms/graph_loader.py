@@ -0,0 +1,408 @@
+"""
+Streaming Graph Loader
+Builds a CSRGraph straight from edge-list files without an intermediate
+dictionary. Text files are parsed in chunks of lines while vertex labels
+are interned to ids, and edges are accumulated in flat arrays that are
+bucketed by source with a counting sort. The result can be saved on disk
+as raw CSR buffers, optionally renumbered for locality, that later loads
+memory-map instead of parsing again, so traversals can run on graphs
+whose edges do not fit in memory.
+Time Complexity: O(V + E) per load, O(V) to reopen a cache
+Space Complexity: O(V + E)
+"""
+
+import json
+import mmap
+import os
+import pickle
+import struct
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; CSR construction falls back to Python
+    np = None
+
+from graph_csr import CSRGraph
+from graph_ordering import bfs_order, rcm_order
+
+# Bytes of text read per parsing chunk
+CHUNK_BYTES = 1 << 22
+
+# Edges per read when streaming binary edge files
+BINARY_CHUNK_EDGES = 1 << 18
+
+CACHE_SUFFIX = '.csr'
+_CACHE_FORMAT = 1
+
+# Vertex renumberings available to save_csr
+_ORDERINGS = {'bfs': bfs_order, 'rcm': rcm_order}
+
+def load_edge_list(path, weighted=None, directed=True, label_type=str, delimiter=None,
+                   comment='#', cache=False):
+    """
+    Loads a text edge list, one "u v" or "u v weight" edge per line.
+    A line with a single label adds an isolated vertex; blank lines and
+    lines starting with comment are skipped.
+    
+    Args:
+        path: Path of the edge-list file
+        weighted: Whether lines carry a weight column; detected from the
+            first edge when None
+        directed: False to add every edge in both directions
+        label_type: Function converting a label token, e.g. int
+        delimiter: Column separator (None splits on any whitespace);
+            whitespace around each column is ignored
+        comment: Prefix marking comment lines ('' or None for none)
+        cache: Whether to reuse, or create, a memory-mapped CSR cache
+            stored next to the file at path + CACHE_SUFFIX
+    
+    Returns:
+        CSRGraph with vertices in order of first appearance and edges in
+        file order per source; integer weights stay integral
+    
+    Raises:
+        ValueError: If a line has the wrong number of columns
+    """
+    comment = comment or None
+    options = ['text', weighted, directed, label_type.__name__, delimiter, comment]
+    if cache:
+        graph = _open_cache(path, options)
+        if graph is not None:
+            return graph
+    
+    index = {}
+    sources = array('q')
+    targets = array('q')
+    weights = array('q')
+    
+    with open(path) as f:
+        for lines in iter(lambda: f.readlines(CHUNK_BYTES), []):
+            if weighted is None:
+                split = (_split_line(line, delimiter, comment) for line in lines)
+                first = next((fields for fields in split if fields is not None and len(fields) > 1), None)
+                weighted = None if first is None else len(first) == 3
+            width = 3 if weighted else 2
+            
+            # Fast path: a whitespace-separated chunk of well-formed edge lines
+            # is split in one call and interned column-wise
+            text = ''.join(lines)
+            if (delimiter is None and (comment is None or comment not in text)
+                    and set(map(len, map(str.split, lines))) == {width}):
+                tokens = text.split()
+                if weighted:
+                    weights = _extend_weights(weights, tokens[2::3])
+                    del tokens[2::3]
+                labels = list(map(label_type, tokens))
+                for label in dict.fromkeys(labels):
+                    if label not in index:
+                        index[label] = len(index)
+                ids = list(map(index.__getitem__, labels))
+                sources.extend(ids[0::2])
+                targets.extend(ids[1::2])
+                continue
+            
+            for line in lines:
+                fields = _split_line(line, delimiter, comment)
+                if fields is None:
+                    continue
+                if len(fields) == 1:
+                    index.setdefault(label_type(fields[0]), len(index))
+                    continue
+                if len(fields) != width:
+                    raise ValueError(f"Malformed edge line: {line.rstrip()!r}")
+                
+                sources.append(index.setdefault(label_type(fields[0]), len(index)))
+                targets.append(index.setdefault(label_type(fields[1]), len(index)))
+                if weighted:
+                    weights = _extend_weights(weights, fields[2:])
+    
+    graph = _build_csr(len(index), sources, targets, weights if weighted else None, directed, list(index))
+    if cache:
+        save_csr(graph, path + CACHE_SUFFIX, _cache_stamp(path, options))
+    return graph
+
+
+def _split_line(line, delimiter, comment):
+    """Returns the stripped columns of an edge-list line, or None for blank and comment lines."""
+    line = line.strip()
+    if not line or (comment is not None and line.startswith(comment)):
+        return None
+    if delimiter is None:
+        return line.split()
+    return [field.strip() for field in line.split(delimiter)]
+
+
+def load_binary_edges(path, weighted=False, directed=True, cache=False):
+    """
+    Loads a binary edge file of native-endian records: int64 source id,
+    int64 target id and, if weighted, a float64 weight. Vertex ids are
+    used as labels, and the graph has max id + 1 vertices.
+    
+    Args:
+        path: Path of the binary edge file
+        weighted: Whether records carry a weight
+        directed: False to add every edge in both directions
+        cache: Whether to reuse, or create, a memory-mapped CSR cache
+    
+    Returns:
+        CSRGraph with edges in file order per source
+    
+    Raises:
+        ValueError: If the file size is not a whole number of records
+    """
+    options = ['binary', weighted, directed]
+    if cache:
+        graph = _open_cache(path, options)
+        if graph is not None:
+            return graph
+    
+    fields = 3 if weighted else 2
+    if os.path.getsize(path) % (8 * fields):
+        raise ValueError(f"{path} is not a whole number of {8 * fields}-byte edge records")
+    
+    sources = array('q')
+    targets = array('q')
+    weights = array('d') if weighted else None
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(8 * fields * BINARY_CHUNK_EDGES), b''):
+            records = array('q', chunk)
+            sources.extend(records[0::fields])
+            targets.extend(records[1::fields])
+            if weighted:
+                # Weights share the int64 slots; reinterpret their bytes
+                weights.frombytes(records[2::fields].tobytes())
+    
+    n = max(max(sources, default=-1), max(targets, default=-1)) + 1
+    graph = _build_csr(n, sources, targets, weights, directed, None)
+    if cache:
+        save_csr(graph, path + CACHE_SUFFIX, _cache_stamp(path, options))
+    return graph
+
+
+def write_binary_edges(path, edges, weighted=False):
+    """
+    Writes edges in the format read by load_binary_edges.
+    
+    Args:
+        path: Output path
+        edges: Iterable of (u, v) or, if weighted, (u, v, weight) with
+            integer vertex ids
+        weighted: Whether edges carry a weight
+    """
+    record = struct.Struct('=qqd' if weighted else '=qq')
+    with open(path, 'wb') as f:
+        for edge in edges:
+            f.write(record.pack(*edge))
+
+
+def save_csr(graph, path, stamp=None, reorder=None):
+    """
+    Saves a CSRGraph as a directory of raw buffers that load_csr maps.
+    The layout is offsets.bin, targets.bin and weights.bin (native int64 or
+    float64), labels.pkl and meta.json, written last so that an interrupted
+    save is never mistaken for a complete one.
+    
+    Args:
+        graph: CSRGraph to save
+        path: Directory to write (created if missing)
+        stamp: Optional JSON-serializable value stored in meta.json, used
+            to check that a cache still matches its source
+        reorder: None to keep vertex ids, or 'bfs' / 'rcm' to renumber
+            vertices so neighbors sit close together on disk; labels are
+            kept, so lookups by label are unaffected
+    
+    Raises:
+        ValueError: If reorder is unknown
+    """
+    if reorder is not None:
+        if reorder not in _ORDERINGS:
+            raise ValueError(f"Unknown reorder: {reorder!r}")
+        graph = graph.permute(_ORDERINGS[reorder](graph))
+    
+    os.makedirs(path, exist_ok=True)
+    meta_path = os.path.join(path, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    
+    buffers = [('offsets', graph.offsets), ('targets', graph.targets)]
+    if graph.weights is not None:
+        buffers.append(('weights', graph.weights))
+    for name, buffer in buffers:
+        # Replace rather than overwrite, since an older copy may still be mapped
+        target = os.path.join(path, name + '.bin')
+        with open(target + '.tmp', 'wb') as f:
+            f.write(buffer)
+        os.replace(target + '.tmp', target)
+    
+    # Identity labels (as from binary edge files) are not stored
+    labels = None if graph.index is None or graph.labels == list(range(graph.num_vertices)) else graph.labels
+    with open(os.path.join(path, 'labels.pkl'), 'wb') as f:
+        pickle.dump(labels, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    meta = {
+        'format': _CACHE_FORMAT,
+        'num_vertices': graph.num_vertices,
+        'num_edges': graph.num_edges,
+        'weights': graph.weight_typecode,
+        'reorder': reorder,
+        'stamp': stamp,
+    }
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+
+
+def load_csr(path):
+    """
+    Opens a graph saved by save_csr.
+    The offset, target and weight buffers are memory-mapped read-only, so
+    opening costs O(V) for stored labels, and O(1) for identity-labelled
+    graphs, regardless of the number of edges, and pages are read from disk only as traversals touch them. The
+    memoryviews index like arrays in the pure-Python traversals, and
+    CSRGraph.as_numpy wraps them without copying for the NumPy ones.
+    
+    Args:
+        path: Directory written by save_csr
+    
+    Returns:
+        CSRGraph whose buffers are memoryviews over the mapped files
+    
+    Raises:
+        FileNotFoundError: If path holds no complete saved graph
+    """
+    meta = _read_meta(path)
+    if meta is None:
+        raise FileNotFoundError(f"No saved graph in {path}")
+    
+    offsets = _map_buffer(os.path.join(path, 'offsets.bin'), 'q')
+    targets = _map_buffer(os.path.join(path, 'targets.bin'), 'q')
+    weights = None
+    if meta['weights'] is not None:
+        weights = _map_buffer(os.path.join(path, 'weights.bin'), meta['weights'])
+    with open(os.path.join(path, 'labels.pkl'), 'rb') as f:
+        labels = pickle.load(f)
+    
+    return CSRGraph(offsets, targets, weights, labels)
+
+
+def _build_csr(n, sources, targets, weights, directed, labels):
+    """Buckets flat edge arrays by source into a CSRGraph, keeping edge order within each source."""
+    if not directed:
+        sources, targets = sources + targets, targets + sources
+        if weights is not None:
+            weights = weights + weights
+    
+    if np is not None:
+        src = np.frombuffer(sources, dtype=np.int64)
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        csr_targets = array('q', np.frombuffer(targets, dtype=np.int64)[order].tobytes())
+        csr_weights = None
+        if weights is not None:
+            dtype = np.int64 if weights.typecode == 'q' else np.float64
+            csr_weights = array(weights.typecode, np.frombuffer(weights, dtype=dtype)[order].tobytes())
+        return CSRGraph(array('q', offsets.tobytes()), csr_targets, csr_weights, labels)
+    
+    # Counting sort by source
+    offsets = array('q', [0]) * (n + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for v in range(n):
+        offsets[v + 1] += offsets[v]
+    
+    fill = offsets[:-1]
+    csr_targets = array('q', [0]) * len(targets)
+    csr_weights = None if weights is None else array(weights.typecode, weights)
+    for edge, source in enumerate(sources):
+        position = fill[source]
+        fill[source] = position + 1
+        csr_targets[position] = targets[edge]
+        if csr_weights is not None:
+            csr_weights[position] = weights[edge]
+    
+    return CSRGraph(offsets, csr_targets, csr_weights, labels)
+
+
+def _extend_weights(weights, column):
+    """
+    Appends parsed weight strings, keeping int64 weights until the first
+    fractional one and float64 from then on.
+    
+    Returns:
+        The weights array, which is replaced when it switches to float64
+    """
+    if weights.typecode == 'q':
+        try:
+            weights.extend(list(map(int, column)))
+            return weights
+        except ValueError:
+            weights = array('d', weights)
+    weights.extend(map(float, column))
+    return weights
+
+
+def _cache_stamp(path, options):
+    """Identifies a source file version and the options it was loaded with."""
+    status = os.stat(path)
+    return {'size': status.st_size, 'mtime_ns': status.st_mtime_ns, 'options': options}
+
+
+def _open_cache(path, options):
+    """Returns the cached graph for path if it matches the file and options, else None."""
+    cache_path = path + CACHE_SUFFIX
+    meta = _read_meta(cache_path)
+    if meta is None or meta['stamp'] != _cache_stamp(path, options):
+        return None
+    return load_csr(cache_path)
+
+
+def _read_meta(path):
+    """Reads a saved graph's meta.json, or returns None if missing or from another format version."""
+    try:
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return meta if meta.get('format') == _CACHE_FORMAT else None
+
+
+def _map_buffer(path, typecode):
+    """Memory-maps a raw buffer file read-only as a memoryview of typecode items."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return array(typecode)  # Empty files cannot be mapped
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(typecode)
+
+
+if __name__ == "__main__":
+    # Test loading an edge list, with and without the cache
+    import tempfile
+    import time
+    
+    from bfs import bfs
+    from dijkstra import dijkstra
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'roads.txt')
+        with open(path, 'w') as f:
+            f.write("# from to minutes\n")
+            f.write("A B 4\nA C 2\nB C 1\nB D 5\nC D 8\nC E 10\nD E 2\n")
+        
+        graph = load_edge_list(path, directed=False)
+        print(graph)
+        print("BFS from 'A':", bfs(graph, 'A'))
+        print("Dijkstra from 'A':", dijkstra(graph, 'A'))
+        
+        for attempt in ('first', 'second'):
+            start = time.perf_counter()
+            cached = load_edge_list(path, directed=False, cache=True)
+            print(f"{attempt} cached load: {(time.perf_counter() - start) * 1e3:.2f} ms, "
+                  f"offsets are {type(cached.offsets).__name__}")
+        print("Dijkstra from 'A' on the cached graph:", dijkstra(cached, 'A'))
+        
+        binary_path = os.path.join(tmp, 'edges.bin')
+        write_binary_edges(binary_path, [(0, 1, 0.5), (1, 2, 1.5), (0, 2, 3.0)], weighted=True)
+        print("\nBinary edges:", load_binary_edges(binary_path, weighted=True))
+        print("Dijkstra from 0:", dijkstra(load_binary_edges(binary_path, weighted=True), 0))
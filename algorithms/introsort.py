@@ -0,0 +1,156 @@
+"""
+Introsort (Introspective Sort)
+Hybrid in-place sort: quicksort with median-of-three (ninther for large
+ranges) pivots, switching to heapsort once a range has been partitioned
+too many times, and to insertion sort for small ranges. Sorts a single
+buffer in place with an explicit stack instead of recursion.
+Time Complexity: O(n log n) worst case
+Space Complexity: O(log n) for the stack of pending ranges
+"""
+
+import math
+
+# Ranges at most this long are finished with insertion sort
+INSERTION_SORT_CUTOFF = 16
+
+# Ranges longer than this pick the pivot as a median of three medians
+NINTHER_THRESHOLD = 128
+
+def introsort(arr, low=0, high=None):
+    """
+    Sorts arr[low:high] in place.
+    
+    Args:
+        arr: List (or other mutable sequence, e.g. an array) of comparable elements
+        low: Start of the range to sort
+        high: End of the range to sort, exclusive (defaults to len(arr))
+    
+    Returns:
+        arr, sorted in ascending order within the range
+    """
+    if high is None:
+        high = len(arr)
+    if high - low < 2:
+        return arr
+    
+    # Past this many levels of partitioning, quicksort is degenerating
+    depth_limit = 2 * int(math.log2(high - low))
+    stack = [(low, high, depth_limit)]
+    
+    while stack:
+        lo, hi, depth = stack.pop()
+        
+        while hi - lo > INSERTION_SORT_CUTOFF:
+            if depth == 0:
+                _heapsort(arr, lo, hi)
+                break
+            depth -= 1
+            
+            split = _partition(arr, lo, hi)
+            
+            # Keep working on the smaller side so the stack stays O(log n)
+            if split - lo < hi - split:
+                stack.append((split, hi, depth))
+                hi = split
+            else:
+                stack.append((lo, split, depth))
+                lo = split
+        else:
+            _insertion_sort(arr, lo, hi)
+    
+    return arr
+
+
+def _partition(arr, lo, hi):
+    """
+    Hoare partition of arr[lo:hi] around a median-of-three or ninther pivot.
+    
+    Returns:
+        Split index s with lo < s < hi, every element of arr[lo:s] <= pivot
+        and every element of arr[s:hi] >= pivot
+    """
+    last = hi - 1
+    mid = lo + (hi - lo) // 2
+    if hi - lo > NINTHER_THRESHOLD:
+        step = (hi - lo) // 8
+        _median_of_three(arr, lo, lo + step, lo + 2 * step)
+        _median_of_three(arr, mid - step, mid, mid + step)
+        _median_of_three(arr, last - 2 * step, last - step, last)
+        _median_of_three(arr, lo + step, mid, last - step)
+    else:
+        _median_of_three(arr, lo, mid, last)
+    
+    # The pivot sits at mid < last, which keeps both sides non-empty
+    pivot = arr[mid]
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def _median_of_three(arr, a, b, c):
+    """Orders arr[a], arr[b], arr[c] so that arr[b] holds their median."""
+    if arr[b] < arr[a]:
+        arr[a], arr[b] = arr[b], arr[a]
+    if arr[c] < arr[b]:
+        arr[b], arr[c] = arr[c], arr[b]
+        if arr[b] < arr[a]:
+            arr[a], arr[b] = arr[b], arr[a]
+
+
+def _insertion_sort(arr, lo, hi):
+    """Sorts the short range arr[lo:hi] in place by insertion."""
+    for i in range(lo + 1, hi):
+        item = arr[i]
+        j = i - 1
+        while j >= lo and item < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = item
+
+
+def _heapsort(arr, lo, hi):
+    """Sorts arr[lo:hi] in place with a max-heap rooted at lo."""
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _sift_down(arr, lo, root, size):
+    """Moves the heap entry at root down until both children are no larger."""
+    item = arr[lo + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not item < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = item
+
+
+if __name__ == "__main__":
+    # Test introsort
+    test_array = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Original array: {test_array}")
+    print(f"Sorted array: {introsort(test_array.copy())}")
+    
+    import random
+    large = [random.randint(0, 100) for _ in range(10000)]
+    print("Large array with duplicates sorted correctly:", introsort(large.copy()) == sorted(large))
+    
+    partial = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    print(f"Sorting only indices 2-6 of {partial}: {introsort(partial, 2, 7)}")
@@ -4,9 +4,27 @@ Time Complexity: O(n)
 Space Complexity: O(1)
 """
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from numpy_backend import search_all, search_first
+
+# Sequences whose index(value, start) compares whole elements in C
+INDEXABLE = (list, tuple, array)
+
+# Elements read from an iterable per C-level scan in linear_search_iter
+STREAM_CHUNK = 1 << 12
+
+# Arrays shorter than this are scanned in-process; the pool costs more than it saves
+PARALLEL_MIN_SIZE = 1 << 20
+
 def linear_search(arr, target):
     """
     Searches for a target value in an array using linear search.
+    Numeric arrays (NumPy or array.array) are compared all at once with
+    a NumPy mask; lists, tuples and arrays are scanned by their C-level
+    index method.
     
     Args:
         arr: List of elements
@@ -15,23 +33,50 @@ def linear_search(arr, target):
     Returns:
         Index of target if found, -1 otherwise
     """
+    result = search_first(arr, target)
+    if result is not None:
+        return result
+    
+    if isinstance(arr, INDEXABLE):
+        try:
+            return arr.index(target)
+        except ValueError:
+            return -1
+    
     for i in range(len(arr)):
         if arr[i] == target:
             return i
     return -1
 
 
-def linear_search_all(arr, target):
+def linear_search_all(arr, target, workers=None):
     """
     Finds all occurrences of a target value in an array.
+    Numeric arrays (NumPy or array.array) are compared all at once with
+    a NumPy mask; lists, tuples and arrays are scanned by their C-level
+    index method from one match to the next.
     
     Args:
         arr: List of elements
         target: Element to search for
+        workers: Number of worker processes scanning chunks of arr (None
+            or 1 scans in-process); used for arrays of at least
+            PARALLEL_MIN_SIZE elements, which must then be picklable
     
     Returns:
         List of indices where target is found
     """
+    workers = 1 if workers is None else max(1, workers)
+    if workers > 1 and len(arr) >= PARALLEL_MIN_SIZE:
+        return _search_all_parallel(arr, target, workers)
+    
+    result = search_all(arr, target)
+    if result is not None:
+        return result
+    
+    if isinstance(arr, INDEXABLE):
+        return list(_index_all(arr, target))
+    
     indices = []
     for i in range(len(arr)):
         if arr[i] == target:
@@ -39,6 +84,60 @@ def linear_search_all(arr, target):
     return indices
 
 
+def linear_search_iter(iterable, target):
+    """
+    Lazily finds all occurrences of a target value in any iterable,
+    including generators and files, without materializing it. Elements
+    are read STREAM_CHUNK at a time and each chunk is scanned in C.
+    
+    Args:
+        iterable: Iterable of elements
+        target: Element to search for
+    
+    Yields:
+        Indices where target is found, in order
+    """
+    iterator = iter(iterable)
+    offset = 0
+    while True:
+        chunk = list(islice(iterator, STREAM_CHUNK))
+        if not chunk:
+            return
+        for i in _index_all(chunk, target):
+            yield offset + i
+        offset += len(chunk)
+
+
+def _index_all(seq, target):
+    """Yields the indices of target in seq, scanning between matches with seq.index."""
+    index = seq.index
+    i = -1
+    try:
+        while True:
+            i = index(target, i + 1)
+            yield i
+    except ValueError:
+        return
+
+
+def _search_all_parallel(arr, target, workers):
+    """Scans one chunk of arr per worker and joins their indices in order."""
+    n = len(arr)
+    bounds = [n * i // workers for i in range(workers + 1)]
+    tasks = [(arr[lo:hi], target, lo) for lo, hi in zip(bounds, bounds[1:])]
+    indices = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_indices in executor.map(_scan_chunk, tasks):
+            indices.extend(chunk_indices)
+    return indices
+
+
+def _scan_chunk(task):
+    """Returns the indices of target in one chunk, shifted by the chunk's offset."""
+    chunk, target, offset = task
+    return [offset + i for i in linear_search_all(chunk, target)]
+
+
 if __name__ == "__main__":
     # Test the linear search algorithm
     test_array = [64, 34, 25, 12, 22, 11, 90, 25]
@@ -56,3 +155,12 @@ if __name__ == "__main__":
     # Find all occurrences
     all_indices = linear_search_all(test_array, target)
     print(f"All occurrences at indices: {all_indices}")
+    
+    # Search a generator lazily, stopping after the first two matches
+    squares_mod_7 = (i * i % 7 for i in range(10 ** 9))
+    matches = linear_search_iter(squares_mod_7, 2)
+    print(f"First two squares that are 2 mod 7 at indices: {next(matches)}, {next(matches)}")
+    
+    # Scan a large list in two worker processes
+    large = [i % 1000 for i in range(PARALLEL_MIN_SIZE)]
+    print(f"Parallel scan matches: {linear_search_all(large, 7, workers=2) == linear_search_all(large, 7)}")
@@ -1,19 +1,68 @@
 """
 Merge Sort Algorithm
-Time Complexity: O(n log n) in all cases
+Time Complexity: O(n log n) in all cases, O(n) on presorted runs with the
+bottom-up engine
 Space Complexity: O(n)
 """
 
-def merge_sort(arr):
+from bisect import bisect_left, bisect_right
+
+from introsort import introsort
+from numpy_backend import argsort_keys, sorted_list
+from parallel_sort import sample_sort
+
+# Natural runs shorter than this are extended by binary insertion
+MIN_RUN = 32
+
+# Elements taken in a row from one side before a merge gallops with bisect
+MIN_GALLOP = 7
+
+def merge_sort(arr, engine='auto', key=None):
     """
     Sorts an array using merge sort algorithm.
     
     Args:
         arr: List of comparable elements
+        engine: 'auto' (a vectorized NumPy sort or argsort for numeric
+            data or keys when NumPy is installed, otherwise 'merge'),
+            'merge' (recursive), 'bottom_up' (iterative over natural
+            runs, ping-ponging between a copy of arr and one auxiliary
+            buffer), 'introsort' to sort a copy in place with the hybrid
+            engine (not stable), or 'parallel' for a sample sort across a
+            process pool (which also accepts and returns NumPy arrays)
+        key: Optional function computed once per element and sorted by
+            instead of the element; equal keys keep their input order
+            with every engine
     
     Returns:
         Sorted list in ascending order
+    
+    Raises:
+        ValueError: If engine is unknown
     """
+    if engine not in ('auto', 'merge', 'bottom_up', 'introsort', 'parallel'):
+        raise ValueError(f"Unknown engine: {engine!r}")
+    if key is not None:
+        # Compute each key once and sort positions by key
+        keys = [key(item) for item in arr]
+        order = argsort_keys(keys) if engine == 'auto' else None
+        if order is None:
+            # The index breaks ties, so elements are never compared
+            decorated = merge_sort(list(zip(keys, range(len(keys)))), 'merge' if engine == 'auto' else engine)
+            order = [i for _, i in decorated]
+        return [arr[i] for i in order]
+    if engine == 'auto':
+        result = sorted_list(arr)
+        if result is not None:
+            return result
+        engine = 'merge'
+    if engine == 'introsort':
+        return introsort(list(arr))
+    if engine == 'bottom_up':
+        return _merge_sort_bottom_up(arr)
+    if engine == 'parallel':
+        return sample_sort(arr)
+    
     if len(arr) <= 1:
         return arr
     
@@ -23,8 +72,8 @@ def merge_sort(arr):
     right = arr[mid:]
     
     # Recursively sort both halves
-    left = merge_sort(left)
-    right = merge_sort(right)
+    left = merge_sort(left, engine)
+    right = merge_sort(right, engine)
     
     # Merge the sorted halves
     return merge(left, right)
@@ -32,7 +81,8 @@ def merge_sort(arr):
 
 def merge(left, right):
     """
-    Merges two sorted arrays into one sorted array.
+    Merges two sorted arrays into one sorted array. Ties are taken from
+    left first.
     
     Args:
         left: Sorted list
@@ -41,23 +91,130 @@ def merge(left, right):
     Returns:
         Merged sorted list
     """
-    result = []
-    i = j = 0
+    if not left or not right:
+        return left + right
+    result = [None] * (len(left) + len(right))
+    _merge_into(left + right, result, 0, len(left), len(result))
+    return result
+
+
+def _merge_sort_bottom_up(arr):
+    """
+    Sorts a copy of arr without recursion. Natural runs are found (and
+    extended to MIN_RUN) in one pass, then adjacent runs are merged pass by
+    pass, alternating between the copy and a single auxiliary buffer.
     
-    # Merge elements in sorted order
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
-            i += 1
+    Returns:
+        Sorted list
+    """
+    n = len(arr)
+    src = list(arr)
+    dst = [None] * n
+    boundaries = _natural_runs(src, n)
+    
+    while len(boundaries) > 2:
+        merged = [0]
+        for r in range(0, len(boundaries) - 2, 2):
+            _merge_into(src, dst, boundaries[r], boundaries[r + 1], boundaries[r + 2])
+            merged.append(boundaries[r + 2])
+        if len(boundaries) % 2 == 0:
+            # Odd number of runs: the last one is carried over unmerged
+            lo = boundaries[-2]
+            dst[lo:] = src[lo:]
+            merged.append(n)
+        boundaries = merged
+        src, dst = dst, src
+    
+    return src
+
+
+def _natural_runs(arr, n):
+    """
+    Splits arr[:n] into sorted runs in place. Strictly descending runs are
+    reversed (which cannot reorder equal elements) and runs shorter than
+    MIN_RUN are extended by binary insertion.
+    
+    Returns:
+        List of run boundaries, starting with 0 and ending with n
+    """
+    boundaries = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and arr[hi] < arr[lo]:
+            while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                hi += 1
+            hi += 1
+            arr[lo:hi] = arr[lo:hi][::-1]
         else:
-            result.append(right[j])
-            j += 1
+            while hi < n and not arr[hi] < arr[hi - 1]:
+                hi += 1
+        
+        end = min(lo + MIN_RUN, n)
+        for i in range(hi, end):
+            item = arr[i]
+            pos = bisect_right(arr, item, lo, i)
+            if pos < i:
+                arr[pos + 1:i + 1] = arr[pos:i]
+                arr[pos] = item
+        hi = max(hi, end)
+        
+        boundaries.append(hi)
+        lo = hi
     
-    # Add remaining elements
-    result.extend(left[i:])
-    result.extend(right[j:])
+    return boundaries
+
+
+def _merge_into(src, dst, lo, mid, hi):
+    """
+    Stably merges the non-empty sorted runs src[lo:mid] and src[mid:hi]
+    into dst[lo:hi]. Once one side has supplied MIN_GALLOP elements in a
+    row, the end of its winning stretch is found with bisect and copied as
+    one slice.
+    """
+    i, j, k = lo, mid, lo
+    a, b = src[i], src[j]
+    # Positive: consecutive elements taken from the left; negative: right
+    streak = 0
+    while True:
+        if b < a:
+            dst[k] = b
+            k += 1
+            j += 1
+            if j == hi:
+                break
+            b = src[j]
+            streak = streak - 1 if streak < 0 else -1
+            if streak == -MIN_GALLOP:
+                end = bisect_left(src, a, j, hi)
+                dst[k:k + end - j] = src[j:end]
+                k += end - j
+                j = end
+                streak = 0
+                if j == hi:
+                    break
+                b = src[j]
+        else:
+            dst[k] = a
+            k += 1
+            i += 1
+            if i == mid:
+                break
+            a = src[i]
+            streak = streak + 1 if streak > 0 else 1
+            if streak == MIN_GALLOP:
+                end = bisect_right(src, b, i, mid)
+                dst[k:k + end - i] = src[i:end]
+                k += end - i
+                i = end
+                streak = 0
+                if i == mid:
+                    break
+                a = src[i]
     
-    return result
+    # One side is exhausted; the rest of the other is already in order
+    dst[k:k + mid - i] = src[i:mid]
+    dst[k + mid - i:hi] = src[j:hi]
 
 
 if __name__ == "__main__":
@@ -66,3 +223,8 @@ if __name__ == "__main__":
     print(f"Original array: {test_array}")
     sorted_array = merge_sort(test_array)
     print(f"Sorted array: {sorted_array}")
+    print(f"Sorted array (introsort engine): {merge_sort(test_array, engine='introsort')}")
+    print(f"Sorted array (bottom-up engine): {merge_sort(test_array, engine='bottom_up')}")
+    
+    words = ["pear", "Fig", "apple", "fig", "Kiwi", "banana"]
+    print(f"Words by lowercase key (stable): {merge_sort(words, engine='bottom_up', key=str.lower)}")
@@ -0,0 +1,247 @@
+"""
+NumPy Backend for Sorting and Searching
+Detects numeric input (one-dimensional NumPy arrays, numeric array.array
+buffers and memoryviews, or lists and tuples holding only ints or only
+floats) and runs the vectorized kernel in place of a pure-Python loop:
+stable sorts and argsorts, searchsorted for sorted data, and boolean
+masks for unsorted data. Results come back as plain Python values so
+callers keep their return contracts. Every function here declines
+(returns None) when NumPy is not installed or the data does not qualify,
+and the caller falls back to its own loop.
+Time Complexity: O(n log n) sort, O(log n) sorted search, O(n) scans, all in C
+Space Complexity: O(n) for a converted copy of list input, O(1) for array input
+"""
+
+from array import array
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; callers keep their pure-Python paths
+    np = None
+
+# Lists shorter than this are cheaper to sort in Python than to convert
+SORT_MIN_SIZE = 64
+
+# Arrays shorter than this are binary searched faster by the Python loop
+SEARCH_MIN_SIZE = 4096
+
+# A sorted list is converted for a batch search when it has at most this
+# many elements per target
+BATCH_CONVERT_RATIO = 32
+
+def numeric_view(arr):
+    """
+    Views arr as a one-dimensional numeric NumPy array without copying.
+    
+    Returns:
+        arr itself if it is a numeric NumPy array, an array sharing the
+        buffer of a numeric array.array or memoryview (such as a cast of
+        a memory-mapped file), or None
+    """
+    if np is None:
+        return None
+    if isinstance(arr, np.ndarray):
+        return arr if arr.ndim == 1 and arr.dtype.kind in 'iuf' else None
+    if isinstance(arr, array) and arr.typecode in 'bBhHiIlLqQfd':
+        return np.asarray(arr)
+    if isinstance(arr, memoryview) and arr.ndim == 1 and len(arr.format) == 1 and arr.format in 'bBhHiIlLqQfd':
+        return np.asarray(arr)
+    return None
+
+
+def numeric_array(arr, min_size=0):
+    """
+    Converts numeric input to a one-dimensional NumPy array.
+    
+    Args:
+        arr: Sequence to inspect
+        min_size: Smallest length for which a list or tuple is converted
+    
+    Returns:
+        numeric_view(arr) if there is one, a new NumPy array of ints or
+        floats for a homogeneous numeric list or tuple, or None
+    """
+    values = numeric_view(arr)
+    if values is not None or np is None:
+        return values
+    if not isinstance(arr, (list, tuple)) or len(arr) < max(min_size, 1):
+        return None
+    
+    # bool is an int subclass and mixed ints and floats would change types
+    types = set(map(type, arr))
+    if types == {int}:
+        kinds = 'iu'
+    elif types == {float}:
+        kinds = 'f'
+    else:
+        return None
+    values = np.asarray(arr)
+    # ints outside 64 bits come back as object or float arrays
+    return values if values.dtype.kind in kinds else None
+
+
+def sorted_list(arr):
+    """
+    Sorts numeric input with a stable NumPy sort.
+    
+    Returns:
+        New sorted list, or None if arr is not numeric
+    """
+    values = numeric_array(arr, SORT_MIN_SIZE)
+    if values is None:
+        return None
+    return np.sort(values, kind='stable').tolist()
+
+
+def sort_in_place(arr):
+    """
+    Sorts a numeric list or array in place with a stable NumPy sort.
+    
+    Returns:
+        True if arr was sorted, False if arr is not numeric
+    """
+    values = numeric_array(arr, SORT_MIN_SIZE)
+    if values is None:
+        return False
+    if isinstance(arr, list):
+        arr[:] = np.sort(values, kind='stable').tolist()
+    else:
+        # NumPy and array.array input share memory with values
+        values.sort(kind='stable')
+    return True
+
+
+def argsort_keys(keys):
+    """
+    Stable argsort of a list of keys.
+    
+    Returns:
+        List of indices that order keys, ties in input order, or None if
+        the keys are not numeric
+    """
+    values = numeric_array(keys, SORT_MIN_SIZE)
+    if values is None:
+        return None
+    return np.argsort(values, kind='stable').tolist()
+
+
+def search_sorted(arr, target, lo=0, hi=None, last=False):
+    """
+    Finds target in a sorted numeric array with searchsorted. Lists are
+    left to the caller: converting one costs more than searching it.
+    
+    Args:
+        arr: Sorted sequence
+        target: Value to search for
+        lo: First index of the range to search
+        hi: End of the range to search (defaults to len(arr))
+        last: Whether to find the last occurrence instead of the first
+    
+    Returns:
+        Index of the first (or last) occurrence of target in arr[lo:hi],
+        -1 if absent, or None if arr is not a numeric array, the range
+        is shorter than SEARCH_MIN_SIZE or target is not a number
+    """
+    hi = len(arr) if hi is None else min(hi, len(arr))
+    if hi - lo < SEARCH_MIN_SIZE or not isinstance(target, Real):
+        return None
+    values = numeric_view(arr)
+    if values is None:
+        return None
+    window = values[lo:hi]
+    if last:
+        i = int(window.searchsorted(target, 'right')) - 1
+        return lo + i if i >= 0 and window[i] == target else -1
+    i = int(window.searchsorted(target))
+    return lo + i if i < len(window) and window[i] == target else -1
+
+
+def search_sorted_many(arr, targets, mode):
+    """
+    Searches a sorted numeric array for numeric targets with one
+    vectorized searchsorted per side.
+    
+    Args:
+        arr: Sorted numeric array or list
+        targets: Numeric targets
+        mode: 'find', 'left', 'right' or 'range', as for
+            binary_search.binary_search_many
+    
+    Returns:
+        Positions as NumPy arrays (a tuple of two for 'range'), or None if
+        the data is not numeric or arr is a list too long to convert for
+        this many targets
+    """
+    queries = numeric_array(targets)
+    if queries is None:
+        return None
+    values = numeric_view(arr)
+    if values is None and len(queries) * BATCH_CONVERT_RATIO >= len(arr):
+        values = numeric_array(arr)
+    if values is None:
+        return None
+    
+    if mode == 'right':
+        return values.searchsorted(queries, 'right')
+    starts = values.searchsorted(queries, 'left')
+    if mode == 'left':
+        return starts
+    if mode == 'range':
+        return starts, values.searchsorted(queries, 'right')
+    
+    found = starts < len(values)
+    found[found] = values[starts[found]] == queries[found]
+    return np.where(found, starts, -1)
+
+
+def search_first(arr, target):
+    """
+    Finds the first occurrence of target in a numeric array with a mask.
+    Lists are left to the caller, for the same reason as in search_sorted.
+    
+    Returns:
+        Index of target, -1 if absent, or None if arr is not a numeric
+        array or target is not a number
+    """
+    values = numeric_view(arr) if isinstance(target, Real) else None
+    if values is None:
+        return None
+    if not len(values):
+        return -1
+    mask = values == target
+    i = int(mask.argmax())
+    return i if mask[i] else -1
+
+
+def search_all(arr, target):
+    """
+    Finds every occurrence of target in a numeric array with a mask.
+    
+    Returns:
+        List of indices of target, or None if arr is not a numeric array
+        or target is not a number
+    """
+    values = numeric_view(arr) if isinstance(target, Real) else None
+    if values is None:
+        return None
+    return np.flatnonzero(values == target).tolist()
+
+
+if __name__ == "__main__":
+    # Show which inputs the backend accepts
+    samples = [
+        [3, 1, 2],
+        [3.5, 1.0, 2.25],
+        [3, 1.5],
+        [True, False],
+        ['b', 'a'],
+        [2 ** 70, 1],
+        array('d', [2.0, 1.0]),
+    ]
+    for sample in samples:
+        values = numeric_array(sample)
+        if values is None:
+            print(f"{sample!r}: pure Python")
+        else:
+            print(f"{sample!r}: NumPy {values.dtype}, sorted {np.sort(values).tolist()}")
@@ -0,0 +1,190 @@
+"""
+Parallel Sample Sort
+Sorts large inputs across a process pool. A random sample of the input
+picks splitters that cut the value range into one bucket per worker; each
+worker sorts a slice of the input and cuts it at the splitters, then each
+worker gathers and sorts one bucket. Buckets are already in order, so the
+result is their concatenation with no final merge. NumPy arrays live in
+shared memory for both phases; other inputs are pickled to the workers.
+Time Complexity: O((n log n) / p) per worker for p workers, plus O(n) copying
+Space Complexity: O(n)
+"""
+
+import os
+import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only lists are sorted without it
+    np = None
+
+# Inputs shorter than this are sorted in-process; the pool costs more than it saves
+PARALLEL_MIN_SIZE = 1 << 16
+
+# Sample elements drawn per bucket when choosing splitters
+OVERSAMPLE = 32
+
+# Worker-side state set by _init_worker: (input view, output view, segments)
+_shared = None
+
+def sample_sort(arr, workers=None):
+    """
+    Sorts arr with a parallel sample sort. Equal elements keep their
+    input order.
+    
+    Args:
+        arr: List of comparable elements, or a one-dimensional NumPy array
+        workers: Number of worker processes (defaults to the CPU count;
+            1 sorts in-process)
+    
+    Returns:
+        Sorted NumPy array if arr is one, otherwise a sorted list
+    """
+    workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+    is_numpy = np is not None and isinstance(arr, np.ndarray)
+    
+    if workers == 1 or len(arr) < PARALLEL_MIN_SIZE:
+        return np.sort(arr, kind='stable') if is_numpy else sorted(arr)
+    if is_numpy:
+        return _sample_sort_shared(arr, workers)
+    return _sample_sort_pickled(list(arr), workers)
+
+
+def _chunk_bounds(n, parts):
+    """Returns parts + 1 boundaries splitting range(n) into near-equal slices."""
+    return [n * i // parts for i in range(parts + 1)]
+
+
+def _sample_sort_pickled(arr, workers):
+    """Sample sort for arbitrary picklable elements; chunks and buckets travel by pickle."""
+    sample = sorted(random.choices(arr, k=workers * OVERSAMPLE))
+    splitters = sample[OVERSAMPLE::OVERSAMPLE]
+    bounds = _chunk_bounds(len(arr), workers)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [(arr[lo:hi], splitters) for lo, hi in zip(bounds, bounds[1:])]
+        cut_chunks = list(executor.map(_cut_chunk, tasks))
+        # Bucket j gathers piece j of every chunk, in input order
+        buckets = executor.map(_sort_pieces, zip(*cut_chunks))
+        result = []
+        for bucket in buckets:
+            result.extend(bucket)
+    
+    return result
+
+
+def _cut_chunk(task):
+    """Sorts one chunk and splits it into one sorted piece per bucket."""
+    chunk, splitters = task
+    chunk.sort()
+    cuts = [0] + [bisect_right(chunk, splitter) for splitter in splitters] + [len(chunk)]
+    return [chunk[a:b] for a, b in zip(cuts, cuts[1:])]
+
+
+def _sort_pieces(pieces):
+    """Sorts one bucket from its sorted pieces; timsort merges the runs."""
+    bucket = []
+    for piece in pieces:
+        bucket.extend(piece)
+    bucket.sort()
+    return bucket
+
+
+def _sample_sort_shared(arr, workers):
+    """
+    Sample sort for NumPy arrays. The input is copied once into a shared
+    segment that workers sort in place slice by slice; buckets are then
+    gathered into a second shared segment and sorted there.
+    """
+    n = len(arr)
+    dtype = arr.dtype
+    input_segment = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    output_segment = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    try:
+        data = np.ndarray(n, dtype, buffer=input_segment.buf)
+        data[:] = arr
+        
+        rng = np.random.default_rng()
+        sample = np.sort(arr[rng.integers(0, n, workers * OVERSAMPLE)])
+        splitters = sample[OVERSAMPLE::OVERSAMPLE]
+        bounds = _chunk_bounds(n, workers)
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(input_segment.name, output_segment.name, n, dtype.str),
+        ) as executor:
+            tasks = [(lo, hi, splitters) for lo, hi in zip(bounds, bounds[1:])]
+            cuts = list(executor.map(_sort_slice, tasks))
+            
+            # Bucket j holds data[cuts[i][j]:cuts[i][j + 1]] from every slice i
+            tasks = []
+            start = 0
+            for j in range(workers):
+                pieces = [(c[j], c[j + 1]) for c in cuts]
+                tasks.append((start, pieces))
+                start += sum(b - a for a, b in pieces)
+            for _ in executor.map(_fill_bucket, tasks):
+                pass
+        
+        # Copy out before the segments go away
+        result = np.ndarray(n, dtype, buffer=output_segment.buf).copy()
+        del data
+        return result
+    finally:
+        input_segment.close()
+        input_segment.unlink()
+        output_segment.close()
+        output_segment.unlink()
+
+
+def _init_worker(input_name, output_name, n, dtype):
+    """Attaches a worker process to the shared input and output segments."""
+    global _shared
+    input_segment = shared_memory.SharedMemory(name=input_name)
+    output_segment = shared_memory.SharedMemory(name=output_name)
+    data = np.ndarray(n, dtype, buffer=input_segment.buf)
+    output = np.ndarray(n, dtype, buffer=output_segment.buf)
+    _shared = (data, output, (input_segment, output_segment))
+
+
+def _sort_slice(task):
+    """
+    Sorts the shared input slice [lo, hi) in place.
+    
+    Returns:
+        Positions lo, the slice cut at each splitter, and hi
+    """
+    lo, hi, splitters = task
+    chunk = _shared[0][lo:hi]
+    chunk.sort(kind='stable')
+    return [lo, *(lo + np.searchsorted(chunk, splitters, side='right')).tolist(), hi]
+
+
+def _fill_bucket(task):
+    """Copies one bucket's pieces into the shared output at start and sorts them there."""
+    start, pieces = task
+    data, output, _ = _shared
+    position = start
+    for a, b in pieces:
+        output[position:position + b - a] = data[a:b]
+        position += b - a
+    output[start:position].sort(kind='stable')
+    return position - start
+
+
+if __name__ == "__main__":
+    # Test the sample sort on inputs large enough to use the pool
+    values = [random.randint(0, 10 ** 6) for _ in range(200000)]
+    result = sample_sort(values, workers=4)
+    print(f"Sorted {len(values)} integers with 4 workers: {result == sorted(values)}")
+    
+    words = [''.join(random.choices('abc', k=5)) for _ in range(PARALLEL_MIN_SIZE)]
+    print(f"Sorted {len(words)} strings with 2 workers: {sample_sort(words, workers=2) == sorted(words)}")
+    
+    if np is not None:
+        floats = np.random.default_rng(0).random(10 ** 6)
+        print(f"Sorted a NumPy array of {len(floats)} floats: {np.array_equal(sample_sort(floats, workers=4), np.sort(floats))}")
@@ -4,10 +4,76 @@ Various methods to work with prime numbers
 """
 
 import math
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress, islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the batch API falls back to pure Python
+    np = None
+
+# Window size in bytes (one byte per odd number), sized to stay in L2 cache
+SEGMENT_SIZE = 1 << 18
+
+# Trial-division table; anything below 53^2 that survives it is prime
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+_SMALL_PRIME_LIMIT = 53 * 53
+
+# (bound, bases): Miller-Rabin with these bases is exact for n < bound
+_MR_WITNESSES = (
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+# Steps between gcd evaluations in Pollard-Brent
+_RHO_BLOCK = 128
+
+# Batch API: trial-division table bound and values per worker task
+BATCH_TRIAL_LIMIT = 1000
+BATCH_CHUNK_SIZE = 1 << 16
 
 def is_prime(n):
     """
     Checks if a number is prime.
+    Small inputs are settled by trial division against a fixed prime table;
+    larger ones go to Miller-Rabin, which is deterministic below 3.3 * 10^24
+    (covering every 64-bit integer) and probabilistic above it.
+    Time Complexity: O(k log^3 n) for k Miller-Rabin witnesses
+    
+    Args:
+        n: Number to check
+    
+    Returns:
+        True if n is prime, False otherwise
+    """
+    if n < 2:
+        return False
+    
+    # Small-prime pre-filter rejects most composites before any pow()
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    
+    if n < _SMALL_PRIME_LIMIT:
+        return True
+    
+    return miller_rabin(n)
+
+
+def is_prime_trial_division(n):
+    """
+    Checks if a number is prime by trial division.
     Time Complexity: O(sqrt(n))
     
     Args:
@@ -24,18 +90,58 @@ def is_prime(n):
         return False
     
     # Check odd divisors up to sqrt(n)
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
+    for i in range(3, math.isqrt(n) + 1, 2):
         if n % i == 0:
             return False
     
     return True
 
 
+def miller_rabin(n, rounds=20):
+    """
+    Miller-Rabin primality test for odd n > 2.
+    Uses the smallest known deterministic witness set for n's size; above
+    3.3 * 10^24 those witnesses are followed by `rounds` random bases, for
+    an error probability of at most 4^-rounds.
+    Time Complexity: O(k log^3 n) for k witnesses
+    
+    Args:
+        n: Odd number greater than 2 to check
+        rounds: Number of random bases tried beyond the deterministic range
+    
+    Returns:
+        True if n is (probably, for huge n) prime, False otherwise
+    """
+    # Write n - 1 as d * 2^s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    
+    for limit, bases in _MR_WITNESSES:
+        if n < limit:
+            break
+    else:
+        bases = bases + tuple(random.randrange(2, n - 1) for _ in range(rounds))
+    
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    
+    return True
+
+
 def sieve_of_eratosthenes(n):
     """
     Finds all prime numbers up to n using Sieve of Eratosthenes.
     Time Complexity: O(n log log n)
-    Space Complexity: O(n)
+    Space Complexity: O(sqrt(n)) working memory plus the returned list
     
     Args:
         n: Upper limit
@@ -43,27 +149,134 @@ def sieve_of_eratosthenes(n):
     Returns:
         List of prime numbers up to n
     """
-    if n < 2:
+    return list(segmented_sieve(2, n))
+
+
+def _small_primes(limit):
+    """Returns primes up to limit with a plain odd-only sieve."""
+    if limit < 2:
         return []
     
-    # Create boolean array and initialize all as true
-    is_prime_arr = [True] * (n + 1)
-    is_prime_arr[0] = is_prime_arr[1] = False
+    # Index k represents the odd number 2k + 1
+    size = (limit - 1) // 2 + 1
+    odd = bytearray(b'\x01') * size
+    odd[0] = 0
+    
+    for k in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if odd[k]:
+            p = 2 * k + 1
+            start = p * p // 2
+            odd[start::p] = bytes(len(range(start, size, p)))
+    
+    return [2] + list(compress(range(1, 2 * size, 2), odd))
+
+
+def segmented_sieve(low, high, segment_size=SEGMENT_SIZE):
+    """
+    Yields primes in [low, high] using a segmented, odd-only sieve.
+    Only one window of segment_size bytes is alive at a time, so memory
+    stays bounded by O(sqrt(high) + segment_size) regardless of the range.
+    Time Complexity: O(n log log n) where n = high - low
+    Space Complexity: O(sqrt(high) + segment_size)
+    
+    Args:
+        low: Start of range (inclusive)
+        high: End of range (inclusive)
+        segment_size: Number of odd candidates sieved per window
+    
+    Yields:
+        Prime numbers in ascending order
+    """
+    if high < 2 or high < low:
+        return
+    if low <= 2:
+        yield 2
+    
+    # Sieve odd numbers only; lo is the first odd candidate >= 3
+    lo = max(3, low | 1)
+    base_primes = _small_primes(math.isqrt(high))[1:]
+    zeros = memoryview(bytes(segment_size))
+    
+    while lo <= high:
+        size = min(segment_size, (high - lo) // 2 + 1)
+        seg_high = lo + 2 * (size - 1)
+        segment = bytearray(b'\x01') * size
+        
+        for p in base_primes:
+            square = p * p
+            if square > seg_high:
+                break
+            # First odd multiple of p inside the window
+            first = max(square, (lo + p - 1) // p * p)
+            if first % 2 == 0:
+                first += p
+            start = (first - lo) // 2
+            if start < size:
+                segment[start::p] = zeros[:(size - 1 - start) // p + 1]
+        
+        yield from compress(range(lo, seg_high + 1, 2), segment)
+        lo = seg_high + 2
+
+
+def primes_array(low, high, segment_size=SEGMENT_SIZE):
+    """
+    Collects primes in [low, high] into a compact unsigned 64-bit array.
+    Uses 8 bytes per prime instead of a full Python int object each.
     
-    # Mark multiples of each prime as composite
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if is_prime_arr[i]:
-            for j in range(i * i, n + 1, i):
-                is_prime_arr[j] = False
+    Args:
+        low: Start of range (inclusive)
+        high: End of range (inclusive)
+        segment_size: Number of odd candidates sieved per window
     
-    # Collect all prime numbers
-    primes = [i for i in range(n + 1) if is_prime_arr[i]]
-    return primes
+    Returns:
+        array('Q') of prime numbers in ascending order
+    """
+    return array('Q', segmented_sieve(low, high, segment_size))
 
 
 def prime_factorization(n):
     """
     Finds prime factorization of a number.
+    Strips small prime factors by trial division, then splits what is left
+    with Pollard's rho until every part passes is_prime.
+    Time Complexity: O(n^(1/4)) expected per split
+    
+    Args:
+        n: Number to factorize
+    
+    Returns:
+        List of prime factors in ascending order
+    """
+    if n < 2:
+        return []
+    
+    factors = []
+    
+    # Handle small prime factors directly
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    
+    # Split the remaining cofactor until only primes are left
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if m < _SMALL_PRIME_LIMIT or is_prime(m):
+            factors.append(m)
+        else:
+            d = pollard_rho(m)
+            stack.append(d)
+            stack.append(m // d)
+    
+    factors.sort()
+    return factors
+
+
+def prime_factorization_trial_division(n):
+    """
+    Finds prime factorization of a number by trial division.
+    Time Complexity: O(sqrt(n))
     
     Args:
         n: Number to factorize
@@ -93,9 +306,59 @@ def prime_factorization(n):
     return factors
 
 
+def pollard_rho(n):
+    """
+    Finds a non-trivial factor of a composite number.
+    Brent's variant of Pollard's rho: cycle detection by power-of-two
+    doubling, with gcds batched over blocks of steps.
+    Time Complexity: O(n^(1/4)) expected
+    
+    Args:
+        n: Odd composite number
+    
+    Returns:
+        A factor d with 1 < d < n
+    """
+    if n % 2 == 0:
+        return 2
+    
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        g = r = q = 1
+        
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            
+            # Accumulate |x - y| products and take one gcd per block
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(_RHO_BLOCK, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += _RHO_BLOCK
+            r *= 2
+        
+        # The block overshot; replay it one step at a time
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        
+        if g != n:
+            return g
+
+
 def nth_prime(n):
     """
     Finds the nth prime number.
+    Sieves up to the Rosser bound n(ln n + ln ln n) instead of testing
+    candidates one by one.
     
     Args:
         n: Position of prime number to find (1-indexed)
@@ -103,19 +366,16 @@ def nth_prime(n):
     Returns:
         The nth prime number
     """
-    if n == 1:
-        return 2
+    if n < 1:
+        raise ValueError("n must be a positive integer")
     
-    count = 1
-    candidate = 3
+    # p_n < n(ln n + ln ln n) holds for n >= 6
+    if n < 6:
+        limit = 13
+    else:
+        limit = int(n * (math.log(n) + math.log(math.log(n)))) + 1
     
-    while count < n:
-        if is_prime(candidate):
-            count += 1
-        if count < n:
-            candidate += 2
-    
-    return candidate
+    return next(islice(segmented_sieve(2, limit), n - 1, None))
 
 
 def primes_in_range(start, end):
@@ -129,11 +389,171 @@ def primes_in_range(start, end):
     Returns:
         List of prime numbers in range
     """
-    primes = []
-    for num in range(max(2, start), end + 1):
-        if is_prime(num):
-            primes.append(num)
-    return primes
+    return list(segmented_sieve(start, end))
+
+
+def is_prime_many(values, workers=None, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Checks primality of many numbers at once.
+    With NumPy, integer inputs are trial-divided as whole arrays against a
+    shared table of primes below BATCH_TRIAL_LIMIT; only survivors of at
+    least BATCH_TRIAL_LIMIT^2 reach Miller-Rabin one by one.
+    
+    Args:
+        values: List or NumPy array of integers
+        workers: Number of worker processes (None or 1 runs in-process)
+        chunk_size: Values handed to each worker task
+    
+    Returns:
+        Boolean NumPy array if NumPy is installed, otherwise a bytearray
+        of 0/1 flags, aligned with values
+    """
+    parts = _map_chunks(_is_prime_chunk, values, workers, chunk_size)
+    if np is not None:
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=bool)
+    return bytearray().join(parts)
+
+
+def factorize_many(values, workers=None, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Finds the prime factorization of many numbers at once.
+    Factors are returned in CSR form: the factors of values[i] are
+    factors[offsets[i]:offsets[i + 1]], in ascending order.
+    
+    Args:
+        values: List or NumPy array of integers below 2^64
+        workers: Number of worker processes (None or 1 runs in-process)
+        chunk_size: Values handed to each worker task
+    
+    Returns:
+        Tuple of (offsets, factors), as int64/uint64 NumPy arrays if NumPy
+        is installed, otherwise as array('Q')
+    """
+    parts = _map_chunks(_factorize_chunk, values, workers, chunk_size)
+    if not parts:
+        parts = [_factorize_chunk([])]
+    
+    # Stitch chunk results together, shifting each chunk's offsets
+    if np is not None:
+        offsets = [parts[0][0]]
+        base = parts[0][0][-1]
+        for chunk_offsets, _ in parts[1:]:
+            offsets.append(chunk_offsets[1:] + base)
+            base += chunk_offsets[-1]
+        return np.concatenate(offsets), np.concatenate([f for _, f in parts])
+    
+    offsets, factors = parts[0]
+    for chunk_offsets, chunk_factors in parts[1:]:
+        base = len(factors)
+        offsets.extend(base + o for o in chunk_offsets[1:])
+        factors.extend(chunk_factors)
+    return offsets, factors
+
+
+def _map_chunks(func, values, workers, chunk_size):
+    """Applies func to consecutive chunks of values, optionally in a process pool."""
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    if workers is None or workers <= 1 or len(chunks) <= 1:
+        return [func(chunk) for chunk in chunks]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, chunks))
+
+
+@lru_cache(maxsize=None)
+def _batch_primes():
+    """Returns the shared trial-division table for the batch API."""
+    primes = _small_primes(BATCH_TRIAL_LIMIT - 1)
+    return np.array(primes, dtype=np.uint64) if np is not None else primes
+
+
+def _as_uint64(values):
+    """Converts values to a uint64 array with entries below 2 replaced by 1, or None."""
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'u':
+        return np.maximum(arr, 1).astype(np.uint64)
+    if arr.dtype.kind == 'i':
+        return np.where(arr < 2, 1, arr).astype(np.uint64)
+    # Python ints of 2^63 and up turn the list into a float or object array
+    if not isinstance(values, np.ndarray) and all(isinstance(v, int) for v in values):
+        return np.array([v if v > 1 else 1 for v in values], dtype=np.uint64)
+    return None
+
+
+def _is_prime_chunk(values):
+    """Primality mask for one chunk of values."""
+    if np is None:
+        return bytearray(is_prime(v) for v in values)
+    
+    v = _as_uint64(values)
+    if v is None:
+        return np.array([is_prime(int(x)) for x in values], dtype=bool)
+    
+    # Vectorized trial division, shrinking the candidate set as we go
+    candidates = np.flatnonzero(v > 1)
+    remaining = v[candidates]
+    for p in _batch_primes():
+        keep = (remaining % p != 0) | (remaining == p)
+        candidates = candidates[keep]
+        remaining = remaining[keep]
+    
+    mask = np.zeros(len(v), dtype=bool)
+    mask[candidates] = True
+    
+    # Survivors below the table limit squared are prime; test the rest
+    for i in candidates[remaining >= np.uint64(BATCH_TRIAL_LIMIT ** 2)]:
+        mask[i] = miller_rabin(int(v[i]))
+    
+    return mask
+
+
+def _factorize_chunk(values):
+    """CSR factorization (offsets, factors) for one chunk of values."""
+    if np is None:
+        offsets = array('Q', [0])
+        factors = array('Q')
+        for v in values:
+            factors.extend(prime_factorization(v))
+            offsets.append(len(factors))
+        return offsets, factors
+    
+    rem = _as_uint64(values)
+    if rem is None:
+        rem = np.array([max(int(v), 1) for v in values], dtype=np.uint64)
+    n = len(rem)
+    owner_parts = [np.zeros(0, dtype=np.intp)]
+    factor_parts = [np.zeros(0, dtype=np.uint64)]
+    
+    # Vectorized trial division: peel each table prime off every value
+    candidates = np.flatnonzero(rem > 1)
+    for p in _batch_primes():
+        if candidates.size == 0:
+            break
+        hits = candidates[rem[candidates] % p == 0]
+        while hits.size:
+            owner_parts.append(hits)
+            factor_parts.append(np.full(hits.size, p, dtype=np.uint64))
+            rem[hits] //= p
+            hits = hits[rem[hits] % p == 0]
+        candidates = candidates[rem[candidates] > 1]
+    
+    # Cofactors below the table limit squared are prime; split the rest
+    small = rem[candidates] < np.uint64(BATCH_TRIAL_LIMIT ** 2)
+    owner_parts.append(candidates[small])
+    factor_parts.append(rem[candidates[small]])
+    for i in candidates[~small]:
+        cofactor_factors = prime_factorization(int(rem[i]))
+        owner_parts.append(np.full(len(cofactor_factors), i, dtype=np.intp))
+        factor_parts.append(np.array(cofactor_factors, dtype=np.uint64))
+    
+    # Group factors by owning value, ascending within each group
+    owners = np.concatenate(owner_parts)
+    factors = np.concatenate(factor_parts)
+    order = np.lexsort((factors, owners))
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owners, minlength=n), out=offsets[1:])
+    
+    return offsets, factors[order]
 
 
 if __name__ == "__main__":
@@ -147,8 +567,22 @@ if __name__ == "__main__":
     print("\nPrime factorization of 60:")
     print(prime_factorization(60))
     
+    print("\nPrime factorization of 2^64 - 1:")
+    print(prime_factorization(2**64 - 1))
+    
     print("\n10th prime number:")
     print(nth_prime(10))
     
     print("\nPrimes between 10 and 30:")
     print(primes_in_range(10, 30))
+    
+    print("\nPrimes between 10^12 and 10^12 + 100 (segmented sieve):")
+    print(list(segmented_sieve(10**12, 10**12 + 100)))
+    
+    print("\nBatch primality of [97, 98, 2^61 - 1]:")
+    print([bool(flag) for flag in is_prime_many([97, 98, 2**61 - 1])])
+    
+    offsets, factors = factorize_many([12, 97, 2**32 + 1, 2**64 - 1])
+    print("\nBatch factorization of [12, 97, 2^32 + 1, 2^64 - 1] (CSR):")
+    print(f"  offsets: {[int(o) for o in offsets]}")
+    print(f"  factors: {[int(f) for f in factors]}")
@@ -1,19 +1,47 @@
 """
 Quick Sort Algorithm
 Time Complexity: O(n log n) average, O(n^2) worst case
-Space Complexity: O(log n) due to recursion stack
+Space Complexity: O(log n) due to recursion stack (the explicit stack for
+quick_sort_inplace)
 """
 
-def quick_sort(arr):
+import random
+
+from introsort import introsort
+from numpy_backend import sorted_list
+from parallel_sort import sample_sort
+
+def quick_sort(arr, engine='auto'):
     """
     Sorts an array using quick sort algorithm.
     
     Args:
         arr: List of comparable elements
+        engine: 'auto' (a vectorized NumPy sort for numeric data when
+            NumPy is installed, otherwise 'quick'), 'quick', 'introsort'
+            to sort a copy in place with the hybrid engine instead of
+            building new lists at every level, or 'parallel' for a sample
+            sort across a process pool (which also accepts and returns
+            NumPy arrays)
     
     Returns:
         Sorted list in ascending order
+    
+    Raises:
+        ValueError: If engine is unknown
     """
+    if engine == 'auto':
+        result = sorted_list(arr)
+        if result is not None:
+            return result
+        engine = 'quick'
+    if engine == 'introsort':
+        return introsort(list(arr))
+    if engine == 'parallel':
+        return sample_sort(arr)
+    if engine != 'quick':
+        raise ValueError(f"Unknown engine: {engine!r}")
+    
     if len(arr) <= 1:
         return arr
     
@@ -26,25 +54,174 @@ def quick_sort(arr):
     right = [x for x in arr if x > pivot]
     
     # Recursively sort left and right partitions
-    return quick_sort(left) + middle + quick_sort(right)
+    return quick_sort(left, engine) + middle + quick_sort(right, engine)
 
 
-def quick_sort_inplace(arr, low, high):
+def quick_sort_inplace(arr, low=0, high=None, pivot='random'):
     """
     In-place quick sort implementation.
+    Uses three-way partitioning, so runs of equal elements are placed in
+    one pass, and an explicit stack instead of recursion: the smaller side
+    is sorted next while the larger waits on the stack, which keeps the
+    stack O(log n).
     
     Args:
         arr: List to sort
         low: Starting index
-        high: Ending index
+        high: Ending index, inclusive (defaults to the last index)
+        pivot: Pivot strategy: 'random' (the default), 'median_of_three'
+            of the first, middle and last elements, or 'last'. The
+            deterministic strategies degrade to O(n^2) on some structured
+            inputs such as organ pipes, but never overflow the stack
+    
+    Raises:
+        ValueError: If pivot is unknown
+    """
+    if high is None:
+        high = len(arr) - 1
+    choose = _pivot_chooser(pivot)
+    
+    stack = [(low, high)]
+    while stack:
+        lo, hi = stack.pop()
+        while lo < hi:
+            lt, gt = partition_three_way(arr, lo, hi, choose(arr, lo, hi))
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1))
+                lo = gt + 1
+
+
+def nth_element(arr, n, low=0, high=None, pivot='random'):
+    """
+    Partially sorts arr in place so that arr[n] holds the element a full
+    sort would put there, with no larger element before it and no smaller
+    element after it.
+    
+    Args:
+        arr: List to rearrange
+        n: Target index, low <= n <= high
+        low: Starting index
+        high: Ending index, inclusive (defaults to the last index)
+        pivot: Pivot strategy, as for quick_sort_inplace
+    
+    Raises:
+        ValueError: If n is outside [low, high] or pivot is unknown
     """
-    if low < high:
-        # Partition and get pivot index
-        pi = partition(arr, low, high)
-        
-        # Sort elements before and after partition
-        quick_sort_inplace(arr, low, pi - 1)
-        quick_sort_inplace(arr, pi + 1, high)
+    if high is None:
+        high = len(arr) - 1
+    if not low <= n <= high:
+        raise ValueError(f"Index out of range: {n}")
+    choose = _pivot_chooser(pivot)
+    
+    # Only the side holding n needs further partitioning
+    while low < high:
+        lt, gt = partition_three_way(arr, low, high, choose(arr, low, high))
+        if n < lt:
+            high = lt - 1
+        elif n > gt:
+            low = gt + 1
+        else:
+            return
+
+
+def quickselect(arr, k, pivot='random'):
+    """
+    Finds the k-th smallest element (counting from 0) in expected O(n)
+    time without sorting. arr is left unchanged.
+    
+    Args:
+        arr: List of comparable elements
+        k: Rank of the element to find, 0 <= k < len(arr)
+        pivot: Pivot strategy, as for quick_sort_inplace
+    
+    Returns:
+        The element at index k of the sorted list
+    
+    Raises:
+        ValueError: If k is out of range or pivot is unknown
+    """
+    work = list(arr)
+    nth_element(work, k, pivot=pivot)
+    return work[k]
+
+
+def partial_sort(arr, k, pivot='random'):
+    """
+    Sorts just the k smallest elements into arr[:k], in place; the order
+    of the remaining elements is unspecified.
+    
+    Args:
+        arr: List to rearrange
+        k: Number of smallest elements to sort (clamped to len(arr))
+        pivot: Pivot strategy, as for quick_sort_inplace
+    
+    Raises:
+        ValueError: If pivot is unknown
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return
+    if k == len(arr):
+        quick_sort_inplace(arr, pivot=pivot)
+        return
+    
+    # arr[k - 1] lands in place with nothing larger before it
+    nth_element(arr, k - 1, pivot=pivot)
+    quick_sort_inplace(arr, 0, k - 2, pivot=pivot)
+
+
+def partition_three_way(arr, low, high, pivot_index):
+    """
+    Dutch national flag partition of arr[low:high + 1] around the value
+    at pivot_index.
+    
+    Returns:
+        Tuple (lt, gt) such that arr[low:lt] < pivot, arr[lt:gt + 1] ==
+        pivot and arr[gt + 1:high + 1] > pivot
+    """
+    pivot = arr[pivot_index]
+    lt, i, gt = low, low, high
+    while i <= gt:
+        item = arr[i]
+        if item < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = item
+            lt += 1
+            i += 1
+        elif pivot < item:
+            arr[i] = arr[gt]
+            arr[gt] = item
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _pivot_chooser(strategy):
+    """Returns a function (arr, lo, hi) -> pivot index for a strategy name."""
+    if strategy == 'median_of_three':
+        return _median_of_three_index
+    if strategy == 'random':
+        return lambda arr, lo, hi: random.randint(lo, hi)
+    if strategy == 'last':
+        return lambda arr, lo, hi: hi
+    raise ValueError(f"Unknown pivot strategy: {strategy!r}")
+
+
+def _median_of_three_index(arr, lo, hi):
+    """Returns whichever of lo, the midpoint and hi holds the median value."""
+    mid = lo + (hi - lo) // 2
+    a, b, c = arr[lo], arr[mid], arr[hi]
+    if a < b:
+        if b < c:
+            return mid
+        return hi if a < c else lo
+    if a < c:
+        return lo
+    return hi if b < c else mid
 
 
 def partition(arr, low, high):
@@ -67,7 +244,17 @@ if __name__ == "__main__":
     print(f"Original array: {test_array}")
     sorted_array = quick_sort(test_array.copy())
     print(f"Sorted array (functional): {sorted_array}")
+    print(f"Sorted array (introsort engine): {quick_sort(test_array, engine='introsort')}")
     
     test_array2 = [64, 34, 25, 12, 22, 11, 90]
     quick_sort_inplace(test_array2, 0, len(test_array2) - 1)
     print(f"Sorted array (in-place): {test_array2}")
+    
+    duplicates = [random.randint(0, 3) for _ in range(100000)]
+    quick_sort_inplace(duplicates)
+    print(f"100000 elements with 4 distinct values sorted in place: {duplicates == sorted(duplicates)}")
+    
+    print(f"Third smallest (quickselect): {quickselect(test_array, 2)}")
+    scores = test_array.copy()
+    partial_sort(scores, 3)
+    print(f"Three smallest (partial_sort): {scores[:3]}")
@@ -0,0 +1,307 @@
+"""
+Static Search Indexes
+Read-only indexes over a sorted sequence, laid out for repeated searches.
+EytzingerIndex stores the keys in breadth-first order of the implicit
+binary search tree, so the first levels of every search share a few cache
+lines and each step is a branchless index update. BTreeIndex stores
+blocks of keys as the nodes of an implicit (B+1)-ary search tree, so each
+level is one search within a contiguous block. Numeric keys are kept in
+typed arrays and can be searched in batches with NumPy. Interpolation
+search is included for sorted keys that are spread close to uniformly.
+Time Complexity: O(n log n) to build, O(log n) per search
+    (O(log log n) expected for interpolation search on uniform keys)
+Space Complexity: O(n)
+"""
+
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch searches loop in Python
+    np = None
+
+# Keys per BTreeIndex node
+BTREE_BLOCK = 16
+
+class EytzingerIndex:
+    """
+    Sorted keys in Eytzinger (breadth-first) order: node k has children
+    2k and 2k + 1, and the root is node 1.
+    
+    Attributes:
+        tree: Keys by node, with tree[0] unused
+        ranks: Sorted position of the key at each node, with ranks[0] = n
+    """
+    
+    def __init__(self, sorted_values):
+        """
+        Builds the layout from keys in ascending order.
+        
+        Args:
+            sorted_values: Sorted sequence of comparable keys
+        """
+        values = list(sorted_values)
+        n = len(values)
+        self.n = n
+        
+        # In-order ranks of the nodes of a complete tree of this height;
+        # sorting the nodes by them gives the order of the sorted keys
+        height = n.bit_length()
+        if np is not None:
+            nodes = np.arange(1, n + 1, dtype=np.int64)
+            depth = (np.frexp(nodes.astype(np.float64))[1] - 1).astype(np.int64)
+            offset = nodes - np.left_shift(1, depth)
+            order = np.argsort(np.left_shift(2 * offset + 1, height - 1 - depth)) + 1
+            ranks = np.empty(n + 1, dtype=np.int64)
+            ranks[0] = n
+            ranks[order] = np.arange(n)
+            self.ranks = array('q')
+            self.ranks.frombytes(ranks.tobytes())
+        else:
+            def full_rank(k):
+                depth = k.bit_length() - 1
+                return (2 * (k - (1 << depth)) + 1) << (height - 1 - depth)
+            ranks = [n] * (n + 1)
+            for rank, k in enumerate(sorted(range(1, n + 1), key=full_rank)):
+                ranks[k] = rank
+            self.ranks = array('q', ranks)
+        
+        tree = [values[0] if values else 0]
+        tree.extend(values[rank] for rank in self.ranks[1:])
+        self.tree = _compact(tree)
+    
+    def __len__(self):
+        return self.n
+    
+    def lower_bound(self, target):
+        """
+        Returns the sorted position of the first key not less than target
+        (as bisect_left would on the sorted keys).
+        """
+        tree, n = self.tree, self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < target)
+        # Undo the right turns taken after the last left turn
+        k >>= (~k & (k + 1)).bit_length()
+        return self.ranks[k]
+    
+    def find(self, target):
+        """Returns the sorted position of the first key equal to target, or -1."""
+        tree, n = self.tree, self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < target)
+        k >>= (~k & (k + 1)).bit_length()
+        return self.ranks[k] if k and tree[k] == target else -1
+    
+    def find_many(self, targets):
+        """
+        Finds many targets at once, level by level with NumPy when the
+        keys and targets are numeric.
+        
+        Returns:
+            Positions as with find, in a NumPy int64 array when NumPy is
+            installed and an array('q') otherwise
+        """
+        queries = _numeric_queries(self.tree, targets)
+        if queries is None:
+            return _batch(self.find, targets)
+        
+        tree = np.frombuffer(self.tree, dtype=self.tree.typecode)
+        n = self.n
+        k = np.ones(len(queries), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            inside = k <= n
+            k[inside] = 2 * k[inside] + (tree[k[inside]] < queries[inside])
+        k >>= np.frexp((~k & (k + 1)).astype(np.float64))[1]
+        found = (k > 0) & (tree[k] == queries)
+        return np.where(found, np.frombuffer(self.ranks, dtype=np.int64)[k], -1)
+
+
+class BTreeIndex:
+    """
+    Sorted keys in a static B-tree (S-tree): node k holds the block
+    keys[k * B:(k + 1) * B] and has children k * (B + 1) + i + 1 for
+    i = 0..B. The last block is padded with copies of the largest key.
+    
+    Attributes:
+        keys: Keys by node block
+        ranks: Sorted position of each key, n for padding
+        block: Keys per node (B)
+    """
+    
+    def __init__(self, sorted_values, block=BTREE_BLOCK):
+        """
+        Builds the layout from keys in ascending order.
+        
+        Args:
+            sorted_values: Sorted sequence of comparable keys
+            block: Keys per node
+        """
+        values = list(sorted_values)
+        n = len(values)
+        self.n = n
+        self.block = block
+        self.nodes = (n + block - 1) // block
+        slots = self.nodes * block
+        keys = [values[-1] if values else 0] * slots
+        ranks = [n] * slots
+        
+        # Fill the slots in in-order sequence; the tree is only log_(B+1) n deep
+        position = 0
+        def fill(k):
+            nonlocal position
+            if k >= self.nodes:
+                return
+            for i in range(block):
+                fill(k * (block + 1) + i + 1)
+                if position < n:
+                    keys[k * block + i] = values[position]
+                    ranks[k * block + i] = position
+                position += 1
+            fill(k * (block + 1) + block + 1)
+        fill(0)
+        
+        self.keys = _compact(keys)
+        self.ranks = array('q', ranks)
+    
+    def __len__(self):
+        return self.n
+    
+    def _lower_slot(self, target):
+        """Returns the slot of the first key not less than target, or -1."""
+        keys, block, nodes = self.keys, self.block, self.nodes
+        slot = -1
+        k = 0
+        while k < nodes:
+            base = k * block
+            i = bisect_left(keys, target, base, base + block) - base
+            if i < block:
+                slot = base + i
+            k = k * (block + 1) + i + 1
+        return slot
+    
+    def lower_bound(self, target):
+        """
+        Returns the sorted position of the first key not less than target
+        (as bisect_left would on the sorted keys).
+        """
+        slot = self._lower_slot(target)
+        return self.n if slot < 0 else self.ranks[slot]
+    
+    def find(self, target):
+        """Returns the sorted position of the first key equal to target, or -1."""
+        slot = self._lower_slot(target)
+        if slot < 0 or self.ranks[slot] == self.n or self.keys[slot] != target:
+            return -1
+        return self.ranks[slot]
+    
+    def find_many(self, targets):
+        """
+        Finds many targets at once, comparing each query against a whole
+        node per level with NumPy when the keys and targets are numeric.
+        
+        Returns:
+            Positions as with find, in a NumPy int64 array when NumPy is
+            installed and an array('q') otherwise
+        """
+        queries = _numeric_queries(self.keys, targets)
+        if queries is None:
+            return _batch(self.find, targets)
+        
+        block, nodes = self.block, self.nodes
+        keys = np.frombuffer(self.keys, dtype=self.keys.typecode).reshape(nodes, block)
+        ranks = np.frombuffer(self.ranks, dtype=np.int64)
+        k = np.zeros(len(queries), dtype=np.int64)
+        slot = np.full(len(queries), -1, dtype=np.int64)
+        active = np.arange(len(queries))
+        while len(active):
+            node = k[active]
+            i = (keys[node] < queries[active, None]).sum(axis=1)
+            hit = i < block
+            slot[active[hit]] = node[hit] * block + i[hit]
+            k[active] = node * (block + 1) + i + 1
+            active = active[k[active] < nodes]
+        
+        found = slot >= 0
+        found[found] = (ranks[slot[found]] < self.n) & (keys.ravel()[slot[found]] == queries[found])
+        return np.where(found, ranks[np.maximum(slot, 0)], -1)
+
+
+def interpolation_search(arr, target):
+    """
+    Searches a sorted list of numbers by guessing the target's position
+    from its value. Uniform keys are found in O(log log n) probes; after
+    that many probes the rest of the range is bisected, so skewed keys
+    still take O(log n) steps.
+    
+    Args:
+        arr: Sorted list of numbers
+        target: Number to search for
+    
+    Returns:
+        Index of target if found, -1 otherwise
+    """
+    lo, hi = 0, len(arr) - 1
+    probes = 2 * len(arr).bit_length().bit_length()
+    while lo <= hi and arr[lo] <= target <= arr[hi]:
+        if arr[hi] == arr[lo]:
+            return lo
+        if not probes:
+            i = bisect_left(arr, target, lo, hi + 1)
+            return i if arr[i] == target else -1
+        probes -= 1
+        probe = lo + int((target - arr[lo]) * (hi - lo) / (arr[hi] - arr[lo]))
+        if arr[probe] == target:
+            return probe
+        if arr[probe] < target:
+            lo = probe + 1
+        else:
+            hi = probe - 1
+    return -1
+
+
+def _compact(keys):
+    """Stores int or float keys in a typed array; other keys stay in the list."""
+    types = set(map(type, keys))
+    try:
+        if types == {int}:
+            return array('q', keys)
+        if types == {float}:
+            return array('d', keys)
+    except OverflowError:
+        pass
+    return keys
+
+
+def _numeric_queries(keys, targets):
+    """Returns targets as a NumPy array if both they and the keys are numeric, else None."""
+    if np is None or not isinstance(keys, array) or not len(keys):
+        return None
+    queries = np.asarray(targets)
+    return queries if queries.ndim == 1 and queries.dtype.kind in 'iuf' else None
+
+
+def _batch(find, targets):
+    """Runs find over targets, returning a NumPy array when installed and an array('q') otherwise."""
+    positions = array('q', map(find, targets))
+    return positions if np is None else np.frombuffer(positions, dtype=np.int64)
+
+
+if __name__ == "__main__":
+    # Test the indexes against bisect on keys with duplicates
+    import random
+    
+    keys = sorted(random.randint(0, 500) for _ in range(1000))
+    targets = [random.randint(-10, 510) for _ in range(200)]
+    expected = [bisect_left(keys, t) if t in keys else -1 for t in targets]
+    for index in (EytzingerIndex(keys), BTreeIndex(keys)):
+        name = type(index).__name__
+        print(f"{name}: find matches bisect: {[index.find(t) for t in targets] == expected}, "
+              f"find_many matches: {list(index.find_many(targets)) == expected}")
+    
+    uniform = sorted(random.sample(range(10 ** 6), 10 ** 4))
+    target = uniform[1234]
+    print(f"Interpolation search for {target}: index {interpolation_search(uniform, target)}")
@@ -0,0 +1,222 @@
+"""
+Shortest-Path Tree Cache
+Memoizes Dijkstra shortest-path trees per source so repeated queries from
+hot sources skip the search entirely. Entries are keyed on a graph version
+counter; edge mutations made through the cache bump the version and evict
+only the trees the change can affect.
+"""
+
+import sys
+from collections import OrderedDict
+
+from dijkstra import dijkstra_search
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ShortestPathCache:
+    """
+    LRU cache of shortest-path trees over a dictionary graph.
+    
+    Attributes:
+        graph: Dictionary where graph[u] = [(v, weight), ...]
+        version: Counter bumped on every mutation
+        max_bytes: Approximate memory budget for cached trees, counting
+            their dictionaries and distance values
+        hits: Number of queries answered from the cache
+        misses: Number of queries that ran a search
+    """
+    
+    def __init__(self, graph, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            graph: Dictionary where graph[u] = [(v, weight), ...]
+            max_bytes: Approximate memory budget for cached trees, counting
+                their dictionaries and distance values
+        """
+        self.graph = graph
+        self.version = 0
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._trees = OrderedDict()  # (source, version) -> (distances, previous, size)
+        self._bytes = 0
+    
+    def dijkstra(self, start):
+        """
+        Cached equivalent of dijkstra.dijkstra.
+        
+        Args:
+            start: Starting vertex
+        
+        Returns:
+            Dictionary of shortest distances from start to each vertex
+        """
+        settled, _ = self._tree(start)
+        distances = {vertex: float('infinity') for vertex in self.graph}
+        distances.update(settled)
+        return distances
+    
+    def dijkstra_with_path(self, start, end):
+        """
+        Cached equivalent of dijkstra.dijkstra_with_path, answered from the
+        full tree rooted at start.
+        
+        Args:
+            start: Starting vertex
+            end: Ending vertex
+        
+        Returns:
+            Tuple of (shortest_distance, path), with (infinity, None) if end
+            is unreachable
+        """
+        distances, previous = self._tree(start)
+        if end not in distances:
+            return float('infinity'), None
+        
+        path = []
+        vertex = end
+        while vertex is not None:
+            path.append(vertex)
+            vertex = previous[vertex]
+        path.reverse()
+        
+        return distances[end], path
+    
+    def add_edge(self, u, v, weight):
+        """
+        Adds the edge u -> v.
+        Evicts trees in which the new edge shortens the distance to v.
+        
+        Args:
+            u: Edge source
+            v: Edge target
+            weight: Edge weight
+        """
+        self.graph.setdefault(u, []).append((v, weight))
+        self._apply(lambda distances, previous: _improves(distances, u, v, weight))
+    
+    def update_edge(self, u, v, weight):
+        """
+        Changes the weight of every u -> v edge.
+        Evicts trees that used the edge (if any weight grew) or that the
+        edge now shortens (if any weight shrank).
+        
+        Args:
+            u: Edge source
+            v: Edge target
+            weight: New edge weight
+        
+        Raises:
+            KeyError: If the graph has no u -> v edge
+        """
+        edges = self.graph.get(u, [])
+        old_weights = [w for target, w in edges if target == v]
+        if not old_weights:
+            raise KeyError(f"No edge {u!r} -> {v!r}")
+        
+        self.graph[u] = [(target, weight if target == v else w) for target, w in edges]
+        grew = any(w < weight for w in old_weights)
+        shrank = any(w > weight for w in old_weights)
+        self._apply(lambda distances, previous: (
+            (grew and previous.get(v) == u) or (shrank and _improves(distances, u, v, weight))
+        ))
+    
+    def remove_edge(self, u, v):
+        """
+        Removes every u -> v edge.
+        Evicts trees whose shortest path to v ran through the edge.
+        
+        Args:
+            u: Edge source
+            v: Edge target
+        
+        Raises:
+            KeyError: If the graph has no u -> v edge
+        """
+        edges = self.graph.get(u, [])
+        remaining = [(target, w) for target, w in edges if target != v]
+        if len(remaining) == len(edges):
+            raise KeyError(f"No edge {u!r} -> {v!r}")
+        
+        self.graph[u] = remaining
+        self._apply(lambda distances, previous: previous.get(v) == u)
+    
+    def invalidate(self):
+        """Bumps the version and drops every cached tree, e.g. after mutating graph directly."""
+        self.version += 1
+        self._trees.clear()
+        self._bytes = 0
+    
+    def __len__(self):
+        return len(self._trees)
+    
+    def _tree(self, source):
+        """Returns the cached (distances, previous) tree for source, computing it on a miss."""
+        key = (source, self.version)
+        entry = self._trees.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._trees.move_to_end(key)
+            return entry[0], entry[1]
+        
+        self.misses += 1
+        distances, previous = dijkstra_search(self.graph, [source])
+        # Both hash tables plus the distance objects the search created; the
+        # vertex keys and predecessors are shared with the graph
+        size = sys.getsizeof(distances) + sys.getsizeof(previous)
+        size += sum(map(sys.getsizeof, distances.values()))
+        self._trees[key] = (distances, previous, size)
+        self._bytes += size
+        
+        # Evict least recently used trees, always keeping the newest one
+        while self._bytes > self.max_bytes and len(self._trees) > 1:
+            _, (_, _, evicted) = self._trees.popitem(last=False)
+            self._bytes -= evicted
+        
+        return distances, previous
+    
+    def _apply(self, affected):
+        """
+        Bumps the version after a mutation and carries unaffected trees over.
+        
+        Args:
+            affected: Function (distances, previous) -> True if the tree
+                may no longer be correct
+        """
+        self.version += 1
+        trees = OrderedDict()
+        for (source, _), (distances, previous, size) in self._trees.items():
+            if affected(distances, previous):
+                self._bytes -= size
+            else:
+                trees[(source, self.version)] = (distances, previous, size)
+        self._trees = trees
+
+
+def _improves(distances, u, v, weight):
+    """Checks whether an edge u -> v of this weight shortens a tree's distance to v."""
+    return u in distances and distances[u] + weight < distances.get(v, float('infinity'))
+
+
+if __name__ == "__main__":
+    # Test the shortest-path cache
+    graph = {
+        'A': [('B', 4), ('C', 2)],
+        'B': [('A', 4), ('C', 1), ('D', 5)],
+        'C': [('A', 2), ('B', 1), ('D', 8), ('E', 10)],
+        'D': [('B', 5), ('C', 8), ('E', 2)],
+        'E': [('C', 10), ('D', 2)]
+    }
+    
+    cache = ShortestPathCache(graph)
+    print("Shortest path A -> E:", cache.dijkstra_with_path('A', 'E'))
+    print("Shortest path A -> D:", cache.dijkstra_with_path('A', 'D'))
+    print(f"Hits: {cache.hits}, misses: {cache.misses}")
+    
+    cache.dijkstra_with_path('E', 'A')
+    cache.update_edge('C', 'E', 1)
+    print("\nAfter lowering C -> E to 1:")
+    print(f"  Cached trees: {len(cache)} (tree from 'A' evicted, tree from 'E' kept)")
+    print("  Shortest path A -> E:", cache.dijkstra_with_path('A', 'E'))
+    print(f"  Hits: {cache.hits}, misses: {cache.misses}")
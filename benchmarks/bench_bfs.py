@@ -0,0 +1,124 @@
+"""
+Benchmark: level-synchronous BFS vs the deque loop
+Runs each BFS variant on a synthetic power-law (Barabasi-Albert) graph,
+and compares repeated single-source BFS with multi-source BFS.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+import bfs as bfs_module
+from bfs import bfs, bfs_level_synchronous, multi_source_bfs
+from graph_csr import CSRGraph
+
+VERTICES = 200_000
+EDGES_PER_VERTEX = 4
+SOURCES = 64
+
+
+def power_law_graph(n, m, seed=0):
+    """
+    Generates an undirected Barabasi-Albert graph by preferential attachment.
+    
+    Args:
+        n: Number of vertices
+        m: Edges added per new vertex
+        seed: Random seed
+    
+    Returns:
+        Dictionary adjacency list with both directions of every edge
+    """
+    rng = random.Random(seed)
+    graph = {v: [] for v in range(n)}
+    
+    # Each vertex appears once per incident edge, so sampling is degree-biased
+    endpoints = list(range(m))
+    for v in range(m, n):
+        chosen = {rng.choice(endpoints) for _ in range(m)}
+        for u in chosen:
+            graph[v].append(u)
+            graph[u].append(v)
+            endpoints.append(u)
+            endpoints.append(v)
+    
+    return graph
+
+
+def best_time(func, repeat=3):
+    """Returns the best wall-clock time of repeat calls to func."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(n=VERTICES, m=EDGES_PER_VERTEX):
+    """
+    Prints timings for each BFS variant from a high-degree source.
+    
+    Args:
+        n: Number of vertices
+        m: Edges added per new vertex
+    """
+    graph = power_law_graph(n, m)
+    csr = CSRGraph.from_dict(graph)
+    reverse = csr  # The graph is undirected, so it is its own transpose
+    print(f"Power-law graph: {csr.num_vertices} vertices, {csr.num_edges} directed edges")
+    if bfs_module.np is None:
+        print("NumPy not installed: level-synchronous timings use the pure-Python fallback")
+    
+    baseline = best_time(lambda: bfs(graph, 0))
+    rows = [
+        ("deque loop (dict)", baseline),
+        ("deque loop (CSR)", best_time(lambda: bfs(csr, 0))),
+        ("level-synchronous, top-down", best_time(
+            lambda: bfs_level_synchronous(csr, 0, direction_optimizing=False))),
+        ("level-synchronous, direction-optimizing", best_time(
+            lambda: bfs_level_synchronous(csr, 0, reverse_graph=reverse))),
+    ]
+    
+    print(f"\n{'variant':<42} {'time (ms)':>10} {'speedup':>9}")
+    for name, seconds in rows:
+        print(f"{name:<42} {seconds * 1e3:10.1f} {baseline / seconds:8.1f}x")
+    
+    run_multi_source(csr)
+
+
+def run_multi_source(csr, sources=SOURCES, max_depth=3, seed=0):
+    """
+    Prints timings for hop distances from many sources, with and without a depth cutoff.
+    
+    Args:
+        csr: CSRGraph to search
+        sources: Number of random sources
+        max_depth: Hop limit for the cutoff runs
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    source_list = [rng.randrange(csr.num_vertices) for _ in range(sources)]
+    
+    def repeated():
+        return [bfs_level_synchronous(csr, s, direction_optimizing=False)[0] for s in source_list]
+    
+    baseline = best_time(repeated, repeat=1)
+    rows = [("repeated level-synchronous BFS", baseline)]
+    expected = repeated()
+    result = multi_source_bfs(csr, source_list)
+    assert all(list(row) == list(d) for row, d in zip(result, expected))
+    rows.append(("multi-source BFS", best_time(lambda: multi_source_bfs(csr, source_list), repeat=1)))
+    rows.append((f"multi-source BFS, max depth {max_depth}", best_time(
+        lambda: multi_source_bfs(csr, source_list, max_depth=max_depth), repeat=1)))
+    
+    print(f"\n{f'{sources} sources':<42} {'time (ms)':>10} {'speedup':>9}")
+    for name, seconds in rows:
+        print(f"{name:<42} {seconds * 1e3:10.1f} {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else VERTICES)
@@ -0,0 +1,75 @@
+"""
+Benchmark: batched binary search
+Compares calling binary_search once per target with binary_search_many,
+which sorts the targets and sweeps them in one pass (or hands numeric
+data to NumPy's searchsorted).
+"""
+
+import os
+import random
+import sys
+import time
+from bisect import bisect_left
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the vectorized row is skipped
+    np = None
+
+from binary_search import binary_search, binary_search_many
+
+SIZE = 1_000_000
+TARGETS = 100_000
+
+
+def timed(func):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(n=SIZE, m=TARGETS, seed=0):
+    """
+    Prints batch search times against a per-target loop.
+    
+    Args:
+        n: Number of sorted elements
+        m: Number of targets
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    arr = sorted(rng.randrange(2 * n) for _ in range(n))
+    targets = [rng.randrange(2 * n) for _ in range(m)]
+    # String keys never reach NumPy, so they time the pure-Python sweep
+    text = [f"{x:09d}" for x in arr]
+    text_targets = [f"{x:09d}" for x in targets]
+    print(f"{n} sorted elements, {m} targets")
+    
+    expected, baseline = timed(lambda: [binary_search(arr, t) for t in targets])
+    rows = [("binary_search per target", baseline)]
+    _, seconds = timed(lambda: [bisect_left(arr, t) for t in targets])
+    rows.append(("bisect_left per target", seconds))
+    found, seconds = timed(lambda: binary_search_many(text, text_targets))
+    rows.append(("binary_search_many, str sweep", seconds))
+    numeric, seconds = timed(lambda: binary_search_many(arr, targets))
+    rows.append(("binary_search_many, int list", seconds))
+    if np is not None:
+        array, queries = np.array(arr), np.array(targets)
+        _, seconds = timed(lambda: binary_search_many(array, queries))
+        rows.append(("binary_search_many, ndarray", seconds))
+    
+    # binary_search may land on any duplicate, binary_search_many on the first
+    for i, t in zip(expected, found):
+        assert (i == -1) == (t == -1)
+    assert list(found) == list(numeric)
+    
+    print(f"\n{'search':<32} {'time (s)':>9} {'speedup':>9}")
+    for name, seconds in rows:
+        print(f"{name:<32} {seconds:9.3f} {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,86 @@
+"""
+Benchmark: Dijkstra heap strategies and query modes
+Compares the lazy-deletion heapq engine with the indexed decrease-key heap
+on a road-network-like grid graph, for full trees and early-exit queries.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from dijkstra import dijkstra_search
+from graph_csr import CSRGraph
+
+GRID_SIZE = 300
+QUERIES = 20
+
+
+def grid_graph(size, seed=0, min_weight=1):
+    """
+    Generates a bidirectional grid with random travel times, a rough road-network proxy.
+    
+    Args:
+        size: Grid side length (size * size vertices)
+        seed: Random seed
+        min_weight: Smallest travel time between adjacent cells
+    
+    Returns:
+        Dictionary where graph[u] = [(v, weight), ...] with (row, col) vertices
+    """
+    rng = random.Random(seed)
+    graph = {(r, c): [] for r in range(size) for c in range(size)}
+    
+    for r in range(size):
+        for c in range(size):
+            for nr, nc in ((r + 1, c), (r, c + 1)):
+                if nr < size and nc < size:
+                    weight = rng.randint(min_weight, 100)
+                    graph[(r, c)].append(((nr, nc), weight))
+                    graph[(nr, nc)].append(((r, c), weight))
+    
+    return graph
+
+
+def time_queries(queries, **options):
+    """Returns the average seconds per dijkstra_search call over queries."""
+    start = time.perf_counter()
+    for graph, sources, targets in queries:
+        dijkstra_search(graph, sources, targets=targets, **options)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def run(size=GRID_SIZE, queries=QUERIES, seed=0):
+    """
+    Prints per-query timings for each heap and query mode.
+    
+    Args:
+        size: Grid side length
+        queries: Number of random source/target pairs
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    graph = grid_graph(size, seed)
+    csr = CSRGraph.from_dict(graph)
+    vertices = list(graph)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+    print(f"Grid graph: {csr.num_vertices} vertices, {csr.num_edges} directed edges")
+    
+    print(f"\n{'query':<28} {'graph':<6} {'lazy (ms)':>10} {'indexed (ms)':>13}")
+    for name, graph_form in (("dict", graph), ("CSR", csr)):
+        full = [(graph_form, [s], None) for s, _ in pairs]
+        point = [(graph_form, [s], [t]) for s, t in pairs]
+        for label, workload, options in (
+            ("full tree", full, {}),
+            ("point-to-point", point, {}),
+            ("radius 1000", full, {'radius': 1000}),
+        ):
+            lazy = time_queries(workload, heap='lazy', **options)
+            indexed = time_queries(workload, heap='indexed', **options)
+            print(f"{label:<28} {name:<6} {lazy * 1e3:10.1f} {indexed * 1e3:13.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE)
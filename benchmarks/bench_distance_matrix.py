@@ -0,0 +1,82 @@
+"""
+Benchmark: many-to-many distance matrices
+Compares a Python loop over dijkstra with distance_matrix in-process and
+across a process pool on a grid graph, and Dijkstra with Floyd-Warshall on
+a small dense graph.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from bench_dijkstra import grid_graph
+from dijkstra import dijkstra
+from distance_matrix import distance_matrix, np
+from graph_csr import CSRGraph
+
+GRID_SIZE = 100
+SOURCES = 200
+TARGETS = 200
+DENSE_VERTICES = 300
+
+
+def dense_graph(n, density=0.2, seed=0):
+    """Generates a random directed graph with about density * n^2 weighted edges."""
+    rng = random.Random(seed)
+    return {
+        u: [(v, rng.randint(1, 100)) for v in range(n) if v != u and rng.random() < density]
+        for u in range(n)
+    }
+
+
+def timed(func, *args, **kwargs):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(size=GRID_SIZE, sources=SOURCES, targets=TARGETS, seed=0):
+    """
+    Prints distance matrix timings.
+    
+    Args:
+        size: Grid side length
+        sources: Number of random source vertices
+        targets: Number of random target vertices
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    graph = grid_graph(size, seed)
+    csr = CSRGraph.from_dict(graph)
+    vertices = list(graph)
+    source_list = [rng.choice(vertices) for _ in range(sources)]
+    target_list = [rng.choice(vertices) for _ in range(targets)]
+    workers = os.cpu_count() or 1
+    print(f"Grid graph: {csr.num_vertices} vertices, {sources} x {targets} matrix")
+    
+    baseline, loop_time = timed(lambda: [[row[t] for t in target_list] for row in (dijkstra(graph, s) for s in source_list)])
+    print(f"\n{'dijkstra loop':<28} {loop_time:8.2f}s")
+    for label, count in (("distance_matrix, 1 worker", 1), (f"distance_matrix, pool of {workers}", workers)):
+        matrix, elapsed = timed(distance_matrix, csr, source_list, target_list, workers=count, method='dijkstra')
+        assert [[float(d) for d in row] for row in matrix] == baseline
+        print(f"{label:<28} {elapsed:8.2f}s {loop_time / elapsed:6.1f}x")
+    
+    if np is None:
+        print("\nNumPy not installed; skipping Floyd-Warshall comparison")
+        return
+    
+    dense = CSRGraph.from_dict(dense_graph(DENSE_VERTICES, seed=seed))
+    print(f"\nDense graph: {dense.num_vertices} vertices, {dense.num_edges} edges, all pairs")
+    expected, dijkstra_time = timed(distance_matrix, dense, method='dijkstra')
+    result, floyd_time = timed(distance_matrix, dense, method='floyd_warshall')
+    assert np.array_equal(result, expected)
+    print(f"{'dijkstra':<28} {dijkstra_time:8.2f}s")
+    print(f"{'floyd_warshall':<28} {floyd_time:8.2f}s {dijkstra_time / floyd_time:6.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE)
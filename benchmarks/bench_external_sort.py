@@ -0,0 +1,71 @@
+"""
+Benchmark: external merge sort
+Sorts a file of random text lines in memory with the builtin sort and with
+external_sort under a memory limit well below the file size, in-process
+and with a pool of workers sorting the runs.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from external_sort import external_sort
+
+LINES = 1_000_000
+MEMORY_LIMIT = 1 << 22
+
+
+def sort_in_memory(input_path, output_path):
+    """Baseline: reads the whole file, sorts its lines and writes them back."""
+    with open(input_path) as f:
+        lines = f.read().split('\n')[:-1]
+    lines.sort()
+    with open(output_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def timed(func):
+    """Returns seconds for one call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(n=LINES, memory_limit=MEMORY_LIMIT, seed=0):
+    """
+    Prints sort times for the baseline and external_sort configurations.
+    
+    Args:
+        n: Number of lines
+        memory_limit: Memory budget passed to external_sort
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'lines.txt')
+        with open(source, 'w') as f:
+            f.writelines(f"{rng.getrandbits(64):x} record {i}\n" for i in range(n))
+        size = os.path.getsize(source)
+        print(f"{n} lines, {size / 1e6:.1f} MB, memory limit {memory_limit / 1e6:.1f} MB")
+        
+        expected_path = os.path.join(tmp, 'expected.txt')
+        baseline = timed(lambda: sort_in_memory(source, expected_path))
+        with open(expected_path, 'rb') as f:
+            expected = f.read()
+        
+        print(f"\n{'sort':<32} {'time (s)':>9}")
+        print(f"{'in memory (builtin sort)':<32} {baseline:9.2f}")
+        for workers in (1, 2, 4):
+            target = os.path.join(tmp, f"sorted{workers}.txt")
+            seconds = timed(lambda: external_sort(source, target, memory_limit=memory_limit, workers=workers))
+            with open(target, 'rb') as f:
+                assert f.read() == expected
+            print(f"{f'external_sort, {workers} worker(s)':<32} {seconds:9.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else LINES)
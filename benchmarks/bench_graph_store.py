@@ -0,0 +1,74 @@
+"""
+Benchmark: memory-mapped graph store and vertex reordering
+Saves a grid graph with scrambled vertex ids as-is and in BFS and RCM
+order, reopens each copy memory-mapped, and times traversals over it.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from bench_dijkstra import grid_graph
+from bfs import bfs
+from dfs import dfs_iterative
+from dijkstra import dijkstra
+from graph_csr import CSRGraph
+from graph_loader import load_csr, save_csr
+from graph_ordering import edge_span
+
+GRID_SIZE = 300
+
+
+def timed(func):
+    """Returns seconds for one call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(size=GRID_SIZE, seed=0):
+    """
+    Prints locality statistics and traversal times per vertex order.
+    
+    Args:
+        size: Grid side length
+        seed: Random seed
+    """
+    # Insert vertices in random order so ids carry no locality
+    grid = grid_graph(size, seed)
+    vertices = list(grid)
+    random.Random(seed).shuffle(vertices)
+    csr = CSRGraph.from_dict({vertex: grid[vertex] for vertex in vertices})
+    source = (0, 0)
+    print(f"Grid graph: {csr.num_vertices} vertices, {csr.num_edges} directed edges, scrambled ids")
+    
+    print(f"\n{'order':<10} {'bandwidth':>10} {'mean span':>10} {'open (ms)':>10} "
+          f"{'bfs (s)':>8} {'dfs (s)':>8} {'dijkstra (s)':>13}")
+    expected = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for reorder in (None, 'bfs', 'rcm'):
+            path = os.path.join(tmp, str(reorder))
+            save_csr(csr, path, reorder=reorder)
+            
+            start = time.perf_counter()
+            graph = load_csr(path)
+            open_time = time.perf_counter() - start
+            
+            bandwidth, mean_span = edge_span(graph)
+            distances = dijkstra(graph, source)
+            if expected is None:
+                expected = distances
+            assert distances == expected
+            
+            print(f"{str(reorder):<10} {bandwidth:>10} {mean_span:>10.0f} {open_time * 1e3:>10.1f} "
+                  f"{timed(lambda: bfs(graph, source)):>8.2f} "
+                  f"{timed(lambda: dfs_iterative(graph, source)):>8.2f} "
+                  f"{timed(lambda: dijkstra(graph, source)):>13.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE)
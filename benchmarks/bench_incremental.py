@@ -0,0 +1,82 @@
+"""
+Benchmark: incremental shortest-path repair
+Times repair_shortest_paths against a full dijkstra_search recompute after
+random batches of edge weight changes on a grid graph, and checks that both
+give the same distances.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from bench_dijkstra import grid_graph
+from dijkstra import dijkstra_search
+from dynamic_dijkstra import repair_shortest_paths
+
+GRID_SIZE = 200
+BATCHES = 20
+BATCH_SIZES = (1, 10, 100)
+
+
+def change_weights(graph, rng, count):
+    """
+    Reweights count random undirected grid edges, in both directions.
+    
+    Returns:
+        List of changed (u, v) pairs
+    """
+    vertices = list(graph)
+    changed = []
+    for _ in range(count):
+        u = rng.choice(vertices)
+        v, _ = rng.choice(graph[u])
+        weight = rng.randint(1, 100)
+        graph[u] = [(target, weight if target == v else w) for target, w in graph[u]]
+        graph[v] = [(target, weight if target == u else w) for target, w in graph[v]]
+        changed.extend([(u, v), (v, u)])
+    return changed
+
+
+def run(size=GRID_SIZE, batches=BATCHES, seed=0):
+    """
+    Prints average repair and recompute times per batch size.
+    
+    Args:
+        size: Grid side length
+        batches: Number of update batches per batch size
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    graph = grid_graph(size, seed)
+    source = (size // 2, size // 2)
+    distances, previous = dijkstra_search(graph, [source])
+    print(f"Grid graph: {len(graph)} vertices, source {source}")
+    
+    print(f"\n{'edges/batch':>11} {'repair (ms)':>12} {'recompute (ms)':>15} {'changed':>9} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        repair_time = recompute_time = 0.0
+        changed_total = 0
+        for _ in range(batches):
+            changed_edges = change_weights(graph, rng, batch_size)
+            
+            start = time.perf_counter()
+            # Grid edges change in both directions, so graph is its own reverse
+            changed = repair_shortest_paths(graph, distances, previous, changed_edges, graph)
+            repair_time += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            expected, _ = dijkstra_search(graph, [source])
+            recompute_time += time.perf_counter() - start
+            
+            assert distances == expected, "repair disagrees with full recompute"
+            changed_total += len(changed)
+        
+        print(f"{batch_size:>11} {repair_time / batches * 1e3:12.2f} {recompute_time / batches * 1e3:15.2f} "
+              f"{changed_total / batches:9.0f} {recompute_time / repair_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE)
@@ -0,0 +1,95 @@
+"""
+Benchmark: linear search scan paths
+Compares an index loop over range(len(arr)) with the C-level index scan
+of linear_search and linear_search_all, the lazy linear_search_iter, the
+chunked multi-process scan and, when NumPy is installed, the vectorized
+mask on an ndarray. linear_search looks for a missing target; the
+all-matches searches look for a rare target (one match in 10^4) and a
+common one (one in 10).
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the vectorized row is skipped
+    np = None
+
+from linear_search import linear_search, linear_search_all, linear_search_iter
+
+SIZE = 2_000_000
+WORKERS = 2
+
+
+def timed(func):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def range_loop_first(arr, target):
+    """The index loop linear_search used before its fast paths."""
+    for i in range(len(arr)):
+        if arr[i] == target:
+            return i
+    return -1
+
+
+def range_loop_all(arr, target):
+    """The index loop linear_search_all used before its fast paths."""
+    indices = []
+    for i in range(len(arr)):
+        if arr[i] == target:
+            indices.append(i)
+    return indices
+
+
+def run(n=SIZE, workers=WORKERS, seed=0):
+    """
+    Prints scan times for a rare and a common target.
+    
+    Args:
+        n: Number of elements
+        workers: Worker processes for the parallel scan
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    print(f"{n} elements, {workers} workers for the parallel scan")
+    
+    # A missing target makes the first-match search scan everything
+    arr = [rng.randrange(n) for _ in range(n)]
+    _, baseline = timed(lambda: range_loop_first(arr, -1))
+    _, seconds = timed(lambda: linear_search(arr, -1))
+    print(f"\n{'missing target':<30} {'time (s)':>9} {'speedup':>9}")
+    print(f"{'range(len(arr)) loop':<30} {baseline:9.3f} {1:8.1f}x")
+    print(f"{'linear_search':<30} {seconds:9.3f} {baseline / seconds:8.1f}x")
+    for label, spread in (("rare target", 10_000), ("common target", 10)):
+        arr = [rng.randrange(spread) for _ in range(n)]
+        target = arr[-1]
+        expected, baseline = timed(lambda: range_loop_all(arr, target))
+        
+        searches = [
+            ("linear_search_all", lambda: linear_search_all(arr, target), expected),
+            ("linear_search_iter", lambda: list(linear_search_iter(iter(arr), target)), expected),
+            ("linear_search_all, parallel", lambda: linear_search_all(arr, target, workers=workers), expected),
+        ]
+        if np is not None:
+            values = np.array(arr)
+            searches.append(("linear_search_all, ndarray", lambda: linear_search_all(values, target), expected))
+        
+        print(f"\n{label:<30} {'time (s)':>9} {'speedup':>9}")
+        print(f"{'range(len(arr)) loop':<30} {baseline:9.3f} {1:8.1f}x")
+        for name, func, result in searches:
+            found, seconds = timed(func)
+            assert found == result, name
+            print(f"{name:<30} {seconds:9.3f} {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
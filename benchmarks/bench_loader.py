@@ -0,0 +1,86 @@
+"""
+Benchmark: streaming edge-list loading
+Compares building a dictionary adjacency list line by line with
+load_edge_list, with load_binary_edges, and with reopening the
+memory-mapped CSR cache.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from bfs import bfs
+from graph_loader import load_binary_edges, load_edge_list, write_binary_edges
+
+EDGES = 1_000_000
+VERTICES = 100_000
+
+
+def random_edges(m, n, seed=0):
+    """Generates m random weighted edges over n integer vertices."""
+    rng = random.Random(seed)
+    return [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(m)]
+
+
+def dict_from_file(path):
+    """Baseline: reads a weighted edge list into a dictionary of lists."""
+    graph = {}
+    with open(path) as f:
+        for line in f:
+            u, v, w = line.split()
+            graph.setdefault(int(u), []).append((int(v), int(w)))
+            graph.setdefault(int(v), [])
+    return graph
+
+
+def timed(func):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(m=EDGES, n=VERTICES, seed=0):
+    """
+    Prints load times for each loader.
+    
+    Args:
+        m: Number of edges
+        n: Number of vertices
+        seed: Random seed
+    """
+    edges = random_edges(m, n, seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, 'edges.txt')
+        binary_path = os.path.join(tmp, 'edges.bin')
+        with open(text_path, 'w') as f:
+            f.writelines(f"{u} {v} {w}\n" for u, v, w in edges)
+        write_binary_edges(binary_path, edges, weighted=True)
+        print(f"Edge list: {m} edges, {os.path.getsize(text_path) / 1e6:.1f} MB text")
+        
+        graph, baseline = timed(lambda: dict_from_file(text_path))
+        rows = [("dictionary of lists", baseline)]
+        csr, seconds = timed(lambda: load_edge_list(text_path, label_type=int))
+        rows.append(("load_edge_list", seconds))
+        _, seconds = timed(lambda: load_edge_list(text_path, label_type=int, cache=True))
+        rows.append(("load_edge_list, writing cache", seconds))
+        cached, seconds = timed(lambda: load_edge_list(text_path, label_type=int, cache=True))
+        rows.append(("load_edge_list, cache hit", seconds))
+        _, seconds = timed(lambda: load_binary_edges(binary_path, weighted=True))
+        rows.append(("load_binary_edges", seconds))
+        
+        source = edges[0][0]
+        assert bfs(csr, source) == bfs(cached, source)
+        assert set(bfs(csr, source)) == set(bfs({u: [v for v, _ in e] for u, e in graph.items()}, source))
+        
+        print(f"\n{'loader':<32} {'time (s)':>9} {'speedup':>9}")
+        for name, seconds in rows:
+            print(f"{name:<32} {seconds:9.3f} {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else EDGES)
@@ -0,0 +1,97 @@
+"""
+Benchmark: NumPy backend crossover sizes
+Times the pure-Python code against the default dispatch, which hands
+numeric data to NumPy, over growing input sizes. The sorts take lists, so
+the speedup column shows where converting a list starts to pay off; the
+searches take NumPy arrays, which are only ever searched, never converted.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it there is nothing to compare
+    np = None
+
+from binary_search import binary_search, binary_search_recursive
+from bubble_sort import bubble_sort
+from linear_search import linear_search_all
+from merge_sort import merge_sort
+from numpy_backend import SEARCH_MIN_SIZE, SORT_MIN_SIZE
+from quick_sort import quick_sort
+
+SIZES = (8, 32, 128, 512, 2048, 8192, 32768)
+BUBBLE_MAX_SIZE = 2048
+
+
+def best_time(func, make_input, min_seconds=0.05):
+    """Returns the best per-call time of func on fresh inputs over at least min_seconds."""
+    best = None
+    total = 0.0
+    while total < min_seconds:
+        arr = make_input()
+        start = time.perf_counter()
+        func(arr)
+        seconds = time.perf_counter() - start
+        total += seconds
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def cases(data, array, sorted_array, target):
+    """Returns (name, pure-Python call, dispatched call, input factory) per operation."""
+    return [
+        ("bubble_sort", lambda arr: bubble_sort(arr, engine='bubble'), bubble_sort, lambda: list(data)),
+        ("quick_sort", lambda arr: quick_sort(arr, engine='quick'), quick_sort, lambda: list(data)),
+        ("merge_sort", lambda arr: merge_sort(arr, engine='merge'), merge_sort, lambda: list(data)),
+        ("merge_sort key=", lambda arr: merge_sort(arr, engine='merge', key=abs),
+         lambda arr: merge_sort(arr, key=abs), lambda: list(data)),
+        # The recursive search has no dispatch, so it shows the Python loop over the array
+        ("binary_search", lambda arr: binary_search_recursive(arr, target, 0, len(arr) - 1),
+         lambda arr: binary_search(arr, target), lambda: sorted_array),
+        ("linear_search_all", lambda arr: [i for i, x in enumerate(arr) if x == target],
+         lambda arr: linear_search_all(arr, target), lambda: array),
+    ]
+
+
+def run(sizes=SIZES, seed=0):
+    """
+    Prints pure-Python and dispatched times per operation and size.
+    
+    Args:
+        sizes: Input sizes to time
+        seed: Random seed
+    """
+    if np is None:
+        print("NumPy is not installed; every call already takes the pure-Python path")
+        return
+    
+    rng = random.Random(seed)
+    print(f"Thresholds: SORT_MIN_SIZE={SORT_MIN_SIZE}, SEARCH_MIN_SIZE={SEARCH_MIN_SIZE}")
+    print(f"\n{'operation':<18} {'n':>6} {'python (us)':>12} {'auto (us)':>10} {'speedup':>8}")
+    for n in sizes:
+        data = [rng.randrange(-n, n) for _ in range(n)]
+        array = np.array(data)
+        sorted_array = np.sort(array)
+        target = data[n // 2]
+        for name, pure, dispatched, make_input in cases(data, array, sorted_array, target):
+            if name == "bubble_sort" and n > BUBBLE_MAX_SIZE:
+                continue
+            if name == "binary_search":
+                # Either index of a duplicate target is a valid answer
+                assert sorted_array[pure(sorted_array)] == sorted_array[dispatched(sorted_array)]
+            else:
+                assert pure(make_input()) == dispatched(make_input())
+            python_time = best_time(pure, make_input)
+            auto_time = best_time(dispatched, make_input)
+            print(f"{name:<18} {n:>6} {python_time * 1e6:>12.1f} {auto_time * 1e6:>10.1f} "
+                  f"{python_time / auto_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,75 @@
+"""
+Benchmark: parallel sample sort scaling
+Times sample_sort with 1 to N workers on a list of integers and, when
+NumPy is installed, on a float64 array in shared memory. Pass the number
+of elements (e.g. 100000000) and the largest worker count as arguments.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the list benchmark runs
+    np = None
+
+from parallel_sort import sample_sort
+
+SIZE = 1_000_000
+
+
+def timed(func):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def worker_counts(max_workers):
+    """Returns 1, 2, 4, ... up to max_workers, always ending with max_workers."""
+    counts = [1]
+    while counts[-1] * 2 < max_workers:
+        counts.append(counts[-1] * 2)
+    if max_workers > 1:
+        counts.append(max_workers)
+    return counts
+
+
+def run(n=SIZE, max_workers=None, seed=0):
+    """
+    Prints sort times and speedups over one worker per input type.
+    
+    Args:
+        n: Number of elements
+        max_workers: Largest worker count (defaults to max(4, CPU count))
+        seed: Random seed
+    """
+    max_workers = max_workers or max(4, os.cpu_count() or 1)
+    rng = random.Random(seed)
+    inputs = [("list of int", [rng.getrandbits(48) for _ in range(n)])]
+    if np is not None:
+        inputs.append(("numpy float64", np.random.default_rng(seed).random(n)))
+    print(f"{n} elements, {os.cpu_count()} CPUs")
+    
+    for name, data in inputs:
+        print(f"\n{name:<14} {'workers':>8} {'time (s)':>9} {'speedup':>8}")
+        expected = None
+        baseline = None
+        for workers in worker_counts(max_workers):
+            result, seconds = timed(lambda: sample_sort(data, workers=workers))
+            if expected is None:
+                expected, baseline = result, seconds
+            if isinstance(result, list):
+                assert result == expected
+            else:
+                assert np.array_equal(result, expected)
+            print(f"{'':<14} {workers:>8} {seconds:9.2f} {baseline / seconds:7.2f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE,
+        int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,81 @@
+"""
+Benchmark: point-to-point shortest path strategies
+Counts settled vertices and times dijkstra_with_path, bidirectional
+Dijkstra and A* (Euclidean and landmark heuristics) on a grid graph.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from astar import astar, build_landmarks, euclidean_heuristic, farthest_landmarks, landmark_heuristic
+from bench_dijkstra import grid_graph
+from dijkstra import bidirectional_dijkstra, dijkstra_with_path
+from graph_csr import transpose
+
+GRID_SIZE = 200
+QUERIES = 50
+LANDMARKS = 8
+
+# Every edge costs at least this much per unit of grid distance
+MIN_WEIGHT = 10
+
+
+class CountingGraph(dict):
+    """Adjacency dictionary that counts neighbor lookups, i.e. settled vertices."""
+    
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.lookups = 0
+    
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super().get(key, default)
+
+
+def run(size=GRID_SIZE, queries=QUERIES, seed=0):
+    """
+    Prints average settled vertices and time per query for each strategy.
+    
+    Args:
+        size: Grid side length
+        queries: Number of random source/target pairs
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    graph = CountingGraph(grid_graph(size, seed, MIN_WEIGHT))
+    vertices = list(graph)
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+    
+    # Vertices are (row, col) cells, so they double as coordinates
+    coordinates = {vertex: vertex for vertex in vertices}
+    # Built once and shared by every query; lookups in it count as settled too
+    reverse = CountingGraph(transpose(graph, weighted=True))
+    tables = build_landmarks(graph, farthest_landmarks(graph, LANDMARKS, vertices[0], reverse), reverse)
+    print(f"Grid graph: {len(vertices)} vertices, {LANDMARKS} landmarks, {queries} queries")
+    
+    strategies = (
+        ("dijkstra_with_path", lambda s, t: dijkstra_with_path(graph, s, t)),
+        ("bidirectional_dijkstra", lambda s, t: bidirectional_dijkstra(graph, s, t, reverse)),
+        ("astar (euclidean)", lambda s, t: astar(graph, s, t, euclidean_heuristic(coordinates, t, MIN_WEIGHT))),
+        ("astar (landmarks)", lambda s, t: astar(graph, s, t, landmark_heuristic(tables, t))),
+    )
+    
+    reference = [dijkstra_with_path(graph, s, t)[0] for s, t in pairs]
+    
+    print(f"\n{'strategy':<24} {'settled/query':>14} {'time (ms)':>10}")
+    for name, query in strategies:
+        graph.lookups = reverse.lookups = 0
+        start = time.perf_counter()
+        for (s, t), expected in zip(pairs, reference):
+            distance, _ = query(s, t)
+            assert distance == expected, f"{name} returned {distance}, expected {expected}"
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24} {(graph.lookups + reverse.lookups) / queries:14.0f} {elapsed / queries * 1e3:10.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GRID_SIZE)
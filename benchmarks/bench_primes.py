@@ -0,0 +1,75 @@
+"""
+Benchmark: Miller-Rabin / Pollard-rho vs trial division
+Times is_prime and prime_factorization against their trial-division
+counterparts on random 32, 48 and 64-bit inputs.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from prime_numbers import (
+    is_prime,
+    is_prime_trial_division,
+    prime_factorization,
+    prime_factorization_trial_division,
+)
+
+SAMPLES = 200
+BIT_WIDTHS = (32, 48, 64)
+
+# Trial division needs ~2^31 steps for a 64-bit prime, so it is skipped there
+TRIAL_DIVISION_MAX_BITS = 48
+
+
+def time_calls(func, values):
+    """
+    Times func over every value.
+    
+    Args:
+        func: Function taking a single integer
+        values: Inputs to call func with
+    
+    Returns:
+        Average seconds per call
+    """
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return (time.perf_counter() - start) / len(values)
+
+
+def run(samples=SAMPLES, seed=0):
+    """
+    Prints a table of per-call timings for each bit width.
+    
+    Args:
+        samples: Random inputs per bit width
+        seed: Seed for the input generator
+    """
+    rng = random.Random(seed)
+    
+    print(f"{'bits':>4}  {'function':<20} {'fast (us)':>12} {'trial (us)':>12} {'speedup':>9}")
+    for bits in BIT_WIDTHS:
+        values = [rng.getrandbits(bits) | (1 << (bits - 1)) for _ in range(samples)]
+        
+        for name, fast, slow in (
+            ('is_prime', is_prime, is_prime_trial_division),
+            ('prime_factorization', prime_factorization, prime_factorization_trial_division),
+        ):
+            fast_time = time_calls(fast, values)
+            if bits <= TRIAL_DIVISION_MAX_BITS:
+                slow_time = time_calls(slow, values)
+                slow_col = f"{slow_time * 1e6:12.1f}"
+                speedup_col = f"{slow_time / fast_time:8.1f}x"
+            else:
+                slow_col = f"{'skipped':>12}"
+                speedup_col = f"{'-':>9}"
+            print(f"{bits:>4}  {name:<20} {fast_time * 1e6:12.1f} {slow_col} {speedup_col}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SAMPLES)
@@ -0,0 +1,82 @@
+"""
+Benchmark: static search indexes
+Compares repeated lookups in the Eytzinger and B-tree layouts of
+search_index, and interpolation search, with the iterative and recursive
+binary_search on the same sorted keys. Pass the number of keys on the
+command line (10^6 by default; 10^7 and 10^8 need several GB of memory).
+"""
+
+import os
+import random
+import sys
+import time
+from bisect import bisect_left
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch rows loop in Python
+    np = None
+
+from binary_search import binary_search, binary_search_many, binary_search_recursive
+from search_index import BTreeIndex, EytzingerIndex, interpolation_search
+
+SIZE = 1_000_000
+TARGETS = 100_000
+
+
+def timed(func):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(n=SIZE, m=TARGETS, seed=0):
+    """
+    Prints per-lookup times for each search against the iterative binary_search.
+    
+    Args:
+        n: Number of sorted keys
+        m: Number of lookups
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    # Distinct keys, so every search that finds a target returns the same index
+    keys = sorted(rng.sample(range(2 * n), n))
+    targets = [rng.randrange(2 * n) for _ in range(m)]
+    print(f"{n} sorted keys, {m} lookups")
+    
+    eytzinger, eytzinger_build = timed(lambda: EytzingerIndex(keys))
+    btree, btree_build = timed(lambda: BTreeIndex(keys))
+    print(f"Build: Eytzinger {eytzinger_build:.2f} s, B-tree {btree_build:.2f} s")
+    
+    expected, baseline = timed(lambda: [binary_search(keys, t) for t in targets])
+    searches = [
+        ("binary_search_recursive", lambda: [binary_search_recursive(keys, t, 0, n - 1) for t in targets]),
+        ("bisect_left", lambda: [i if i < n and keys[i] == t else -1
+                                 for i, t in ((bisect_left(keys, t), t) for t in targets)]),
+        ("EytzingerIndex.find", lambda: [eytzinger.find(t) for t in targets]),
+        ("BTreeIndex.find", lambda: [btree.find(t) for t in targets]),
+        ("interpolation_search", lambda: [interpolation_search(keys, t) for t in targets]),
+        ("EytzingerIndex.find_many", lambda: eytzinger.find_many(targets)),
+        ("BTreeIndex.find_many", lambda: btree.find_many(targets)),
+    ]
+    if np is not None:
+        array, queries = np.array(keys), np.array(targets)
+        searches.append(("binary_search_many, ndarray", lambda: binary_search_many(array, queries)))
+    
+    rows = [("binary_search", baseline)]
+    for name, func in searches:
+        result, seconds = timed(func)
+        assert list(result) == expected, name
+        rows.append((name, seconds))
+    
+    print(f"\n{'search':<30} {'ns/lookup':>10} {'speedup':>9}")
+    for name, seconds in rows:
+        print(f"{name:<30} {seconds / m * 1e9:10.0f} {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,141 @@
+"""
+Benchmark: sorting engines across input patterns
+Times the builtin sort, the introsort engine, the recursive quick_sort and
+merge_sort, and the bottom-up merge_sort engine on random, sorted,
+reversed, many-duplicate and organ-pipe inputs, together with the
+three-way quick_sort_inplace. bubble_sort is O(n^2) and only runs at small
+sizes. A second table compares partial_sort and heapq.nsmallest against a
+full sort for top-k queries.
+"""
+
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+
+from bubble_sort import bubble_sort
+from merge_sort import merge_sort
+from quick_sort import partial_sort, quick_sort, quick_sort_inplace
+
+SIZE = 100_000
+BUBBLE_MAX_SIZE = 2_000
+TOP_K = (10, 1000)
+
+
+def input_patterns(n, seed=0):
+    """
+    Builds the benchmark inputs.
+    
+    Args:
+        n: Number of elements
+        seed: Random seed
+    
+    Returns:
+        Dictionary mapping pattern name to a list of n integers
+    """
+    rng = random.Random(seed)
+    values = [rng.randrange(n) for _ in range(n)]
+    return {
+        'random': values,
+        'sorted': sorted(values),
+        'reversed': sorted(values, reverse=True),
+        'many duplicates': [rng.randrange(10) for _ in range(n)],
+        'organ pipe': list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+    }
+
+
+def best_time(func, data, repeat=3):
+    """
+    Returns the best time of repeat calls to func on fresh copies of data,
+    checking the result, or None if func exceeds the recursion limit.
+    """
+    expected = sorted(data)
+    times = []
+    for _ in range(repeat):
+        arr = list(data)
+        start = time.perf_counter()
+        try:
+            result = func(arr)
+        except RecursionError:
+            return None
+        times.append(time.perf_counter() - start)
+        assert result == expected
+    return min(times)
+
+
+def sort_inplace(arr):
+    """Sorts arr with the three-way in-place quick sort and returns it."""
+    quick_sort_inplace(arr)
+    return arr
+
+
+def top_k_partial_sort(arr, k):
+    """Returns the k smallest elements in order via partial_sort."""
+    partial_sort(arr, k)
+    return arr[:k]
+
+
+def run_top_k(data, ks=TOP_K, repeat=3):
+    """
+    Prints top-k query times for a full sort, heapq.nsmallest and partial_sort.
+    
+    Args:
+        data: List of integers
+        ks: Values of k to time
+        repeat: Calls per measurement (best is reported)
+    """
+    print(f"\n{'top-k':<18}{'sorted()[:k]':>20}{'heapq.nsmallest':>20}{'partial_sort':>20}")
+    for k in ks:
+        expected = sorted(data)[:k]
+        funcs = (
+            lambda arr: sorted(arr)[:k],
+            lambda arr: heapq.nsmallest(k, arr),
+            lambda arr: top_k_partial_sort(arr, k),
+        )
+        times = []
+        for func in funcs:
+            best = None
+            for _ in range(repeat):
+                arr = list(data)
+                start = time.perf_counter()
+                result = func(arr)
+                seconds = time.perf_counter() - start
+                assert result == expected
+                best = seconds if best is None else min(best, seconds)
+            times.append(best)
+        print(f"{f'k={k}':<18}" + "".join(f"{t * 1e3:>20.1f}" for t in times))
+
+
+def run(n=SIZE):
+    """
+    Prints a table of sort times per input pattern, then top-k query times.
+    
+    Args:
+        n: Number of elements
+    """
+    engines = [
+        ("sorted (timsort)", sorted),
+        ("introsort", lambda arr: quick_sort(arr, engine='introsort')),
+        ("quick_sort", lambda arr: quick_sort(arr, engine='quick')),
+        ("quick_sort_inplace", sort_inplace),
+        ("merge_sort", lambda arr: merge_sort(arr, engine='merge')),
+        ("bottom-up merge", lambda arr: merge_sort(arr, engine='bottom_up')),
+    ]
+    if n <= BUBBLE_MAX_SIZE:
+        engines.append(("bubble_sort", lambda arr: bubble_sort(arr, engine='bubble')))
+    
+    print(f"{n} elements, best of 3 (ms)")
+    print(f"\n{'pattern':<18}" + "".join(f"{name:>20}" for name, _ in engines))
+    for pattern, data in input_patterns(n).items():
+        times = [best_time(func, data) for _, func in engines]
+        print(f"{pattern:<18}" + "".join(
+            f"{'too deep':>20}" if t is None else f"{t * 1e3:>20.1f}" for t in times))
+    
+    run_top_k(input_patterns(n)['random'])
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)